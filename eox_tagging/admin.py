@@ -31,6 +31,12 @@ class TagAdmin(admin.ModelAdmin):
 
     form = TagForm
 
+    def get_queryset(self, request):
+        """
+        Prefetch the tagged objects and owners shown in the changelist.
+        """
+        return super().get_queryset(request).prefetch_related("target_object", "owner_object")
+
     def target_as_nice_string(self, tag):
         """
         Render the opaque key proxy as a nice Course Key or any other target as its unicode.
@@ -95,7 +101,7 @@ class TagAdmin(admin.ModelAdmin):
         if should_intervene:
             try:
                 course_key = CourseKey.from_string(request.POST.get('opaque_key'))
-                opaque_key_proxy, _ = OpaqueKeyProxyModel.objects.get_or_create(opaque_key=course_key)
+                opaque_key_proxy, _ = OpaqueKeyProxyModel.objects.get_or_create_by_key(course_key)
             except InvalidKeyError:
                 opaque_key = request.POST['opaque_key']
                 message = f"EOX_TAGGING | Error: Opaque Key {opaque_key} does not match with opaque_keys.edx definition"
@@ -103,7 +109,7 @@ class TagAdmin(admin.ModelAdmin):
                 return HttpResponseRedirect(request.path)
 
             request.POST = request.POST.copy()
-            request.POST['target_type'] = ContentType.objects.get(model='OpaqueKeyProxyModel').id
+            request.POST['target_type'] = ContentType.objects.get_for_model(OpaqueKeyProxyModel).id
             request.POST['target_object_id'] = opaque_key_proxy.id
 
         return super().add_view(request, form_url='', extra_context=None)
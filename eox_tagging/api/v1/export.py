@@ -0,0 +1,91 @@
+"""
+Streaming export of tags.
+
+The rows are built straight from the tag instances, without serializer instances, and written one
+chunk of tags at a time so the response body is never held in memory.
+"""
+import csv
+import json
+
+from rest_framework import serializers
+
+from eox_tagging.constants import AccessLevel, Status
+
+EXPORT_FIELDS = [
+    "key",
+    "tag_type",
+    "tag_value",
+    "access",
+    "status",
+    "activation_date",
+    "expiration_date",
+    "created_at",
+    "inactivated_at",
+    "target_type",
+    "target_id",
+    "owner_type",
+    "owner_id",
+]
+
+NDJSON_FORMAT = "ndjson"
+CSV_FORMAT = "csv"
+
+DATE_FIELD = serializers.DateTimeField()
+
+EXPORT_CONTENT_TYPES = {
+    NDJSON_FORMAT: "application/x-ndjson",
+    CSV_FORMAT: "text/csv",
+}
+
+
+class Echo:
+    """File-like object that returns what is written instead of buffering it."""
+
+    def write(self, value):
+        """Returns the value written."""
+        return value
+
+
+def format_date(value):
+    """Returns the date in the format of the API representation of the tags, used by every export format."""
+    return DATE_FIELD.to_representation(value) if value else None
+
+
+def get_tag_row(tag):
+    """Returns the exported values of tag."""
+    return {
+        "key": str(tag.key),
+        "tag_type": tag.tag_type,
+        "tag_value": tag.tag_value,
+        "access": AccessLevel(tag.access).name,
+        "status": Status(tag.status).name,
+        "activation_date": format_date(tag.activation_date),
+        "expiration_date": format_date(tag.expiration_date),
+        "created_at": format_date(tag.created_at),
+        "inactivated_at": format_date(tag.inactivated_at),
+        "target_type": tag.target_object_type,
+        "target_id": str(tag.target_object),
+        "owner_type": tag.owner_object_type,
+        "owner_id": str(tag.owner_object),
+    }
+
+
+def stream_ndjson(chunks):
+    """Yields one JSON document per line for every tag of chunks."""
+    for chunk in chunks:
+        yield "".join(json.dumps(get_tag_row(tag)) + "\n" for tag in chunk)
+
+
+def stream_csv(chunks):
+    """Yields the CSV header followed by the rows of the tags of chunks."""
+    writer = csv.DictWriter(Echo(), fieldnames=EXPORT_FIELDS)
+    yield writer.writeheader()
+
+    for chunk in chunks:
+        yield "".join(writer.writerow(get_tag_row(tag)) for tag in chunk)
+
+
+EXPORT_STREAMS = {
+    NDJSON_FORMAT: stream_ndjson,
+    CSV_FORMAT: stream_csv,
+}
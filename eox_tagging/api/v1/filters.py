@@ -32,6 +32,8 @@ class TagFilter(filters.FilterSet):
     activation_date = filters.DateTimeFromToRangeFilter()
     expiration_date = filters.DateTimeFromToRangeFilter()
     access = filters.CharFilter(method="filter_access_type")
+    effective = filters.BooleanFilter(method="filter_effective")
+    as_of = filters.DateTimeFilter(method="filter_as_of")
 
     class Meta:
         """Meta class."""
@@ -113,6 +115,20 @@ class TagFilter(filters.FilterSet):
 
         return queryset
 
+    def filter_effective(self, queryset, name, value):  # pylint: disable=unused-argument
+        """Filters the tags in force right now, or the ones that are not when value is false."""
+        if value is None:
+            return queryset
+
+        return queryset.effective() if value else queryset.not_effective()
+
+    def filter_as_of(self, queryset, name, value):  # pylint: disable=unused-argument
+        """Filters the tags that were active at the given time."""
+        if value:
+            queryset = queryset.as_of(value)
+
+        return queryset
+
 
 class FilterBackend(filters.DjangoFilterBackend):
     """
@@ -1,6 +1,8 @@
 """ Pagination class for Tag API."""
 from django.conf import settings
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+CURSOR_PAGINATION_MODE = "cursor"
 
 
 class TagApiPagination(PageNumberPagination):
@@ -10,3 +12,18 @@ class TagApiPagination(PageNumberPagination):
     page_size = settings.DATA_API_DEF_PAGE_SIZE
     page_size_query_param = 'page_size'
     max_page_size = settings.DATA_API_MAX_PAGE_SIZE
+
+
+class TagCursorPagination(CursorPagination):
+    """
+    Keyset pagination of tags ordered by id.
+
+    Pages are selected with an opaque cursor instead of an offset, so deep pages cost the same as
+    the first one and no COUNT query is run. DRF builds the position of a cursor from the first
+    ordering field alone, so the tags are ordered by their unique and increasing id, which follows
+    the creation order, instead of by a creation date shared by the tags of a bulk creation.
+    """
+    page_size = settings.DATA_API_DEF_PAGE_SIZE
+    page_size_query_param = 'page_size'
+    max_page_size = settings.DATA_API_MAX_PAGE_SIZE
+    ordering = "id"
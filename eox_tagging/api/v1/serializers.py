@@ -2,13 +2,18 @@
 Serializers for tags and related objects.
 """
 
+from collections import defaultdict
+from operator import attrgetter
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.utils.translation import gettext as _
 from rest_framework import serializers
 
 from eox_tagging.api.v1 import fields
 from eox_tagging.constants import AccessLevel, Status
-from eox_tagging.edxapp_accessors import get_object_from_edxapp, get_site
+from eox_tagging.edxapp_accessors import get_object_from_edxapp, get_objects_from_edxapp, get_site
 from eox_tagging.models import Tag
 
 MODELS_WITH_COMPOUND_KEYS = {
@@ -16,9 +21,49 @@ MODELS_WITH_COMPOUND_KEYS = {
     "generatedcertificate": ["username", "course_id"],
 }
 
+# Fields of the tag representation that can be requested with `fields`
+TAG_READ_FIELDS = (
+    "meta",
+    "key",
+    "tag_value",
+    "tag_type",
+    "access",
+    "activation_date",
+    "expiration_date",
+    "status",
+)
+
+# Columns read by `TagValuesSerializer` for each field, the id and creation date are read for the pagination
+TAG_VALUES_COLUMNS = {
+    "meta": (
+        "target_type_id",
+        "target_object_id",
+        "owner_type_id",
+        "owner_object_id",
+        "created_at",
+        "inactivated_at",
+    ),
+    "key": ("key",),
+    "tag_value": ("tag_value",),
+    "tag_type": ("tag_type",),
+    "access": ("access",),
+    "activation_date": ("activation_date",),
+    "expiration_date": ("expiration_date",),
+    "status": ("status",),
+}
+TAG_VALUES_PAGINATION_COLUMNS = ("id",)
+
+ACCESS_NAMES = {level.value: level.name for level in AccessLevel}
+STATUS_NAMES = {status.value: status.name for status in Status}
+
 
 class TagSerializer(serializers.ModelSerializer):
-    """Serializer for tag objects."""
+    """
+    Serializer for tag objects.
+
+    Accepts `fields`, the names of the fields to keep, to return a sparse representation. `get_meta`
+    and the related objects it loads are skipped when `meta` isn't one of them.
+    """
 
     target_id = serializers.CharField(source="target_object", write_only=True)
     owner_id = serializers.CharField(
@@ -51,6 +96,15 @@ class TagSerializer(serializers.ModelSerializer):
             "status",
         )
 
+    def __init__(self, *args, **kwargs):
+        """Drops the fields that aren't in the optional `fields` argument."""
+        requested_fields = kwargs.pop("fields", None)
+        super().__init__(*args, **kwargs)
+
+        if requested_fields is not None:
+            for name in set(self.fields) - set(requested_fields):
+                self.fields.pop(name)
+
     def get_meta(self, instance):
         """Getter of read-only field that returns technical information."""
         return {
@@ -70,12 +124,7 @@ class TagSerializer(serializers.ModelSerializer):
         owner_type = validated_data.pop("owner_object_type", None)
         target = validated_data.pop("target_object", None)
 
-        if target_type and target_type.lower() in MODELS_WITH_COMPOUND_KEYS:
-            data = self._convert_compound_keys(target, target_type.lower())
-        else:
-            data = {
-                "target_id": target,
-            }
+        data = self.get_target_identifier(target_type, target)
 
         try:
             target_object = get_object_from_edxapp(target_type, **data)
@@ -84,10 +133,7 @@ class TagSerializer(serializers.ModelSerializer):
                 {"Target": _(f"Error getting {target_type} object.")}
             ) from exc
 
-        if owner_type and owner_type.lower() == "user":
-            owner_object = self.context.get("request").user
-        else:
-            owner_object = get_site()
+        owner_object = self.get_owner_object(owner_type)
 
         tag_object = {
             "target_object": target_object,
@@ -100,6 +146,21 @@ class TagSerializer(serializers.ModelSerializer):
         except ValidationError as validation_error:
             raise serializers.ValidationError({"Tag": _(f"{validation_error.message}")})
 
+    def get_owner_object(self, owner_type):
+        """Function that returns the owner of the tags created in the current request."""
+        if owner_type and owner_type.lower() == "user":
+            return self.context.get("request").user
+        return get_site()
+
+    @classmethod
+    def get_target_identifier(cls, target_type, target):
+        """Function that returns the keyword arguments used to get the target from edx-platform."""
+        if target_type and target_type.lower() in MODELS_WITH_COMPOUND_KEYS:
+            return cls._convert_compound_keys(target, target_type.lower())
+        return {
+            "target_id": target,
+        }
+
     @staticmethod
     def _convert_compound_keys(ids, object_type):
         """
@@ -113,3 +174,188 @@ class TagSerializer(serializers.ModelSerializer):
         target_labels = MODELS_WITH_COMPOUND_KEYS.get(object_type)
         target_pairs = zip(target_labels, target_id)
         return dict(target_pairs)
+
+
+class TagValuesSerializer:
+    """
+    Fast serializer of the tags list with the same representation as `TagSerializer`.
+
+    The tags are read as `values_list` rows instead of model instances, `access` and `status` are
+    named from lookup tables and the dates are converted by a `DateTimeField`. The targets and owners
+    of `meta` are loaded with one query per content type, shared by both relations.
+
+    Attributes:
+        fields: names of the fields of the representation, all of TAG_READ_FIELDS by default.
+    """
+
+    def __init__(self, fields=None):  # pylint: disable=redefined-outer-name
+        self.fields = [name for name in TAG_READ_FIELDS if fields is None or name in fields]
+        self.__datetime_field = serializers.DateTimeField()
+        converters = {
+            "key": lambda row: str(row.key),
+            "tag_value": attrgetter("tag_value"),
+            "tag_type": attrgetter("tag_type"),
+            "access": lambda row: ACCESS_NAMES[row.access],
+            "activation_date": lambda row: self.__to_datetime(row.activation_date),
+            "expiration_date": lambda row: self.__to_datetime(row.expiration_date),
+            "status": lambda row: STATUS_NAMES[row.status],
+        }
+        self.__converters = [(name, converters[name]) for name in self.fields if name != "meta"]
+
+    def get_rows(self, queryset):
+        """Returns the queryset of the named rows with the columns of the fields."""
+        columns = dict.fromkeys(TAG_VALUES_PAGINATION_COLUMNS)
+        for name in self.fields:
+            columns.update(dict.fromkeys(TAG_VALUES_COLUMNS[name]))
+        return queryset.prefetch_related(None).values_list(*columns, named=True)
+
+    def serialize(self, rows):
+        """Returns the representation of the rows returned by `get_rows`."""
+        if "meta" not in self.fields:
+            return [{name: convert(row) for name, convert in self.__converters} for row in rows]
+
+        # meta is the first field of the representation
+        related_names = self.__get_related_names(rows)
+        return [
+            {
+                "meta": self.__get_meta(row, related_names),
+                **{name: convert(row) for name, convert in self.__converters},
+            }
+            for row in rows
+        ]
+
+    def __get_meta(self, row, related_names):
+        """Returns the meta field of a row, like `TagSerializer.get_meta`."""
+        return {
+            "target_id": related_names.get((row.target_type_id, row.target_object_id), "None"),
+            "target_type": self.__get_type_name(row.target_type_id),
+            "owner_id": related_names.get((row.owner_type_id, row.owner_object_id), "None"),
+            "owner_type": self.__get_type_name(row.owner_type_id),
+            "created_at": row.created_at,
+            "inactivated_at": row.inactivated_at,
+        }
+
+    def __to_datetime(self, value):
+        """Returns the representation of a date like the `DateTimeField` of `TagSerializer`."""
+        return None if value is None else self.__datetime_field.to_representation(value)
+
+    @staticmethod
+    def __get_related_names(rows):
+        """
+        Returns the string representation of the targets and owners of the rows by
+        (content_type_id, object_id), loading the objects of each content type with one query.
+        """
+        ids_by_type = defaultdict(set)
+        for row in rows:
+            for ctype_id, object_id in [
+                (row.target_type_id, row.target_object_id),
+                (row.owner_type_id, row.owner_object_id),
+            ]:
+                if ctype_id is not None and object_id is not None:
+                    ids_by_type[ctype_id].add(object_id)
+
+        related_names = {}
+        for ctype_id, object_ids in ids_by_type.items():
+            ctype = ContentType.objects.get_for_id(ctype_id)
+            if ctype.model_class() is None:
+                continue
+            for related_object in ctype.get_all_objects_for_this_type(pk__in=object_ids):
+                related_names[(ctype_id, related_object.pk)] = str(related_object)
+        return related_names
+
+    @staticmethod
+    def __get_type_name(ctype_id):
+        """Returns the class name of the model of a content type, like `Tag.target_object_type`."""
+        if ctype_id is None:
+            return None
+        model_class = ContentType.objects.get_for_id(ctype_id).model_class()
+        return model_class.__name__ if model_class else None
+
+
+class TagBulkCreateSerializer(serializers.Serializer):  # pylint: disable=abstract-method
+    """
+    Serializer used to create many tags in one request.
+
+    Every tag is validated with `TagSerializer`, the targets are resolved in batches per target type and
+    the valid tags are inserted in chunks. Invalid tags are reported by position without aborting the batch.
+    """
+
+    tags = serializers.ListField(
+        child=serializers.DictField(),
+        allow_empty=False,
+        max_length=settings.EOX_TAGGING_BULK_MAX_SIZE,
+    )
+
+    def create(self, validated_data):
+        """Function that creates the valid tags and returns them along with the errors."""
+        errors = {}
+        tags_data = {}
+
+        for index, tag_data in enumerate(validated_data["tags"]):
+            tag_serializer = TagSerializer(data=tag_data, context=self.context)
+            if tag_serializer.is_valid():
+                tags_data[index] = tag_serializer.validated_data
+            else:
+                errors[index] = tag_serializer.errors
+
+        tags = self.__build_tags(tags_data, errors)
+        positions = list(tags)
+        created, tag_errors = Tag.objects.bulk_create_tags(
+            list(tags.values()),
+            batch_size=settings.EOX_TAGGING_BULK_BATCH_SIZE,
+        )
+        for tag_position, message in tag_errors.items():
+            errors[positions[tag_position]] = {"Tag": [message]}
+
+        return {
+            "created": created,
+            "errors": [{"index": index, "errors": errors[index]} for index in sorted(errors)],
+        }
+
+    def __build_tags(self, tags_data, errors):
+        """Function that resolves the targets and owners of the tags grouped by target type."""
+        tags = {}
+        owners = {
+            "user": self.context.get("request").user,
+            "site": get_site(),
+        }
+        positions_by_type = defaultdict(list)
+
+        for index, tag_data in tags_data.items():
+            positions_by_type[tag_data["target_object_type"].lower()].append(index)
+
+        for target_type, positions in positions_by_type.items():
+            identifiers = [
+                TagSerializer.get_target_identifier(target_type, tags_data[index]["target_object"])
+                for index in positions
+            ]
+            target_objects = get_objects_from_edxapp(target_type, identifiers)
+
+            for index, target_object in zip(positions, target_objects):
+                if target_object is None:
+                    errors[index] = {"Target": [_(f"Error getting {target_type} object.")]}
+                    continue
+
+                tag_data = dict(tags_data[index])
+                tag_data.pop("target_object_type")
+                tag_data.pop("target_object")
+                tag_data.pop("owner_object", None)
+                owner_type = (tag_data.pop("owner_object_type", None) or "site").lower()
+                tags[index] = Tag(
+                    target_object=target_object,
+                    owner_object=owners["user"] if owner_type == "user" else owners["site"],
+                    **tag_data,
+                )
+
+        return dict(sorted(tags.items()))
+
+
+class TagBulkDeleteSerializer(serializers.Serializer):  # pylint: disable=abstract-method
+    """Serializer used to validate the keys of the tags deactivated in bulk."""
+
+    keys = serializers.ListField(
+        child=serializers.UUIDField(),
+        required=False,
+        allow_empty=False,
+        max_length=settings.EOX_TAGGING_BULK_MAX_SIZE,
+    )
@@ -0,0 +1,98 @@
+""" Test classes for the Tags serializers. """
+import datetime
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.contrib.sites.models import Site
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from mock import patch
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from eox_tagging.api.v1.serializers import TagSerializer, TagValuesSerializer
+from eox_tagging.constants import AccessLevel
+from eox_tagging.models import Tag
+
+
+@override_settings(
+    EOX_TAGGING_DEFINITIONS=[
+        {
+            "tag_type": "example_tag_1",
+            "validate_owner_object": "User",
+            "validate_target_object": "User",
+        },
+        {
+            "tag_type": "example_tag_2",
+            "validate_owner_object": "Site",
+            "validate_target_object": "Site",
+        },
+    ])
+@patch("eox_tagging.api.v1.permissions.EoxTaggingAPIPermission.has_permission", return_value=True)
+class TestTagValuesSerializer(TestCase):
+    """Test class for the parity of the fast list serializer with `TagSerializer`."""
+
+    def setUp(self):
+        """setUp class."""
+        self.user = User.objects.create(username="values_user")
+        self.site = Site.objects.get(id=settings.TEST_SITE)
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        removed_target = User.objects.create(username="removed_target")
+
+        Tag.objects.create(
+            tag_value="example_tag_value",
+            tag_type="example_tag_1",
+            target_object=User.objects.create(username="values_target"),
+            owner_object=self.user,
+            access=AccessLevel.PRIVATE,
+            activation_date=datetime.datetime(2020, 10, 19, 10, 20, 30, 123456),
+            expiration_date=datetime.datetime(2030, 10, 19, 10, 20, 30),
+        )
+        Tag.objects.create(
+            tag_value="example_tag_value",
+            tag_type="example_tag_2",
+            target_object=self.site,
+            owner_object=self.site,
+        )
+        Tag.objects.create(
+            tag_value="example_tag_value",
+            tag_type="example_tag_1",
+            target_object=removed_target,
+            owner_object=self.user,
+            access=AccessLevel.PROTECTED,
+        ).delete()
+        removed_target.delete()
+
+    def assertSameRepresentation(self, fields=None):  # pylint: disable=invalid-name
+        """Asserts that both serializers render the same JSON for every tag."""
+        queryset = Tag.objects.order_by("id")
+        values_serializer = TagValuesSerializer(fields=fields)
+
+        self.assertEqual(
+            JSONRenderer().render(values_serializer.serialize(list(values_serializer.get_rows(queryset)))),
+            JSONRenderer().render(TagSerializer(queryset, many=True, fields=fields).data),
+        )
+
+    def test_parity(self, _):
+        """Used to test that the whole representation is the same, including removed targets and inactive tags."""
+        self.assertSameRepresentation()
+
+    def test_sparse_parity(self, _):
+        """Used to test that the sparse representations are the same."""
+        self.assertSameRepresentation(fields=["key", "access", "status", "activation_date"])
+        self.assertSameRepresentation(fields=["meta", "tag_type"])
+        self.assertSameRepresentation(fields=[])
+
+    def test_list_parity(self, _):
+        """Used to test that the list returns the same JSON with and without the fast serializer."""
+        for params in [
+            {"include_inactive": "true"},
+            {"include_inactive": "true", "fields": "key,expiration_date"},
+            {"pagination": "cursor", "page_size": 1},
+        ]:
+            fast_response = self.client.get(reverse("tag-list"), params)
+            with override_settings(EOX_TAGGING_FAST_LIST_SERIALIZER=False):
+                response = self.client.get(reverse("tag-list"), params)
+
+            self.assertEqual(fast_response.content, response.content)
@@ -1,18 +1,26 @@
 """ Test classes for Tags viewset. """
+import csv
 import datetime
+import io
+import json
 from functools import wraps
 
 from django.conf import settings
 from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
 from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
 from mock import patch
 from rest_framework.test import APIClient
 
 from eox_tagging.api.v1.serializers import TagSerializer
 from eox_tagging.constants import AccessLevel
-from eox_tagging.models import Tag
+from eox_tagging.models import Tag, TagSummary
 
 
 def mock_decorator(action=None):  # pylint: disable=unused-argument
@@ -127,6 +135,394 @@ class TestTagViewSet(TestCase):
 
         self.assertEqual(response.status_code, 200)
 
+    @patch_permissions
+    def test_retrieve_cache(self, _):
+        """Used to test that a retrieved tag is served from the cache until it's deleted."""
+        self.client.get(self.url_details)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("tag-detail", args=[str(self.example_tag.key)]))
+
+        self.assertEqual(response.data.get("status"), "ACTIVE")
+        self.assertFalse([query for query in queries.captured_queries if "eox_tagging_tag" in query["sql"]])
+
+        self.client.delete(self.url_details)
+        response = self.client.get(self.url_details)
+
+        self.assertEqual(response.data.get("status"), "INACTIVE")
+
+    @patch_permissions
+    def test_retrieve_cache_owner(self, _):
+        """Used to test that the owner of a cached tag is still checked."""
+        self.client.get(self.url_details)
+
+        response = self.client.get(self.url_details, {"owner_type": "site"})
+
+        self.assertEqual(response.status_code, 404)
+
+    @patch_permissions
+    def test_retrieve_cache_queryset_delete(self, _):
+        """Used to test that deleting a set of tags drops their cached representation."""
+        self.client.get(self.url_details)
+
+        Tag.objects.filter(tag_type="example_tag_1").delete()
+        response = self.client.get(self.url_details)
+
+        self.assertEqual(response.data.get("status"), "INACTIVE")
+
+    @patch_permissions
+    def test_list_etag(self, _):
+        """Used to test that an unchanged list is answered with 304 until a tag of the requester is deleted."""
+        etag = self.client.get(self.url, {"tag_type": "example_tag_1"})["ETag"]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, {"tag_type": "example_tag_1"}, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertFalse([query for query in queries.captured_queries if "eox_tagging_tag" in query["sql"]])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(self.url_details)
+        response = self.client.get(self.url, {"tag_type": "example_tag_1"}, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    @patch_permissions
+    def test_list_etag_after_save(self, _):
+        """Used to test that a tag saved directly, e.g. through the admin, changes the ETag of the list."""
+        etag = self.client.get(self.url, {"tag_type": "example_tag_1"})["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Tag(
+                tag_value="example_tag_value",
+                tag_type="example_tag_1",
+                target_object=self.target_object,
+                owner_object=self.owner_user,
+                access=AccessLevel.PRIVATE,
+                expiration_date=datetime.datetime(2020, 10, 19, 10, 20, 30),
+                activation_date=datetime.datetime(2020, 10, 19, 10, 20, 30),
+            ).save()
+        response = self.client.get(self.url, {"tag_type": "example_tag_1"}, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response.data["count"], 2)
+
+    @patch_permissions
+    def test_list_etag_by_query(self, _):
+        """Used to test that the ETag depends on the query and is skipped for time dependent filters."""
+        etag = self.client.get(self.url, {"tag_type": "example_tag_1"})["ETag"]
+
+        response = self.client.get(self.url, {"tag_type": "example_tag_2"}, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("ETag", self.client.get(self.url, {"effective": "true"}))
+
+    @patch_permissions
+    def test_retrieve_etag(self, _):
+        """Used to test that a tag is answered with 304 until it's deleted."""
+        etag = self.client.get(self.url_details)["ETag"]
+
+        self.assertEqual(self.client.get(self.url_details, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        self.client.delete(self.url_details)
+        response = self.client.get(self.url_details, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data.get("status"), "INACTIVE")
+
+    @patch_permissions
+    def test_owner_scoping_queries(self, _):
+        """
+        Used to test that owner scoping does not resolve the owners again: retrieve runs a single
+        tag query and none of the tag queries touch the user or site tables.
+        """
+        ContentType.objects.get_for_models(User, Site)  # Warm Django's content type cache
+
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(self.url_details)
+
+        tag_queries = [query["sql"] for query in context.captured_queries if "eox_tagging_tag" in query["sql"]]
+        self.assertEqual(len(tag_queries), 1)
+        self.assertNotIn("auth_user", tag_queries[0])
+        self.assertNotIn("django_site", tag_queries[0])
+
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(self.url)
+
+        tag_queries = [query["sql"] for query in context.captured_queries if "eox_tagging_tag" in query["sql"]]
+        self.assertEqual(len(tag_queries), 2)  # Page count and page rows
+        self.assertFalse([sql for sql in tag_queries if "auth_user" in sql or "django_site" in sql])
+
+    @patch_permissions
+    def test_list_sparse_fields(self, _):
+        """Used to test that the list returns and reads only the requested fields, without the related objects."""
+        ContentType.objects.get_for_models(User, Site)  # Warm Django's content type cache
+
+        # Current site, page count and page rows
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url, {"fields": "key,tag_value"})
+
+        self.assertEqual(len(context.captured_queries), 3)
+        self.assertNotIn("tag_type", context.captured_queries[-1]["sql"])
+        self.assertIn(
+            {"key": str(self.example_tag.key), "tag_value": "example_tag_value"},
+            response.json()["results"],
+        )
+
+    @patch_permissions
+    def test_list_omit_meta(self, _):
+        """Used to test that omit_meta returns every field but meta."""
+        response = self.client.get(self.url, {"omit_meta": "true", "fields": "meta,key,status"})
+        full_response = self.client.get(self.url, {"omit_meta": "true"})
+
+        self.assertEqual(set(response.json()["results"][0]), {"key", "status"})
+        self.assertEqual(len(full_response.json()["results"][0]), 7)
+        self.assertNotIn("meta", full_response.json()["results"][0])
+
+    @patch_permissions
+    def test_invalid_sparse_fields(self, _):
+        """Used to test that unknown fields are rejected."""
+        response = self.client.get(self.url, {"fields": "key,target_id"})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("fields", response.json())
+
+    @patch_permissions
+    def test_retrieve_sparse_fields(self, _):
+        """Used to test that a tag is trimmed to the requested fields, also when it comes from the cache."""
+        full_response = self.client.get(self.url_details)
+
+        response = self.client.get(self.url_details, {"fields": "key,expiration_date"})
+
+        self.assertEqual(set(response.json()), {"key", "expiration_date"})
+        self.assertNotEqual(response["ETag"], full_response["ETag"])
+
+    @patch_permissions
+    def test_list_page_queries(self, _):
+        """
+        Used to test that the generic relations of a full page are resolved with one query per
+        content type instead of one query per tag.
+        """
+        targets = [User.objects.create(username=f"page_user_{index}") for index in range(10)]
+        Tag.objects.bulk_create([
+            Tag(
+                tag_value="example_tag_value",
+                tag_type="example_tag_2",
+                target_object=self.owner_site if index % 3 == 0 else targets[index % len(targets)],
+                owner_object=self.owner_site if index % 2 else self.owner_user,
+            )
+            for index in range(settings.DATA_API_DEF_PAGE_SIZE)
+        ])
+        ContentType.objects.get_for_models(User, Site)  # Warm Django's content type cache
+
+        # Current site, page count, page rows, and one query per content type shared by targets and owners
+        with self.assertNumQueries(5):
+            response = self.client.get(self.url)
+
+        results = response.json().get("results")
+        self.assertEqual(len(results), settings.DATA_API_DEF_PAGE_SIZE)
+        self.assertEqual({tag["meta"]["owner_type"] for tag in results}, {"User", "Site"})
+
+    @patch_permissions
+    def test_list_with_cursor_pagination(self, _):
+        """Used to test walking the whole list with opaque cursors and without counting the tags."""
+        keys = []
+        url = f"{self.url}?pagination=cursor&page_size=1"
+
+        while url:
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get(url)
+
+            self.assertFalse([query for query in context.captured_queries if "COUNT(" in query["sql"]])
+            self.assertNotIn("count", response.data)
+            self.assertNotIn("page=", response.data["next"] or "")
+            keys.extend(tag["key"] for tag in response.data["results"])
+            url = response.data["next"]
+
+        expected_tags = [self.example_tag, self.example_tag_1, self.example_tag_2, self.example_tag_3]
+        self.assertEqual(keys, [str(tag.key) for tag in expected_tags])
+
+    @patch_permissions
+    def test_list_with_cursor_pagination_same_creation_date(self, _):
+        """Used to test that tags created at the same time, e.g. in bulk, are walked by id without offsets."""
+        Tag.objects.update(created_at=timezone.now())
+        keys = []
+        url = f"{self.url}?pagination=cursor&page_size=1"
+
+        while url:
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get(url)
+
+            self.assertFalse([query for query in context.captured_queries if "OFFSET" in query["sql"]])
+            keys.extend(tag["key"] for tag in response.data["results"])
+            url = response.data["next"]
+
+        expected_tags = [self.example_tag, self.example_tag_1, self.example_tag_2, self.example_tag_3]
+        self.assertEqual(keys, [str(tag.key) for tag in expected_tags])
+
+    @patch_permissions
+    def test_list_with_cursor_pagination_and_filters(self, _):
+        """Used to test that the cursor links keep the filters and the pagination mode."""
+        response = self.client.get(self.url, {"pagination": "cursor", "page_size": 1, "tag_type": "example_tag_2"})
+        next_response = self.client.get(response.data["next"])
+
+        self.assertEqual(response.data["results"][0]["key"], str(self.example_tag_1.key))
+        self.assertEqual(next_response.data["results"][0]["key"], str(self.example_tag_2.key))
+        self.assertIsNone(next_response.data["next"])
+
+    @patch_permissions
+    def test_export_ndjson(self, _):
+        """Used to test streaming the tags of the requester as NDJSON."""
+        response = self.client.get(reverse("tag-export"))
+
+        rows = [json.loads(line) for line in b"".join(response.streaming_content).decode().splitlines()]
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        self.assertEqual(len(rows), 4)
+        self.assertEqual(rows[0]["key"], str(self.example_tag.key))
+        self.assertEqual(rows[0]["access"], "PRIVATE")
+        self.assertEqual(rows[0]["target_id"], "user_test")
+        self.assertEqual(rows[0]["owner_type"], "User")
+        self.assertEqual(rows[0]["expiration_date"], "2020-10-19T10:20:30Z")
+
+    @patch_permissions
+    def test_export_csv_with_filters(self, _):
+        """Used to test streaming the filtered tags as CSV."""
+        response = self.client.get(reverse("tag-export"), {"export_format": "csv", "tag_type": "example_tag_2"})
+
+        rows = list(csv.DictReader(io.StringIO(b"".join(response.streaming_content).decode())))
+        self.assertEqual(response["Content-Type"], "text/csv")
+        self.assertEqual([row["key"] for row in rows], [str(self.example_tag_1.key), str(self.example_tag_2.key)])
+        self.assertEqual(rows[0]["owner_type"], "Site")
+        self.assertEqual(rows[1]["activation_date"], "")
+
+    @patch_permissions
+    def test_export_formats_dates(self, _):
+        """Used to test that both export formats write the dates like the API representation."""
+        ndjson_response = self.client.get(reverse("tag-export"))
+        csv_response = self.client.get(reverse("tag-export"), {"export_format": "csv"})
+
+        ndjson_rows = [json.loads(line) for line in b"".join(ndjson_response.streaming_content).decode().splitlines()]
+        csv_rows = list(csv.DictReader(io.StringIO(b"".join(csv_response.streaming_content).decode())))
+        response = self.client.get(reverse("tag-detail", args=[self.example_tag.key]))
+        self.assertEqual(ndjson_rows[0]["created_at"], response.json()["meta"]["created_at"])
+        self.assertEqual(
+            [row["created_at"] for row in csv_rows],
+            [row["created_at"] for row in ndjson_rows],
+        )
+
+    @patch_permissions
+    @override_settings(EOX_TAGGING_EXPORT_CHUNK_SIZE=2)
+    def test_export_in_chunks(self, _):
+        """Used to test that the generic relations are resolved once per chunk."""
+        ContentType.objects.get_for_models(User, Site)  # Warm Django's content type cache
+        response = self.client.get(reverse("tag-export"))
+
+        # Two chunks of tags with one query per content type of their targets and owners, and the empty chunk
+        with self.assertNumQueries(10):
+            content = b"".join(response.streaming_content)
+
+        self.assertEqual(len(content.splitlines()), 4)
+
+    @patch_permissions
+    def test_export_wrong_format(self, _):
+        """Used to test that an unknown export format results in bad request."""
+        response = self.client.get(reverse("tag-export"), {"export_format": "xml"})
+
+        self.assertEqual(response.status_code, 400)
+
+    @patch_permissions
+    def test_counts(self, _):
+        """Used to test counting the tags of the requester grouped by tag type."""
+        cache.clear()
+        response = self.client.get(reverse("tag-counts"), {"group_by": "tag_type"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["total"], 4)
+        self.assertEqual(
+            response.data["results"],
+            [
+                {"tag_type": "example_tag_2", "count": 2},
+                {"tag_type": "example_tag_1", "count": 1},
+                {"tag_type": "example_tag_3", "count": 1},
+            ],
+        )
+
+    @patch_permissions
+    def test_counts_with_filters(self, _):
+        """Used to test counting the filtered tags grouped by many fields."""
+        cache.clear()
+        response = self.client.get(
+            reverse("tag-counts"),
+            {"group_by": ["target_type,access", "owner_type"], "owner_type": "user"},
+        )
+
+        self.assertEqual(response.data["group_by"], ["target_type", "access", "owner_type"])
+        self.assertEqual(
+            response.data["results"],
+            [
+                {"target_type": "site", "access": "PUBLIC", "owner_type": "user", "count": 1},
+                {"target_type": "user", "access": "PRIVATE", "owner_type": "user", "count": 1},
+            ],
+        )
+
+    @patch_permissions
+    def test_counts_cache(self, _):
+        """Used to test that equivalent queries are answered from the cache."""
+        cache.clear()
+        url = reverse("tag-counts")
+        self.client.get(url, {"group_by": "tag_type", "tag_value": "example_tag_value"})
+        self.example_tag.delete()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, {"tag_value": "example_tag_value", "group_by": "tag_type"})
+
+        self.assertEqual(response.data["total"], 4)
+        self.assertFalse([query for query in queries.captured_queries if "eox_tagging_tag" in query["sql"]])
+
+    @patch_permissions
+    def test_counts_wrong_group_by(self, _):
+        """Used to test that grouping by an unknown field results in bad request."""
+        response = self.client.get(reverse("tag-counts"), {"group_by": "tag_type,target_id"})
+
+        self.assertEqual(response.status_code, 400)
+
+    @patch_permissions
+    def test_summary(self, _):
+        """Used to test reading the tags of a target, owned by the requester, from its summary."""
+        TagSummary.objects.refresh([(ContentType.objects.get_for_model(User).id, self.target_object.id)])
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("tag-summary"), {"target_type": "user", "target_id": "user_test"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertCountEqual(
+            [entry["key"] for entry in response.data["tags"]],
+            [str(self.example_tag.key), str(self.example_tag_1.key), str(self.example_tag_2.key)],
+        )
+        self.assertFalse([query for query in queries.captured_queries if '"eox_tagging_tag"' in query["sql"]])
+
+    @patch_permissions
+    def test_summary_by_owner(self, _):
+        """Used to test reading the tags of a target owned by the requesting user."""
+        TagSummary.objects.refresh([(ContentType.objects.get_for_model(User).id, self.target_object.id)])
+
+        response = self.client.get(
+            reverse("tag-summary"),
+            {"target_type": "user", "target_id": "user_test", "owner_type": "user"},
+        )
+
+        self.assertEqual([entry["key"] for entry in response.data["tags"]], [str(self.example_tag.key)])
+
+    @patch_permissions
+    def test_summary_without_target(self, _):
+        """Used to test that the summary of an unidentified target results in bad request."""
+        response = self.client.get(reverse("tag-summary"), {"target_type": "courseenrollment", "target_id": "user"})
+
+        self.assertEqual(response.status_code, 400)
+
     @patch_permissions
     def test_create_tag(self, _):
         """"Used to test creating a tag."""
@@ -237,6 +633,166 @@ class TestTagViewSet(TestCase):
 
         self.assertEqual(response.status_code, 400)
 
+    @patch_permissions
+    def test_bulk_create(self, _):
+        """Used to test creating many tags in one request with a constant number of queries."""
+        targets = [User.objects.create(username=f"bulk_user_{index}") for index in range(20)]
+        data = {
+            "tags": [
+                {
+                    "tag_type": "example_tag_2",
+                    "tag_value": "example_tag_value",
+                    "target_type": "user",
+                    "target_id": target.username,
+                    "access": "PRIVATE",
+                    "expiration_date": "2020-12-04 10:20:30",
+                }
+                for target in targets
+            ],
+        }
+        ContentType.objects.get_for_models(User, Site)  # Warm Django's content type cache
+
+        # Site, targets, savepoint, insert, the refresh of the summaries of the targets in a nested
+        # savepoint (insert of the missing rows, lock, active tags and update) and the savepoint releases
+        with self.assertNumQueries(11):
+            response = self.client.post(reverse("tag-bulk"), data, format="json")
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(len(response.data["created"]), 20)
+        self.assertFalse(response.data["errors"])
+        self.assertEqual(Tag.objects.filter(target_key__startswith="bulk_user_").count(), 20)
+        self.assertEqual(response.data["created"][0]["meta"]["owner_type"], "Site")
+
+    @patch_permissions
+    def test_bulk_create_partial_errors(self, _):
+        """Used to test that invalid tags are reported without aborting the batch."""
+        valid_tag = {
+            "tag_type": "example_tag_1",
+            "tag_value": "example_tag_value",
+            "target_type": "user",
+            "target_id": "user_test",
+            "owner_type": "user",
+            "access": "PRIVATE",
+            "expiration_date": "2020-12-04 10:20:30",
+        }
+        data = {
+            "tags": [
+                valid_tag,
+                {**valid_tag, "target_id": "missing_user"},
+                {**valid_tag, "tag_value": "not_allowed_value"},
+                {**valid_tag, "expiration_date": "12-04-2020 10:20:30"},
+                {**valid_tag, "tag_type": "not_configured"},
+                valid_tag,
+            ],
+        }
+
+        response = self.client.post(reverse("tag-bulk"), data, format="json")
+
+        self.assertEqual(response.status_code, 207)
+        self.assertEqual(len(response.data["created"]), 2)
+        self.assertEqual([error["index"] for error in response.data["errors"]], [1, 2, 3, 4])
+        self.assertIn("Target", response.data["errors"][0]["errors"])
+        self.assertIn("Tag", response.data["errors"][1]["errors"])
+        self.assertIn("expiration_date", response.data["errors"][2]["errors"])
+        self.assertIn("Tag", response.data["errors"][3]["errors"])
+
+    @patch_permissions
+    def test_bulk_create_without_valid_tags(self, _):
+        """Used to test that a batch without valid tags results in bad request."""
+        data = {
+            "tags": [
+                {
+                    "tag_type": "example_tag_1",
+                    "tag_value": "example_tag_value",
+                    "target_type": "user",
+                    "target_id": "missing_user",
+                },
+            ],
+        }
+
+        response = self.client.post(reverse("tag-bulk"), data, format="json")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(response.data["created"])
+
+    @patch_permissions
+    def test_bulk_create_empty(self, _):
+        """Used to test that an empty batch results in bad request."""
+        response = self.client.post(reverse("tag-bulk"), {"tags": []}, format="json")
+
+        self.assertEqual(response.status_code, 400)
+
+    @patch_permissions
+    def test_bulk_delete_by_keys(self, _):
+        """Used to test deactivating a list of tags by key."""
+        data = {"keys": [self.example_tag.key.hex, self.example_tag_1.key.hex]}
+
+        response = self.client.post(reverse("tag-bulk-delete"), data, format="json")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["deleted"], 2)
+        self.assertEqual(Tag.objects.inactive().count(), 2)
+        self.assertIsNone(Tag.objects.get(id=self.example_tag_2.id).inactivated_at)
+
+    @patch_permissions
+    def test_bulk_delete_by_filters(self, _):
+        """Used to test deactivating the tags matching the list filters."""
+        response = self.client.post(f"{reverse('tag-bulk-delete')}?tag_type=example_tag_2", {}, format="json")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["deleted"], 2)
+        self.assertCountEqual(
+            Tag.objects.inactive().values_list("id", flat=True),
+            [self.example_tag_1.id, self.example_tag_2.id],
+        )
+
+    @patch_permissions
+    @override_settings(EOX_TAGGING_BULK_BATCH_SIZE=1)
+    def test_bulk_delete_in_batches(self, _):
+        """Used to test that every chunk is deactivated with a single UPDATE."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(f"{reverse('tag-bulk-delete')}?tag_value=example_tag_value", format="json")
+
+        updates = [query for query in queries.captured_queries if query["sql"].startswith('UPDATE "eox_tagging_tag"')]
+        self.assertEqual(response.data["deleted"], 4)
+        self.assertEqual(len(updates), 4)
+
+    @patch_permissions
+    def test_bulk_delete_owner_scoping(self, _):
+        """Used to test that tags owned by other users are not deactivated."""
+        other_tag = Tag.objects.create(
+            tag_value="example_tag_value",
+            tag_type="example_tag_1",
+            target_object=self.target_object,
+            owner_object=User.objects.create(username="other_owner"),
+            access=AccessLevel.PRIVATE,
+            expiration_date=datetime.datetime(2020, 10, 19, 10, 20, 30),
+        )
+
+        response = self.client.post(reverse("tag-bulk-delete"), {"keys": [other_tag.key.hex]}, format="json")
+
+        self.assertEqual(response.data["deleted"], 0)
+        self.assertIsNone(Tag.objects.get(id=other_tag.id).inactivated_at)
+
+    @patch_permissions
+    def test_bulk_delete_skips_inactive_tags(self, _):
+        """Used to test that inactive tags keep their inactivation date."""
+        self.client.delete(self.url_details)
+        inactivated_at = Tag.objects.get(id=self.example_tag.id).inactivated_at
+
+        response = self.client.post(reverse("tag-bulk-delete"), {"keys": [self.key]}, format="json")
+
+        self.assertEqual(response.data["deleted"], 0)
+        self.assertEqual(Tag.objects.get(id=self.example_tag.id).inactivated_at, inactivated_at)
+
+    @patch_permissions
+    def test_bulk_delete_without_keys_or_filters(self, _):
+        """Used to test that deactivating every tag of the owner requires a filter."""
+        response = self.client.post(reverse("tag-bulk-delete"), {}, format="json")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Tag.objects.inactive().exists())
+
     @patch_permissions
     def test_patch_tag(self, _):
         """Used to test that a tag can't be updated."""
@@ -443,6 +999,35 @@ class TestTagViewSet(TestCase):
                            for tag in results]
         self.assertTrue(all(expiration_date))
 
+    @patch_permissions
+    def test_filter_effective(self, _):
+        """Used to test filtering the tags in force right now."""
+        Tag.objects.filter(id=self.example_tag_2.id).update(expiration_date=None)
+
+        effective_response = self.client.get(self.url, {"effective": "true"})
+        not_effective_response = self.client.get(self.url, {"effective": "false"})
+
+        effective = [tag["key"] for tag in effective_response.json().get("results")]
+        not_effective = [tag["key"] for tag in not_effective_response.json().get("results")]
+        self.assertEqual(effective, [str(self.example_tag_2.key)])
+        self.assertNotIn(str(self.example_tag_2.key), not_effective)
+        self.assertEqual(len(not_effective), 3)
+
+    @patch_permissions
+    def test_filter_as_of(self, _):
+        """Used to test listing the tags that were active at a past date."""
+        Tag.objects.update(created_at=datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc))
+        Tag.objects.filter(id=self.example_tag_1.id).update(created_at=datetime.datetime.now(datetime.timezone.utc))
+        self.client.delete(self.url_details)
+
+        response = self.client.get(self.url, {"as_of": "2021-01-01 00:00:00"})
+
+        keys = [tag["key"] for tag in response.json().get("results")]
+        self.assertCountEqual(
+            keys,
+            [str(self.example_tag.key), str(self.example_tag_2.key), str(self.example_tag_3.key)],
+        )
+
     @patch_permissions
     def test_soft_delete(self, _):
         """Used to test a tag soft deletion."""
@@ -1,18 +1,39 @@
 """
 Viewset for Tags.
 """
+import hashlib
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.validators import EMPTY_VALUES
+from django.http import StreamingHttpResponse
+from django.utils.http import parse_etags, quote_etag
 from edx_api_doc_tools import query_parameter, schema_for
 from edx_rest_framework_extensions.auth.jwt.authentication import JwtAuthentication
-from rest_framework import status, viewsets
+from rest_framework import serializers, status, viewsets
 from rest_framework.authentication import SessionAuthentication
+from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
 
+from eox_tagging.api.v1.export import EXPORT_CONTENT_TYPES, EXPORT_STREAMS, NDJSON_FORMAT
 from eox_tagging.api.v1.filters import FilterBackend, TagFilter
-from eox_tagging.api.v1.pagination import TagApiPagination
+from eox_tagging.api.v1.pagination import CURSOR_PAGINATION_MODE, TagApiPagination, TagCursorPagination
 from eox_tagging.api.v1.permissions import EoxTaggingAPIPermission
-from eox_tagging.api.v1.serializers import TagSerializer
+from eox_tagging.api.v1.serializers import (
+    TAG_READ_FIELDS,
+    TagBulkCreateSerializer,
+    TagBulkDeleteSerializer,
+    TagSerializer,
+    TagValuesSerializer,
+)
+from eox_tagging.db_router import can_read_from_replica, iter_from_replica, read_from_replica
 from eox_tagging.edxapp_accessors import get_site
 from eox_tagging.edxapp_wrappers.bearer_authentication import BearerAuthentication
-from eox_tagging.models import Tag
+from eox_tagging.generations import get_generations
+from eox_tagging.models import COUNT_GROUP_BY_FIELDS, Tag, TagSummary
+from eox_tagging.tag_cache import cache_tag, get_cached_tag, get_tag_cache_timeout, is_owned_by
 
 try:
     from eox_audit_model.decorators import audit_method
@@ -22,6 +43,23 @@ except ImportError:
         return lambda x: x
 
 
+COUNTS_CACHE_KEY = "eox_tagging_counts_{digest}"
+
+RETRIEVE_CACHE_PARAMS = {"owner_type", "fields", "omit_meta"}
+
+# Columns loaded with a sparse fieldset besides the requested ones, the cursor pagination reads the id
+SPARSE_FIELDSET_COLUMNS = ("id",)
+
+# The results of these filters change with time, not only with the writes of the owners
+ETAG_UNSTABLE_PARAMS = {"effective", "as_of"}
+
+SUMMARY_TARGET_ID_FIELDS = {
+    "user": "username",
+    "courseoverview": "course_id",
+    "generatedcertificate": "verify_uuid",
+}
+
+
 @schema_for(
     "create",
     """
@@ -74,6 +112,168 @@ except ImportError:
     Visibility of the tag, either `PUBLIC`, `PRIVATE` or `PROTECTED`
     """,
 )
+@schema_for(
+    "bulk",
+    """
+    Creates many tags in one request.
+    Every item of `tags` accepts the same fields as `POST /eox-tagging/api/v1/tags/`. The targets\
+    are resolved in batches per target type and the tags are inserted in chunks. Invalid items\
+    don't abort the batch, they are reported by their position in `errors`.
+
+    **Example Request**
+
+        POST /eox-tagging/api/v1/tags/bulk/
+        {
+            "tags": [
+                {
+                    "tag_type": "subscription_level",
+                    "tag_value": "premium",
+                    "target_type": "user",
+                    "target_id": "edx"
+                },
+                {
+                    "tag_type": "subscription_level",
+                    "tag_value": "premium",
+                    "target_type": "user",
+                    "target_id": "honor"
+                }
+            ]
+        }
+
+    **Example Response**
+
+        {
+            "created": [...],
+            "errors": [{"index": 1, "errors": {"Target": ["Error getting user object."]}}]
+        }
+
+    The response status is 201 when every tag is created, 207 when some of them failed and 400\
+    when none was created.
+    """,
+    responses={
+        status.HTTP_201_CREATED: "All the tags were created",
+        status.HTTP_207_MULTI_STATUS: "Some of the tags were created",
+        status.HTTP_400_BAD_REQUEST: "None of the tags was created",
+    },
+)
+@schema_for(
+    "bulk_delete",
+    """
+    Deactivates many tags in one request (soft delete).
+    The tags are selected with a list of `keys`, the same filters of `GET /eox-tagging/api/v1/tags/`\
+    passed as query parameters, or both. At least one of them is required. Only active tags owned by\
+    the requester are deactivated, in chunks, and every chunk is audited separately.
+
+    **Example Request**
+
+        POST /eox-tagging/api/v1/tags/bulk-delete/?tag_type=subscription_level
+        {
+            "keys": ["8a265b65-9555-4cd1-9d64-ee2009d80301"]
+        }
+
+    **Example Response**
+
+        {
+            "deleted": 1
+        }
+    """,
+    responses={
+        status.HTTP_200_OK: "The matching tags were deactivated",
+        status.HTTP_400_BAD_REQUEST: "Neither keys nor valid filters were provided",
+    },
+)
+@schema_for(
+    "export",
+    """
+    Exports every tag of the list.
+    Accepts the same query parameters of `GET /eox-tagging/api/v1/tags/`, except the pagination ones,\
+    and streams the tags as NDJSON (one JSON object per line) or CSV. The tags are read in chunks, so\
+    this is the recommended way to pull all the tags of a site.
+
+    **Example Request**
+
+        GET /eox-tagging/api/v1/tags/export/?export_format=csv&tag_type=subscription_level
+    """,
+    parameters=[
+        query_parameter("export_format", str, "One of `ndjson` or `csv`. Default: ndjson"),
+    ],
+    responses={status.HTTP_400_BAD_REQUEST: "Unknown export format"},
+)
+@schema_for(
+    "counts",
+    """
+    Counts the tags of the list grouped by one or more fields.
+    Accepts the same query parameters of `GET /eox-tagging/api/v1/tags/`, except the pagination ones.\
+    The counts are computed by the database and cached for a short time, so recent changes can take\
+    up to `EOX_TAGGING_COUNTS_CACHE_TIMEOUT` seconds to show up.
+
+    **Example Request**
+
+        GET /eox-tagging/api/v1/tags/counts/?group_by=tag_type,tag_value&target_type=user
+
+    **Example Response**
+
+        {
+            "group_by": ["tag_type", "tag_value"],
+            "total": 15,
+            "results": [
+                {"tag_type": "subscription_level", "tag_value": "premium", "count": 10},
+                {"tag_type": "subscription_level", "tag_value": "basic", "count": 5}
+            ]
+        }
+    """,
+    parameters=[
+        query_parameter(
+            "group_by",
+            str,
+            "Fields to group by, repeated or separated by commas. Any of `tag_type`, `tag_value`, `access`, "
+            "`target_type` or `owner_type`",
+        ),
+    ],
+    responses={status.HTTP_400_BAD_REQUEST: "Unknown group_by field"},
+)
+@schema_for(
+    "summary",
+    """
+    Returns the active tags of one target in a single compact document.
+    The tags are read from the summary of the target, which is refreshed in the same transaction\
+    that creates or deletes its tags, so the tag table is not queried.
+
+    **Example Request**
+
+        GET /eox-tagging/api/v1/tags/summary/?target_type=user&target_id=edx
+
+    **Example Response**
+
+        {
+            "target_type": "user",
+            "target_id": "edx",
+            "tags": [
+                {
+                    "key": "4a8c1ba1-5c2e-4ab0-a7a4-a6ed2c9e5c8d",
+                    "tag_type": "subscription_level",
+                    "tag_value": "premium",
+                    "access": "PUBLIC",
+                    "activation_date": null,
+                    "expiration_date": null,
+                    "created_at": "2025-03-10T14:20:31.172539+00:00",
+                    "owner_type": "site",
+                    "owner_id": 1
+                }
+            ]
+        }
+    """,
+    parameters=[
+        query_parameter("target_type", str, "Type of the target, e.g. `user` or `courseoverview`"),
+        query_parameter(
+            "target_id",
+            str,
+            "Identifier of the target. Use `username: course_id` for enrollments and certificates",
+        ),
+        query_parameter("owner_type", str, "Return only the tags owned by the requesting `user` or `site`"),
+    ],
+    responses={status.HTTP_400_BAD_REQUEST: "Missing target_type or target_id"},
+)
 @schema_for(
     "destroy",
     """
@@ -85,8 +285,19 @@ except ImportError:
     "retrieve",
     """
     Fetch details for a single tag by key
+    The response has an `ETag` that changes when the tag is deleted, send it in `If-None-Match` to get\
+    304 while the tag is unchanged.
     """,
-    responses={status.HTTP_404_NOT_FOUND: "Not found"},
+    parameters=[
+        query_parameter(
+            "fields",
+            str,
+            "Comma separated fields of the tag to return, any of: meta, key, tag_value, tag_type, access, "
+            "activation_date, expiration_date and status. Default: all",
+        ),
+        query_parameter("omit_meta", bool, "If true the tag is returned without `meta`. Default false"),
+    ],
+    responses={status.HTTP_304_NOT_MODIFIED: "Not modified", status.HTTP_404_NOT_FOUND: "Not found"},
 )
 @schema_for(
     "list",
@@ -101,6 +312,9 @@ except ImportError:
     Time must be UTC.
     - Parameters not defined bellow will be ignored. If you apply a filter with a typo you'll get the \
     whole list of tags.
+    - The response has an `ETag` that changes when a tag of the requester is created or deleted, send it\
+    in `If-None-Match` to get 304 while the list is unchanged. Lists filtered by `effective` or `as_of`\
+    don't have ETags.
     """,
     parameters=[
         query_parameter(
@@ -108,6 +322,20 @@ except ImportError:
             str,
             "The unique identifier. Same as `GET /eox-tagging/api/v1/tags/{key}`",
         ),
+        query_parameter(
+            "pagination",
+            str,
+            "Use `cursor` to paginate by id with opaque `cursor` links and without `count`. "
+            "Recommended to walk the whole list. Default: page numbers",
+        ),
+        query_parameter(
+            "fields",
+            str,
+            "Comma separated fields of the tags to return, any of: meta, key, tag_value, tag_type, access, "
+            "activation_date, expiration_date and status. Without `meta` the targets and owners aren't loaded. "
+            "Default: all",
+        ),
+        query_parameter("omit_meta", bool, "If true the tags are returned without `meta`. Default false"),
         query_parameter(
             "status", str, "Filter active or inactive tags. Default: active"
         ),
@@ -201,6 +429,18 @@ except ImportError:
             "Filter tags created after date. Format `YY-MM-DD HH:MM:SS`",
         ),
         query_parameter("access", str, "Filter by access, One of `PUBLIC`, `PRIVATE`, `PROTECTED`"),
+        query_parameter(
+            "as_of",
+            str,
+            "Return the tags that were active at the given date, including the ones inactivated afterwards. "
+            "Format `YY-MM-DD HH:MM:SS`",
+        ),
+        query_parameter(
+            "effective",
+            bool,
+            "If true return only the tags in force right now: active, with an activation date that is empty or "
+            "reached and an expiration date that is empty or not reached yet. If false return the rest",
+        ),
     ],
     responses={status.HTTP_404_NOT_FOUND: "Not found"},
 )
@@ -224,8 +464,32 @@ class TagViewSet(viewsets.ModelViewSet):
 
         queryset = self.__get_objects_by_owner(queryset)
 
+        requested_fields = self.__get_requested_fields() if self.action == "list" else None
+        if requested_fields is not None and "meta" not in requested_fields:
+            # Without meta the related objects aren't used, only the columns of the requested fields are read
+            queryset = queryset.only(*SPARSE_FIELDSET_COLUMNS, *requested_fields)
+        elif self.action in ["list", "export"]:
+            # Resolve the generic relations of the whole page with one query per content type
+            queryset = queryset.prefetch_related("target_object", "owner_object")
+
         return queryset
 
+    def get_serializer(self, *args, **kwargs):
+        """Returns the serializer, trimmed to the fields requested with `fields` or `omit_meta` on reads."""
+        if self.action in ["list", "retrieve"]:
+            kwargs.setdefault("fields", self.__get_requested_fields())
+        return super().get_serializer(*args, **kwargs)
+
+    @property
+    def paginator(self):
+        """Returns the cursor paginator when it's requested with `pagination=cursor`."""
+        if not hasattr(self, "_paginator"):
+            if self.request.query_params.get("pagination") == CURSOR_PAGINATION_MODE:
+                self._paginator = TagCursorPagination()  # pylint: disable=attribute-defined-outside-init
+            else:
+                self._paginator = self.pagination_class()  # pylint: disable=attribute-defined-outside-init
+        return self._paginator
+
     def create(self, request, *args, **kwargs):
         """Hijack the create method and use a wrapper function to perform the
         audit process. The original parameters of create are not very useful in
@@ -239,6 +503,190 @@ class TagViewSet(viewsets.ModelViewSet):
 
         return audited_create(body=request.data)
 
+    def list(self, request, *args, **kwargs):
+        """
+        Lists the tags with an ETag built from the tag generations of the owners of the requester.
+        A matching `If-None-Match` is answered with 304 without querying the tags. The page is
+        serialized by `TagValuesSerializer` unless `EOX_TAGGING_FAST_LIST_SERIALIZER` is disabled.
+        """
+        etag = self.__get_list_etag()
+        if etag is not None and self.__etag_matches(etag):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+        values_serializer = self.__get_values_serializer()
+        with read_from_replica(self.__can_read_from_replica()):
+            if values_serializer is None:
+                response = super().list(request, *args, **kwargs)
+            else:
+                rows = values_serializer.get_rows(self.filter_queryset(self.get_queryset()))
+                page = self.paginate_queryset(rows)
+                if page is None:
+                    response = Response(values_serializer.serialize(list(rows)))
+                else:
+                    response = self.get_paginated_response(values_serializer.serialize(page))
+        if etag is not None:
+            response["ETag"] = etag
+        return response
+
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Returns a tag by key through the retrieve cache. The owner of a cached tag is checked against
+        the requester, requests with filters skip the cache. The ETag is built from the key and the
+        inactivation date, the only state of a tag that changes.
+        """
+        with read_from_replica(self.__can_read_from_replica()):
+            return self.__retrieve(request, **kwargs)
+
+    def __retrieve(self, request, **kwargs):
+        """Returns a tag by key, see `retrieve`."""
+        if set(request.query_params) - RETRIEVE_CACHE_PARAMS:
+            return self.__get_instance_response(self.get_object())
+
+        response = self.__get_cached_tag_response(kwargs[self.lookup_field])
+        if response is not None:
+            return response
+
+        # The cache is filled from the write database, a lagging replica could store a deleted tag as active
+        with read_from_replica(enabled=not get_tag_cache_timeout()):
+            instance = self.get_object()
+        return self.__get_instance_response(instance, store=True)
+
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk(self, request, *args, **kwargs):  # pylint: disable=unused-argument
+        """Creates many tags in one request, the whole batch is audited in a single record."""
+
+        @audit_method(action="eox_tagging-api-v1-viewset:tagviewset-bulk")
+        def audited_bulk(body):  # pylint: disable=unused-argument
+            serializer = TagBulkCreateSerializer(data=request.data, context=self.get_serializer_context())
+            serializer.is_valid(raise_exception=True)
+            result = serializer.save()
+
+            if not result["errors"]:
+                response_status = status.HTTP_201_CREATED
+            elif result["created"]:
+                response_status = status.HTTP_207_MULTI_STATUS
+            else:
+                response_status = status.HTTP_400_BAD_REQUEST
+
+            return Response(
+                {
+                    "created": TagSerializer(result["created"], many=True).data,
+                    "errors": result["errors"],
+                },
+                status=response_status,
+            )
+
+        return audited_bulk(body=request.data)
+
+    @action(detail=False, methods=["post"], url_path="bulk-delete")
+    def bulk_delete(self, request, *args, **kwargs):  # pylint: disable=unused-argument
+        """Deactivates the tags selected by keys and filters, each chunk is audited in its own record."""
+        serializer = TagBulkDeleteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        keys = serializer.validated_data.get("keys")
+
+        filterset = self.filterset_class(request.query_params, queryset=self.get_queryset(), request=request)
+        if not filterset.is_valid():
+            return Response(filterset.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        has_filters = any(value not in EMPTY_VALUES for value in filterset.form.cleaned_data.values())
+        if not keys and not has_filters:
+            return Response(
+                {"detail": "Provide the keys or at least one filter of the tags to delete."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        queryset = filterset.qs
+        if keys:
+            queryset = queryset.filter(key__in=keys)
+
+        @audit_method(action="eox_tagging-api-v1-viewset:tagviewset-bulk-delete")
+        def audited_bulk_delete(ids, keys):  # pylint: disable=unused-argument
+            return Tag.objects.filter(id__in=ids).active().delete()
+
+        deleted = 0
+        for batch in queryset.iter_batches(settings.EOX_TAGGING_BULK_BATCH_SIZE, fields=["key"]):
+            deleted += audited_bulk_delete(
+                ids=[tag_id for tag_id, _ in batch],
+                keys=[str(key) for _, key in batch],
+            )
+
+        return Response({"deleted": deleted}, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=["get"], url_path="export")
+    def export(self, request, *args, **kwargs):  # pylint: disable=unused-argument
+        """Streams every tag of the filtered list as NDJSON or CSV, reading them in chunks."""
+        export_format = request.query_params.get("export_format", NDJSON_FORMAT).lower()
+        if export_format not in EXPORT_STREAMS:
+            return Response(
+                {"export_format": [f"Must be one of: {', '.join(EXPORT_STREAMS)}."]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        queryset = self.filter_queryset(self.get_queryset())
+        chunks = iter_from_replica(
+            queryset.iter_batches(settings.EOX_TAGGING_EXPORT_CHUNK_SIZE),
+            self.__can_read_from_replica(),
+        )
+
+        response = StreamingHttpResponse(
+            EXPORT_STREAMS[export_format](chunks),
+            content_type=EXPORT_CONTENT_TYPES[export_format],
+        )
+        response["Content-Disposition"] = f'attachment; filename="tags.{export_format}"'
+        return response
+
+    @action(detail=False, methods=["get"], url_path="counts")
+    def counts(self, request, *args, **kwargs):  # pylint: disable=unused-argument
+        """Counts the tags of the filtered list grouped by the `group_by` fields, results are cached briefly."""
+        group_by = self.__get_list_param("group_by")
+        if not group_by or any(field not in COUNT_GROUP_BY_FIELDS for field in group_by):
+            return Response(
+                {"group_by": [f"Must be a list of: {', '.join(COUNT_GROUP_BY_FIELDS)}."]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        cache_key = self.__get_counts_cache_key(group_by)
+        counts = cache.get(cache_key)
+        if counts is None:
+            counts = self.filter_queryset(self.get_queryset()).count_by(group_by)
+            cache.set(cache_key, counts, timeout=settings.EOX_TAGGING_COUNTS_CACHE_TIMEOUT)
+
+        return Response(
+            {
+                "group_by": group_by,
+                "total": sum(group["count"] for group in counts),
+                "results": counts,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+    @action(detail=False, methods=["get"], url_path="summary")
+    def summary(self, request, *args, **kwargs):  # pylint: disable=unused-argument
+        """Returns the active tags of one target read from its summary, without querying the tag table."""
+        target_type = request.query_params.get("target_type", "")
+        target_id = self.__get_summary_target_id(target_type, request.query_params.get("target_id"))
+        if target_id is None:
+            return Response(
+                {"detail": "Provide the target_type and target_id of the target."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            owners = self.__get_request_owner(request.query_params.get("owner_type"))
+            tags = TagSummary.objects.find_for(target_type, target_id, owners=owners)
+        except Exception:  # pylint: disable=broad-except
+            tags = []
+
+        return Response(
+            {
+                "target_type": target_type,
+                "target_id": request.query_params.get("target_id"),
+                "tags": tags,
+            },
+            status=status.HTTP_200_OK,
+        )
+
     def destroy(self, request, *args, **kwargs):
         """Hijack the destroy method and use a wrapper function to perform the
         audit process. The original parameters of destroy are not very useful in
@@ -252,11 +700,174 @@ class TagViewSet(viewsets.ModelViewSet):
 
         return audited_destroy(path=request.path)
 
+    def __get_list_param(self, name):
+        """Returns the distinct values of a query parameter, which can be repeated or separated by commas."""
+        values = []
+        for value in self.request.query_params.getlist(name):
+            for item in value.split(","):
+                item = item.strip().lower()
+                if item and item not in values:
+                    values.append(item)
+        return values
+
+    def __get_requested_fields(self):
+        """
+        Returns the names of the fields selected with the `fields` and `omit_meta` parameters, or None
+        if the whole representation is requested. Resolved once per request.
+        """
+        if not hasattr(self, "_requested_fields"):
+            requested_fields = self.__get_list_param("fields") or None
+            if any(field not in TAG_READ_FIELDS for field in requested_fields or []):
+                raise serializers.ValidationError({"fields": [f"Must be a list of: {', '.join(TAG_READ_FIELDS)}."]})
+
+            if self.request.query_params.get("omit_meta", "").lower() in ["true", "1"]:
+                requested_fields = [field for field in requested_fields or TAG_READ_FIELDS if field != "meta"]
+
+            self._requested_fields = requested_fields  # pylint: disable=attribute-defined-outside-init
+        return self._requested_fields
+
+    def __get_counts_cache_key(self, group_by):
+        """
+        Returns the cache key of the counts of the request.
+
+        The key is built from the requester, that scopes the tags by owner, and the query parameters
+        sorted by name and value, so equivalent queries share the same counts.
+        """
+        normalized_query = repr(
+            (get_site().id, self.request.user.pk, sorted(group_by), self.__get_normalized_query(exclude=["group_by"]))
+        )
+        return COUNTS_CACHE_KEY.format(digest=hashlib.sha1(normalized_query.encode("utf-8")).hexdigest())
+
+    def __get_list_etag(self):
+        """
+        Returns the ETag of the list, or None if the list can change without writes.
+
+        The ETag is built from the generations of the owners that scope the list, the query parameters,
+        that select the tags and the page, and the URL and media type of the response.
+        """
+        if set(self.request.query_params) & ETAG_UNSTABLE_PARAMS:
+            return None
+
+        try:
+            owners = self.__get_request_owner(self.request.query_params.get("owner_type"))
+        except Exception:  # pylint: disable=broad-except
+            return None
+
+        state = repr((
+            [(owner.__class__.__name__, owner.pk) for owner in owners],
+            get_generations(owners),
+            self.__get_normalized_query(),
+            self.request.get_host(),
+            self.request.path,
+            self.request.accepted_media_type,
+        ))
+        return quote_etag(hashlib.sha1(state.encode("utf-8")).hexdigest())
+
+    def __get_cached_tag_response(self, key):
+        """
+        Returns the response of the tag with key from the retrieve cache, or None if it isn't cached.
+        The owner of the cached tag is checked against the requester.
+        """
+        try:
+            entry = get_cached_tag(key)
+        except ValueError:
+            raise NotFound() from None
+
+        if entry is None:
+            return None
+
+        try:
+            owners = self.__get_request_owner(self.request.query_params.get("owner_type"))
+        except Exception:  # pylint: disable=broad-except
+            owners = []
+        if not is_owned_by(entry, owners):
+            raise NotFound()
+        return self.__get_tag_response(
+            entry["data"]["key"],
+            entry["data"]["meta"]["inactivated_at"],
+            lambda: self.__get_sparse_data(entry["data"]),
+        )
+
+    def __get_instance_response(self, instance, store=False):
+        """Returns the response of a tag, storing its data in the retrieve cache if store is set."""
+
+        def serialize():
+            if not store:
+                return self.get_serializer(instance).data
+            data = self.get_serializer(instance, fields=None).data
+            cache_tag(instance, data)
+            return self.__get_sparse_data(data)
+
+        return self.__get_tag_response(instance.key, instance.inactivated_at, serialize)
+
+    def __get_values_serializer(self):
+        """Returns the fast serializer of the list, or None if `EOX_TAGGING_FAST_LIST_SERIALIZER` is disabled."""
+        if not getattr(settings, "EOX_TAGGING_FAST_LIST_SERIALIZER", True):
+            return None
+        return TagValuesSerializer(fields=self.__get_requested_fields())
+
+    def __get_sparse_data(self, data):
+        """Returns the fields of the serialized data of a tag requested with `fields` or `omit_meta`."""
+        requested_fields = self.__get_requested_fields()
+        if requested_fields is None:
+            return data
+        return {name: value for name, value in data.items() if name in requested_fields}
+
+    def __get_tag_response(self, key, inactivated_at, get_data):
+        """
+        Returns the response of a single tag with its ETag, or 304 without calling get_data if the
+        ETag matches `If-None-Match`.
+        """
+        requested_fields = self.__get_requested_fields()
+        state = repr((
+            uuid.UUID(str(key)).hex,
+            inactivated_at.isoformat() if inactivated_at else None,
+            None if requested_fields is None else sorted(requested_fields),
+            self.request.accepted_media_type,
+        ))
+        etag = quote_etag(hashlib.sha1(state.encode("utf-8")).hexdigest())
+
+        if self.__etag_matches(etag):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        return Response(get_data(), headers={"ETag": etag})
+
+    def __etag_matches(self, etag):
+        """Returns whether etag is one of the ETags of the `If-None-Match` header."""
+        etags = parse_etags(self.request.headers.get("If-None-Match", ""))
+        return "*" in etags or etag in etags
+
+    def __get_normalized_query(self, exclude=()):
+        """Returns the query parameters of the request sorted by name and value."""
+        return sorted(
+            (name, sorted(values))
+            for name, values in self.request.query_params.lists()
+            if name not in exclude
+        )
+
+    @staticmethod
+    def __get_summary_target_id(target_type, target_id):
+        """
+        Returns the identifiers of the target of the summary, like the ones used by the filters,
+        or None if they are missing. Enrollments and certificates accept `username: course_id`.
+        """
+        if not target_type or not target_id:
+            return None
+
+        identifier = TagSerializer.get_target_identifier(target_type, target_id)
+        if "target_id" not in identifier:
+            return identifier
+
+        field = SUMMARY_TARGET_ID_FIELDS.get(target_type.lower())
+        return {field: identifier["target_id"]} if field else None
+
     def __get_objects_by_status(self, queryset):
         """Method that returns queryset filtered by tag status."""
+        if self.action == "bulk_delete":
+            return queryset.active()
+
         include_inactive = self.request.query_params.get("include_inactive")
 
-        if "key" in self.request.query_params or self.action == "retrieve":
+        if "key" in self.request.query_params or "as_of" in self.request.query_params or self.action == "retrieve":
             include_inactive = "true"
 
         if not include_inactive or include_inactive.lower() not in ["true", "1"]:
@@ -267,21 +878,17 @@ class TagViewSet(viewsets.ModelViewSet):
     def __get_objects_by_owner(self, queryset):
         """Method that returns queryset filtered by tag owner"""
         owner_type = self.request.query_params.get("owner_type")
-        owner_information = self.__get_request_owner(owner_type)
 
         try:
-            queryset_union = queryset.none()
-            for owner in owner_information:
-                queryset_union |= queryset.find_by_owner(**owner)
-
-            return queryset_union
+            owners = self.__get_request_owner(owner_type)
+            return queryset.owned_by(*owners)
         except Exception:  # pylint: disable=broad-except
             return queryset.none()
 
     def __get_request_owner(self, owner_type):
         """Returns the owners of the tag to filter the queryset."""
-        site = self.__get_site()
-        user = self.__get_user()
+        site = self.__get_request_site()
+        user = self.request.user
 
         if not owner_type:
             return [site, user]
@@ -294,20 +901,16 @@ class TagViewSet(viewsets.ModelViewSet):
 
         return []
 
-    def __get_site(self):
-        """Returns the current site."""
-        site = get_site()
-
-        return {
-            "owner_id": {"id": site.id},
-            "owner_type": "site",
-        }
-
-    def __get_user(self):
-        """Returns the current user."""
-        user = self.request.user
-
-        return {
-            "owner_id": {"username": user.username},
-            "owner_type": "user",
-        }
+    def __can_read_from_replica(self):
+        """Returns whether the tags of the requester can be read from the replica."""
+        try:
+            owners = self.__get_request_owner(self.request.query_params.get("owner_type"))
+        except Exception:  # pylint: disable=broad-except
+            return False
+        return can_read_from_replica(owners)
+
+    def __get_request_site(self):
+        """Returns the current site, resolved once per request."""
+        if not hasattr(self, "_request_site"):
+            self._request_site = get_site()  # pylint: disable=attribute-defined-outside-init
+        return self._request_site
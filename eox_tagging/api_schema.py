@@ -49,9 +49,9 @@ api_info = make_api_info(
     info such as: Access level, or timestamps for when the tag should be considered\
     active. \
 
-    eox tagging is meant to be a lightweight plugin with emphasis on flexibility,\
-    most of the logic regarding the deactivation of tags at a given time must be\
-    handled separately.
+    eox tagging is meant to be a lightweight plugin with emphasis on flexibility.\
+    Tags are not deactivated automatically when their expiration date is reached,\
+    run the `deactivate_expired_tags` management command periodically to do it.
     """),
 )
 
@@ -38,3 +38,14 @@ class EoxTaggingConfig(AppConfig):
             },
         }
     }
+
+    def ready(self):
+        """Registers the system checks and the resolution cache invalidation hooks of the plugin."""
+        # pylint: disable=import-outside-toplevel, unused-import
+        from django.conf import settings
+
+        from eox_tagging import checks
+        from eox_tagging.resolution_cache import connect_invalidation_hooks
+
+        if not getattr(settings, "EOX_TAGGING_SKIP_VALIDATIONS", False):  # Platform models are replaced in tests
+            connect_invalidation_hooks()
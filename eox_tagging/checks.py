@@ -0,0 +1,35 @@
+"""
+System checks of the eox_tagging settings.
+"""
+from django.conf import settings
+from django.core.checks import Error, register
+from django.core.exceptions import ValidationError
+
+from eox_tagging.models import Tag
+from eox_tagging.validators import compile_validation_plan
+
+
+@register()
+def check_tag_definitions(app_configs, **kwargs):  # pylint: disable=unused-argument
+    """Compiles every definition of EOX_TAGGING_DEFINITIONS and reports the wrongly configured ones."""
+    errors = []
+
+    for index, definition in enumerate(getattr(settings, "EOX_TAGGING_DEFINITIONS", [])):
+        if not isinstance(definition, dict) or not definition.get("tag_type"):
+            errors.append(Error(
+                f"The definition at position {index} of EOX_TAGGING_DEFINITIONS doesn't have a tag_type.",
+                id="eox_tagging.E001",
+            ))
+            continue
+
+        try:
+            compile_validation_plan(definition, Tag)
+        except ValidationError as validation_error:
+            errors.append(Error(
+                f"The definition of the tag_type '{definition['tag_type']}' is wrongly configured: "
+                f"{' '.join(validation_error.messages)}",
+                hint="Fix the definition in EOX_TAGGING_DEFINITIONS, tags of this type can't be created.",
+                id="eox_tagging.E002",
+            ))
+
+    return errors
@@ -0,0 +1,160 @@
+"""
+Two-tier cache used to resolve content types by model name.
+
+The first tier is a small process-local LRU mapping `(app_label, model)` to the content type
+id, the instance itself is always obtained from Django's own `ContentType.objects.get_for_id`
+cache. The second tier is the shared Django cache, so a cold process doesn't need to query the
+database. Loads are single-flight inside the process and guarded by a short lived lock in the
+shared cache so a cold key doesn't make every worker hit the database at once.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.core.exceptions import ObjectDoesNotExist
+
+CACHE_CONTENT_TYPE_TIMEOUT = 24 * 60 * 60
+CACHE_CONTENT_TYPE_KEY = "eox_tagging_content_type_id_{app_label}_{model}"
+CACHE_CONTENT_TYPE_LOCK_TIMEOUT = 10
+CACHE_CONTENT_TYPE_LOCK_WAIT = 0.05
+CACHE_CONTENT_TYPE_LOCK_RETRIES = 20
+LOCAL_CACHE_SIZE = 128
+
+
+class ContentTypeCache:
+    """
+    Resolves content types by model name and, optionally, app label.
+
+    Attributes:
+        max_size: number of content types kept in the local tier.
+        stats: hit and miss counters of each tier.
+    """
+
+    def __init__(self, max_size=LOCAL_CACHE_SIZE):
+        self.max_size = max_size
+        self._local = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        self.stats = {}
+        self.reset_stats()
+
+    def get(self, model, app_label=None):
+        """
+        Returns the content type of model.
+
+        Raises:
+            ObjectDoesNotExist if there is no content type for model.
+        """
+        key = ((app_label or "").lower(), model.lower())
+        ctype_id = self.__get_local(key)
+
+        if ctype_id is not None:
+            try:
+                ctype = ContentType.objects.get_for_id(ctype_id)
+                self.__count("local_hits")
+                return ctype
+            except ObjectDoesNotExist:
+                self.__evict(key)
+                cache.delete(CACHE_CONTENT_TYPE_KEY.format(app_label=key[0], model=key[1]))
+
+        with self.__get_key_lock(key):
+            ctype_id = self.__get_local(key)  # Loaded by another thread while waiting
+            if ctype_id is None:
+                ctype_id = self.__load(key)
+                self.__set_local(key, ctype_id)
+
+        return ContentType.objects.get_for_id(ctype_id)
+
+    def clear(self):
+        """Empties the local tier."""
+        with self._lock:
+            self._local.clear()
+
+    def reset_stats(self):
+        """Sets every counter to zero."""
+        self.stats = {
+            "local_hits": 0,
+            "shared_hits": 0,
+            "misses": 0,
+        }
+
+    def __load(self, key):
+        """Gets the content type id from the shared cache or the database."""
+        shared_key = CACHE_CONTENT_TYPE_KEY.format(app_label=key[0], model=key[1])
+        lock_key = f"{shared_key}_lock"
+
+        acquired = False
+        for _ in range(CACHE_CONTENT_TYPE_LOCK_RETRIES):
+            ctype_id = cache.get(shared_key)
+            if ctype_id is not None:
+                self.__count("shared_hits")
+                return ctype_id
+
+            acquired = cache.add(lock_key, True, timeout=CACHE_CONTENT_TYPE_LOCK_TIMEOUT)
+            if acquired:
+                break
+
+            # Another worker is loading the key
+            time.sleep(CACHE_CONTENT_TYPE_LOCK_WAIT)
+
+        # Without the lock the key is loaded anyway, but the lock of the worker that owns it is kept
+        try:
+            ctype_id = self.__query(key)
+            cache.set(shared_key, ctype_id, timeout=CACHE_CONTENT_TYPE_TIMEOUT)
+        finally:
+            if acquired:
+                cache.delete(lock_key)
+
+        return ctype_id
+
+    def __query(self, key):
+        """Gets the content type id from the database."""
+        self.__count("misses")
+        app_label, model = key
+
+        if app_label:
+            return ContentType.objects.get_by_natural_key(app_label, model).id
+
+        return ContentType.objects.get(model=model).id
+
+    def __get_local(self, key):
+        """Returns the content type id stored in the local tier."""
+        with self._lock:
+            ctype_id = self._local.get(key)
+            if ctype_id is not None:
+                self._local.move_to_end(key)
+            return ctype_id
+
+    def __set_local(self, key, ctype_id):
+        """Stores the content type id in the local tier evicting the least recently used."""
+        with self._lock:
+            self._local[key] = ctype_id
+            self._local.move_to_end(key)
+            while len(self._local) > self.max_size:
+                self._local.popitem(last=False)
+
+    def __evict(self, key):
+        """Removes a stale content type id from the local tier."""
+        with self._lock:
+            self._local.pop(key, None)
+            self._key_locks.pop(key, None)
+
+    def __get_key_lock(self, key):
+        """Returns the lock used to load key only once in the process."""
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def __count(self, counter):
+        """Increments a stats counter."""
+        with self._lock:
+            self.stats[counter] += 1
+
+
+content_type_cache = ContentTypeCache()
+
+
+def get_content_type(model, app_label=None):
+    """Returns the content type of model using the shared two-tier cache."""
+    return content_type_cache.get(model, app_label=app_label)
@@ -0,0 +1,120 @@
+"""
+Database router of the eox_tagging models.
+
+It's installed by the production settings when `EOX_TAGGING_DATABASE_ROUTING` is enabled. Writes
+and migrations of the plugin models go to `EOX_TAGGING_DATABASE`. Reads go there too, except the
+ones done inside `read_from_replica`, used by the list, retrieve and export endpoints, which go to
+`EOX_TAGGING_READ_DATABASE`. The tags of an owner that were just created or deleted are read from the
+write database for `EOX_TAGGING_READ_YOUR_WRITES_TIMEOUT` seconds, so the requester sees its own writes
+despite the replication lag, and the ETags and caches of the API are never built from a lagging replica.
+
+The tags reference content types, so both aliases must reach a database that has the contenttypes
+table, e.g. the primary database through a separate connection and one of its replicas.
+"""
+import contextvars
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+
+APP_LABEL = "eox_tagging"
+PINNED_KEY = "eox_tagging_pinned_{owner_type_id}_{owner_id}"
+
+_replica_reads = contextvars.ContextVar("eox_tagging_replica_reads", default=False)
+
+
+def get_write_database():
+    """Returns the alias of the database where the plugin models are written."""
+    return getattr(settings, "EOX_TAGGING_DATABASE", None) or "default"
+
+
+def get_read_database():
+    """Returns the alias of the replica read by the API, the write database if there isn't one."""
+    return getattr(settings, "EOX_TAGGING_READ_DATABASE", None) or get_write_database()
+
+
+def pin_owners(owners):
+    """
+    Sends the replica reads of the tags of the given (owner_type_id, owner_object_id) pairs to the
+    write database for the read-your-writes window.
+    """
+    timeout = getattr(settings, "EOX_TAGGING_READ_YOUR_WRITES_TIMEOUT", 0)
+    if timeout:
+        cache.set_many({get_pinned_key(*owner): True for owner in owners}, timeout=timeout)
+
+
+def can_read_from_replica(owners):
+    """Returns whether the tags of the given model instances can be read from the replica."""
+    if get_read_database() == get_write_database():
+        return False
+
+    keys = [
+        get_pinned_key(ContentType.objects.get_for_model(owner).id, owner.pk)
+        for owner in owners
+        if owner is not None and owner.pk is not None
+    ]
+    return not cache.get_many(keys)
+
+
+def get_pinned_key(owner_type_id, owner_id):
+    """Returns the cache key that pins the tags of an owner to the write database."""
+    return PINNED_KEY.format(owner_type_id=owner_type_id, owner_id=owner_id)
+
+
+@contextmanager
+def read_from_replica(enabled=True):
+    """Sends the reads of the plugin models done inside the block to the replica if enabled."""
+    token = _replica_reads.set(enabled)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+def iter_from_replica(iterable, enabled=True):
+    """
+    Yields the items of iterable, reading each one from the replica if enabled.
+
+    The replica is only used while the next item is read, so the block never spans a yield and
+    works with lazy responses consumed after the view returns.
+    """
+    iterator = iter(iterable)
+    while True:
+        with read_from_replica(enabled):
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+        yield item
+
+
+class TaggingRouter:
+    """Routes the plugin models to the write database and the API reads to the replica."""
+
+    def db_for_read(self, model, **hints):
+        """Returns the replica inside `read_from_replica`, the write database otherwise."""
+        if model._meta.app_label != APP_LABEL:  # pylint: disable=protected-access
+            return None
+        if hints.get("instance") is not None:
+            return hints["instance"]._state.db  # pylint: disable=protected-access
+        return get_read_database() if _replica_reads.get() else get_write_database()
+
+    def db_for_write(self, model, **hints):  # pylint: disable=unused-argument
+        """Returns the write database of the plugin models."""
+        if model._meta.app_label != APP_LABEL:  # pylint: disable=protected-access
+            return None
+        return get_write_database()
+
+    def allow_relation(self, obj1, obj2, **hints):  # pylint: disable=unused-argument
+        """Allows the relations between objects of the default, write and read databases."""
+        databases = {"default", get_write_database(), get_read_database()}
+        if obj1._state.db in databases and obj2._state.db in databases:  # pylint: disable=protected-access
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, **hints):  # pylint: disable=unused-argument
+        """Migrates the plugin models in the write database only, the read database is its replica."""
+        if app_label != APP_LABEL:
+            return None
+        return db == get_write_database()
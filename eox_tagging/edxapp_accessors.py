@@ -3,12 +3,17 @@ import crum
 from django.conf import settings
 from django.contrib.auth.models import User
 from django.contrib.sites.models import Site
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import Exists, OuterRef, Q
 from eox_core.edxapp_wrapper.certificates import get_generated_certificate
-from eox_core.edxapp_wrapper.users import get_edxapp_user
+from eox_core.edxapp_wrapper.configuration_helpers import get_configuration_helper
+from eox_core.edxapp_wrapper.users import get_edxapp_user, get_user_attribute, get_user_signup_source
+from opaque_keys import InvalidKeyError
 from opaque_keys.edx.keys import CourseKey
 
 from eox_tagging.edxapp_wrappers.course_overview import CourseOverview
 from eox_tagging.edxapp_wrappers.enrollments import CourseEnrollment
+from eox_tagging.resolution_cache import resolution_cache
 
 GeneratedCertificate = get_generated_certificate()
 
@@ -45,16 +50,59 @@ def get_site(**_kwargs):
 
 
 def get_course_enrollment(**kwargs):
-    """Function used to get enrollments from the platform."""
+    """
+    Function used to get enrollments from the platform.
+
+    The enrollment is loaded with one query joining the user, the site membership of the user is
+    checked in the same query.
+    """
     username = kwargs.get("username")
     course_id = kwargs.get("course_id")
 
     if getattr(settings, "EOX_TAGGING_SKIP_VALIDATIONS", False):
         return object
 
-    user = get_user(**{"target_id": username})
     course_id = CourseKey.from_string(course_id)
-    return CourseEnrollment.objects.get(user_id=user.id, course_id=course_id)
+    site = crum.get_current_request().site
+    return get_enrollment_queryset(site).get(user__username=username, course_id=course_id)
+
+
+def get_enrollment_queryset(site):
+    """Returns the enrollments of the users that belong to site."""
+    return CourseEnrollment.objects.select_related("user").filter(get_site_membership_filter(site))
+
+
+def get_site_membership_filter(site, user_field="user"):
+    """
+    Returns the condition that keeps the rows whose user belongs to site.
+
+    The site sources enabled in EOX_CORE_USER_ORIGIN_SITE_SOURCES, the ones checked by eox-core
+    when getting a user, are translated into subqueries so the check doesn't need extra queries. The
+    translation is tested against the FetchUserSiteSources methods of eox-core for every source.
+
+    Arguments:
+        - site: site the users must belong to.
+        - user_field: name of the user relation of the filtered model, None to filter the users.
+    """
+    sources = get_configuration_helper().get_value(
+        "EOX_CORE_USER_ORIGIN_SITE_SOURCES",
+        getattr(settings, "EOX_CORE_USER_ORIGIN_SITE_SOURCES", []),
+    )
+    if "fetch_from_unfiltered_table" in sources:
+        return Q()
+
+    domain = getattr(site, "domain", None)
+    user_id = OuterRef(f"{user_field}_id" if user_field else "pk")
+    condition = Q(pk__in=[])
+
+    if "fetch_from_user_signup_source" in sources:
+        condition |= Q(Exists(get_user_signup_source().objects.filter(user_id=user_id, site=domain)))
+    if "fetch_from_created_on_site_prop" in sources and domain:
+        condition |= Q(Exists(
+            get_user_attribute().objects.filter(user_id=user_id, name="created_on_site", value=domain)
+        ))
+
+    return condition
 
 
 def get_certificate(**kwargs):
@@ -74,7 +122,11 @@ def get_certificate(**kwargs):
 
 
 def get_object_from_edxapp(object_type, **kwargs):
-    """Helper function to get objects from edx-platfrom given its identifiers."""
+    """
+    Helper function to get objects from edx-platfrom given its identifiers.
+
+    The objects, and the targets that don't exist, are kept for a short time in the resolution cache.
+    """
     related_objects = {
         "user": get_user,
         "courseoverview": get_course,
@@ -83,4 +135,175 @@ def get_object_from_edxapp(object_type, **kwargs):
         "generatedcertificate": get_certificate,
     }
     related_object = related_objects.get(object_type.lower())
-    return related_object(**kwargs)
+    return resolution_cache.resolve(
+        object_type,
+        get_identifier_key(object_type, kwargs),
+        lambda: related_object(**kwargs),
+        site=get_request_site(),
+    )
+
+
+def get_request_site():
+    """Returns the site of the current request, None outside of a request."""
+    return getattr(crum.get_current_request(), "site", None)
+
+
+def get_users(identifiers):
+    """
+    Batch version of get_user, returns a dictionary mapping every username to its user. All the
+    users are resolved with one query, that checks their site membership like eox-core.
+    """
+    usernames = {identifier.get("target_id") for identifier in identifiers}
+    users = User.objects.filter(username__in=usernames)
+    if not getattr(settings, "EOX_TAGGING_SKIP_VALIDATIONS", False):  # Skip these validations while testing
+        users = users.filter(get_site_membership_filter(crum.get_current_request().site, user_field=None))
+
+    return {user.username: user for user in users}
+
+
+def get_courses(identifiers):
+    """
+    Batch version of get_course, returns a dictionary mapping every course_id to its course.
+
+    The existing overviews are loaded with one query, the missing ones are loaded with get_from_id
+    like get_course, which creates the overview of a course that exists in the modulestore.
+    """
+    course_keys = {CourseKey.from_string(identifier.get("target_id")) for identifier in identifiers}
+    if getattr(settings, "EOX_TAGGING_SKIP_VALIDATIONS", False):  # Skip these validations while testing
+        return {str(course_key): object for course_key in course_keys}
+
+    courses = {str(course.id): course for course in CourseOverview.objects.filter(id__in=course_keys)}
+    for course_key in course_keys:
+        if str(course_key) in courses:
+            continue
+        try:
+            courses[str(course_key)] = CourseOverview.get_from_id(course_key)
+        except ObjectDoesNotExist:
+            continue
+
+    return courses
+
+
+def get_course_enrollments(identifiers):
+    """
+    Batch version of get_course_enrollment, returns a dictionary mapping every `(username, course_id)`
+    pair to its enrollment. All the pairs are resolved with one query.
+    """
+    pairs = get_user_course_pairs(identifiers)
+    if not pairs:
+        return {}
+    if getattr(settings, "EOX_TAGGING_SKIP_VALIDATIONS", False):  # Skip these validations while testing
+        return {key: object for key in pairs.values()}
+
+    site = crum.get_current_request().site
+    enrollments = get_enrollment_queryset(site).filter(
+        user__username__in={username for username, _ in pairs},
+        course_id__in={CourseKey.from_string(course_id) for _, course_id in pairs},
+    )
+    return get_pair_objects(enrollments, pairs)
+
+
+def get_user_course_pairs(identifiers):
+    """
+    Returns a dictionary mapping the normalized `(username, course_id)` pair of every identifier
+    to the pair used as key by the batch resolvers. Identifiers with invalid course keys are skipped.
+    """
+    pairs = {}
+    for identifier in identifiers:
+        username, course_id = identifier.get("username"), identifier.get("course_id")
+        try:
+            pairs[(username, str(CourseKey.from_string(course_id)))] = (username, course_id)
+        except InvalidKeyError:
+            continue
+    return pairs
+
+
+def get_pair_objects(objects, pairs):
+    """Maps the objects with user and course_id fields to the keys of their `(username, course_id)` pairs."""
+    return {
+        pairs[(obj.user.username, str(obj.course_id))]: obj
+        for obj in objects
+        if (obj.user.username, str(obj.course_id)) in pairs
+    }
+
+
+def get_certificates(identifiers):
+    """
+    Batch version of get_certificate, returns a dictionary mapping every verify_uuid or
+    `(username, course_id)` pair to its certificate. Each kind of identifier is resolved with one query.
+    """
+    verify_uuids = {identifier["target_id"] for identifier in identifiers if identifier.get("target_id")}
+    certificates = {
+        certificate.verify_uuid: certificate
+        for certificate in GeneratedCertificate.objects.filter(verify_uuid__in=verify_uuids)
+    } if verify_uuids else {}
+
+    pairs = get_user_course_pairs([identifier for identifier in identifiers if not identifier.get("target_id")])
+    if pairs:
+        pair_certificates = GeneratedCertificate.objects.select_related("user").filter(
+            user__username__in={username for username, _ in pairs},
+            course_id__in={CourseKey.from_string(course_id) for _, course_id in pairs},
+        )
+        certificates.update(get_pair_objects(pair_certificates, pairs))
+
+    return certificates
+
+
+def get_identifier_key(object_type, identifier):
+    """Returns the key used by the batch resolvers to map the identifier to its object."""
+    object_type = object_type.lower()
+    if object_type == "courseoverview":
+        return str(CourseKey.from_string(identifier.get("target_id")))
+    if object_type in ["courseenrollment", "generatedcertificate"] and not identifier.get("target_id"):
+        return (identifier.get("username"), identifier.get("course_id"))
+    return identifier.get("target_id")
+
+
+def get_objects_from_edxapp(object_type, identifiers):
+    """
+    Batch version of get_object_from_edxapp, used to resolve many targets of the same type at once.
+    Only the objects missing from the resolution cache are resolved.
+
+    Arguments:
+        - object_type: type of the objects to resolve.
+        - identifiers: list of keyword arguments accepted by get_object_from_edxapp.
+
+    Returns:
+        A list with the object of every identifier, None for the objects that were not found.
+    """
+    batch_resolvers = {
+        "user": get_users,
+        "courseoverview": get_courses,
+        "courseenrollment": get_course_enrollments,
+        "generatedcertificate": get_certificates,
+    }
+    batch_resolver = batch_resolvers.get(object_type.lower())
+    keys = []
+    unique_identifiers = {}
+
+    for identifier in identifiers:
+        try:
+            key = get_identifier_key(object_type, identifier)
+        except Exception:  # pylint: disable=broad-except
+            key = None
+        keys.append(key)
+        if key is not None:
+            unique_identifiers.setdefault(key, identifier)
+
+    if batch_resolver:
+        site = get_request_site()
+        objects = resolution_cache.get_many(object_type, list(unique_identifiers), site=site)
+        resolved = batch_resolver([
+            identifier for key, identifier in unique_identifiers.items() if key not in objects
+        ])
+        resolution_cache.set_many(object_type, resolved, site=site)
+        objects.update(resolved)
+    else:
+        objects = {}
+        for key, identifier in unique_identifiers.items():
+            try:
+                objects[key] = get_object_from_edxapp(object_type, **identifier)
+            except Exception:  # pylint: disable=broad-except
+                continue
+
+    return [objects.get(key) if key is not None else None for key in keys]
@@ -0,0 +1,91 @@
+"""
+Deactivation of the tags that reached their expiration date.
+
+The expired tags are found through the `(inactivated_at, expiration_date)` index and deactivated
+with bounded UPDATE batches that have the same semantics as `TagQuerySet.delete`. A lock in the
+shared cache makes sure only one node sweeps at a time. The lock holds a token of the sweep that
+took it, it's renewed before every batch and only released by its owner, so a sweep that outlives
+the lock timeout stops instead of running next to the sweep that took the lock after it.
+"""
+import logging
+import time
+import uuid
+
+from django.core.cache import cache
+from django.utils import timezone
+
+from eox_tagging.models import Tag
+
+log = logging.getLogger(__name__)
+
+SWEEP_LOCK_KEY = "eox_tagging_expiration_sweep_lock"
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_LOCK_TIMEOUT = 60 * 60
+
+
+def deactivate_expired_tags(batch_size=DEFAULT_BATCH_SIZE, lock_timeout=DEFAULT_LOCK_TIMEOUT, now=None):
+    """
+    Deactivates the active tags whose expiration date is reached.
+
+    The tags are deactivated with one UPDATE per batch of batch_size tags, in expiration order, so the
+    rows locked by each statement are bounded. The expiration time is fixed when the sweep starts.
+
+    Arguments:
+        - batch_size: number of tags deactivated per query.
+        - lock_timeout: seconds after which the lock expires if the sweep dies without releasing it.
+        - now: expiration time, now by default.
+
+    Returns:
+        A dictionary with the number of tags deactivated, the number of batches, the elapsed seconds
+        and the tags deactivated per second, or None if another node is already sweeping.
+    """
+    token = uuid.uuid4().hex
+    if not cache.add(SWEEP_LOCK_KEY, token, timeout=lock_timeout):
+        log.info("EOX_TAGGING | Expiration sweep skipped, another sweep is running")
+        return None
+
+    now = now or timezone.now()
+    start = time.perf_counter()
+    stats = {
+        "deactivated": 0,
+        "batches": 0,
+    }
+
+    try:
+        while True:
+            if not _renew_lock(token, lock_timeout):
+                log.warning("EOX_TAGGING | Expiration sweep stopped, its lock expired and was taken by another sweep")
+                break
+
+            expired = Tag.objects.expired(at=now).order_by("expiration_date")
+            ids = list(expired.values_list("id", flat=True)[:batch_size])
+            if not ids:
+                break
+
+            stats["deactivated"] += Tag.objects.filter(id__in=ids).active().delete()
+            stats["batches"] += 1
+    finally:
+        _release_lock(token)
+
+    stats["seconds"] = time.perf_counter() - start
+    stats["tags_per_second"] = stats["deactivated"] / stats["seconds"] if stats["seconds"] else 0
+    log.info(
+        "EOX_TAGGING | Expiration sweep deactivated %s tags in %s batches (%.2fs, %.1f tags/s)",
+        stats["deactivated"],
+        stats["batches"],
+        stats["seconds"],
+        stats["tags_per_second"],
+    )
+
+    return stats
+
+
+def _renew_lock(token, lock_timeout):
+    """Extends the sweep lock by lock_timeout seconds, returns False if it's no longer held by token."""
+    return cache.get(SWEEP_LOCK_KEY) == token and cache.touch(SWEEP_LOCK_KEY, lock_timeout)
+
+
+def _release_lock(token):
+    """Releases the sweep lock if it's still held by token."""
+    if cache.get(SWEEP_LOCK_KEY) == token:
+        cache.delete(SWEEP_LOCK_KEY)
@@ -0,0 +1,80 @@
+"""
+Generation counters of the tags of each owner, used to build the ETags of the tags API.
+
+Every site or user that owns tags has a counter in the Django cache named by
+`EOX_TAGGING_GENERATION_CACHE`, bumped when one of its tags is created or deleted. A response
+built from the tags of some owners is unchanged while their counters are. The counters are bumped
+when the transaction commits, so a reader can't pair a new generation with the old tags. A missing
+counter starts from the current time in microseconds, so a counter evicted from the cache never
+goes back to a value already handed out.
+"""
+import time
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import caches
+from django.db import transaction
+
+from eox_tagging.db_router import pin_owners
+
+GENERATION_KEY = "eox_tagging_generation_{owner_type_id}_{owner_id}"
+
+
+def get_generation_cache():
+    """Returns the Django cache where the counters are stored."""
+    return caches[getattr(settings, "EOX_TAGGING_GENERATION_CACHE", "default")]
+
+
+def get_generation_key(owner_type_id, owner_id):
+    """Returns the cache key of the counter of an owner."""
+    return GENERATION_KEY.format(owner_type_id=owner_type_id, owner_id=owner_id)
+
+
+def get_generations(owners):
+    """
+    Returns the counters of the given model instances, in the same order, with one cache read.
+
+    The missing counters are initialized.
+    """
+    keys = [
+        get_generation_key(ContentType.objects.get_for_model(owner).id, owner.pk)
+        for owner in owners
+        if owner is not None and owner.pk is not None
+    ]
+    backend = get_generation_cache()
+    generations = backend.get_many(keys)
+
+    for key in keys:
+        if key not in generations:
+            backend.add(key, time.time_ns() // 1000, timeout=None)
+            generations[key] = backend.get(key)
+
+    return [generations[key] for key in keys]
+
+
+def bump_generations(owners, using=None):
+    """
+    Increments the counters of the given (owner_type_id, owner_object_id) pairs when the current
+    transaction commits. The owners are pinned to the write database at the same time, so the
+    new generations are never paired with the tags of a lagging replica.
+    """
+    owners = {(owner_type_id, owner_id) for owner_type_id, owner_id in owners if owner_id is not None}
+    if not owners:
+        return
+
+    def on_commit():
+        pin_owners(owners)
+        _increment([get_generation_key(owner_type_id, owner_id) for owner_type_id, owner_id in owners])
+
+    transaction.on_commit(on_commit, using=using)
+
+
+def _increment(keys):
+    """Increments the counters of keys, initializing the missing ones."""
+    backend = get_generation_cache()
+    for key in keys:
+        if not backend.add(key, time.time_ns() // 1000, timeout=None):
+            try:
+                backend.incr(key)
+            except ValueError:
+                backend.add(key, time.time_ns() // 1000, timeout=None)
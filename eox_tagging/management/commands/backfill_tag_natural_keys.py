@@ -0,0 +1,56 @@
+"""
+Management command to store the natural keys of the tagged objects in existing tags.
+"""
+import logging
+
+from django.core.management.base import BaseCommand
+
+from eox_tagging.models import Tag, get_natural_key
+
+log = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+class Command(BaseCommand):
+    """
+    Fills Tag.target_key and Tag.owner_key for tags created before those columns existed.
+
+    The tags are walked in primary key order in chunks, so the command can be stopped and
+    executed again at any moment.
+
+    Example:
+        ./manage.py lms backfill_tag_natural_keys --chunk-size 500
+    """
+    help = "Stores the natural keys of the target and owner objects in tags that don't have them."
+
+    def add_arguments(self, parser):
+        """Adds the command arguments."""
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help="Number of tags updated per query.",
+        )
+
+    def handle(self, *args, **options):
+        """Walks the tags without natural keys and fills them chunk by chunk."""
+        chunk_size = options["chunk_size"]
+        queryset = Tag.objects.filter(target_key=None, target_type__isnull=False).order_by("id")
+        last_id = 0
+        updated = 0
+
+        while True:
+            chunk = list(queryset.filter(id__gt=last_id).prefetch_related("target_object", "owner_object")[:chunk_size])
+            if not chunk:
+                break
+
+            for tag in chunk:
+                tag.target_key = get_natural_key(tag.target_object)
+                tag.owner_key = get_natural_key(tag.owner_object)
+
+            updated += Tag.objects.bulk_update(chunk, ["target_key", "owner_key"])
+            last_id = chunk[-1].id
+            log.info("EOX_TAGGING | Backfilled natural keys up to tag %s", last_id)
+
+        self.stdout.write(f"Backfilled natural keys of {updated} tags.")
@@ -0,0 +1,47 @@
+"""
+Management command to deactivate the tags that reached their expiration date.
+"""
+from django.core.management.base import BaseCommand
+
+from eox_tagging.expiration import DEFAULT_BATCH_SIZE, DEFAULT_LOCK_TIMEOUT, deactivate_expired_tags
+
+
+class Command(BaseCommand):
+    """
+    Soft deletes the active tags whose expiration date is reached, in batches.
+
+    Only one node sweeps at a time, if the command runs while another sweep holds the lock
+    it exits without deactivating anything. Meant to be executed periodically, e.g. by cron.
+
+    Example:
+        ./manage.py lms deactivate_expired_tags --batch-size 500
+    """
+    help = "Deactivates the active tags whose expiration date is reached."
+
+    def add_arguments(self, parser):
+        """Adds the command arguments."""
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help="Number of tags deactivated per query.",
+        )
+        parser.add_argument(
+            "--lock-timeout",
+            type=int,
+            default=DEFAULT_LOCK_TIMEOUT,
+            help="Seconds after which the sweep lock expires if the command dies without releasing it.",
+        )
+
+    def handle(self, *args, **options):
+        """Deactivates the expired tags and reports the throughput."""
+        stats = deactivate_expired_tags(batch_size=options["batch_size"], lock_timeout=options["lock_timeout"])
+
+        if stats is None:
+            self.stdout.write("Another expiration sweep is running, nothing was deactivated.")
+            return
+
+        self.stdout.write(
+            f"Deactivated {stats['deactivated']} expired tags in {stats['batches']} batches "
+            f"({stats['seconds']:.2f}s, {stats['tags_per_second']:.1f} tags/s)."
+        )
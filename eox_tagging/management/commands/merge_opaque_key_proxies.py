@@ -0,0 +1,24 @@
+"""
+Management command to fold duplicated opaque key proxies together.
+"""
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand
+
+from eox_tagging.models import OpaqueKeyProxyModel, Tag, merge_opaque_key_proxies
+
+
+class Command(BaseCommand):
+    """
+    Keeps the oldest OpaqueKeyProxyModel of every opaque key, repoints the tags of the
+    duplicated proxies to it and removes the duplicates.
+
+    Example:
+        ./manage.py lms merge_opaque_key_proxies
+    """
+    help = "Merges duplicated opaque key proxies and repoints their tags."
+
+    def handle(self, *args, **options):
+        """Merges the duplicated proxies."""
+        removed = merge_opaque_key_proxies(OpaqueKeyProxyModel, Tag, ContentType)
+
+        self.stdout.write(f"Removed {removed} duplicated opaque key proxies.")
@@ -0,0 +1,70 @@
+"""
+Management command to rebuild the tag summaries of every target.
+"""
+import logging
+
+from django.core.management.base import BaseCommand
+
+from eox_tagging.models import SUMMARY_REFRESH_BATCH_SIZE, Tag, TagSummary
+
+log = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Recomputes the summaries of the targets with active tags and drops the stale ones.
+
+    The existing summaries are refreshed first, which removes the ones whose target lost its tags,
+    and then the targets of the active tags are refreshed, which creates the missing ones. Every
+    batch is refreshed in its own transaction, so the summaries stay readable during the rebuild.
+
+    Example:
+        ./manage.py lms rebuild_tag_summaries --batch-size 500
+    """
+    help = "Rebuilds the summaries of the active tags of every target."
+
+    def add_arguments(self, parser):
+        """Adds the command arguments."""
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=SUMMARY_REFRESH_BATCH_SIZE,
+            help="Number of targets refreshed per transaction.",
+        )
+
+    def handle(self, *args, **options):
+        """Refreshes the summaries of the existing targets and of the targets of the active tags."""
+        batch_size = options["batch_size"]
+        sources = [
+            TagSummary.objects.order_by("target_type_id", "target_object_id"),
+            Tag.objects.active().exclude(target_object_id=None).order_by("target_type_id", "target_object_id"),
+        ]
+        refreshed = 0
+
+        for queryset in sources:
+            targets = queryset.values_list("target_type_id", "target_object_id").distinct()
+            last_target = None
+
+            while True:
+                batch = list(self.__after(targets, last_target)[:batch_size])
+                if not batch:
+                    break
+
+                TagSummary.objects.refresh(batch)
+                refreshed += len(batch)
+                last_target = batch[-1]
+                log.info("EOX_TAGGING | Refreshed tag summaries up to target %s", last_target)
+
+        self.stdout.write(f"Refreshed the summaries of {refreshed} targets, {TagSummary.objects.count()} stored.")
+
+    @staticmethod
+    def __after(targets, last_target):
+        """Returns the targets ordered after last_target."""
+        if last_target is None:
+            return targets
+
+        ctype_id, object_id = last_target
+        return targets.filter(target_type_id__gte=ctype_id).exclude(
+            target_type_id=ctype_id,
+            target_object_id__lte=object_id,
+        )
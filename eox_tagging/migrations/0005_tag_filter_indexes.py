@@ -0,0 +1,33 @@
+# Generated by Django 4.2.23 on 2026-10-18 16:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('eox_tagging', '0004_tag_target_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='tag',
+            index=models.Index(fields=['owner_type', 'owner_object_id', 'inactivated_at'], name='owner_active_index'),
+        ),
+        migrations.AddIndex(
+            model_name='tag',
+            index=models.Index(fields=['tag_type', 'tag_value'], name='tag_type_value_index'),
+        ),
+        migrations.AddIndex(
+            model_name='tag',
+            index=models.Index(fields=['created_at'], name='created_at_index'),
+        ),
+        migrations.AddIndex(
+            model_name='tag',
+            index=models.Index(fields=['activation_date'], name='activation_date_index'),
+        ),
+        migrations.AddIndex(
+            model_name='tag',
+            index=models.Index(fields=['expiration_date'], name='expiration_date_index'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.23 on 2026-10-18 16:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('eox_tagging', '0005_tag_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tag',
+            name='owner_key',
+            field=models.CharField(blank=True, editable=False, max_length=512, null=True),
+        ),
+        migrations.AddField(
+            model_name='tag',
+            name='target_key',
+            field=models.CharField(blank=True, editable=False, max_length=512, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='tag',
+            index=models.Index(fields=['target_type', 'target_key'], name='target_key_index'),
+        ),
+        migrations.AddIndex(
+            model_name='tag',
+            index=models.Index(fields=['owner_type', 'owner_key'], name='owner_key_index'),
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 4.2.23 on 2026-10-18 16:35
+
+import opaque_keys.edx.django.models
+from django.db import migrations, transaction
+from django.db.models import Count, Min
+
+
+def merge_duplicated_proxies(apps, schema_editor):  # pylint: disable=unused-argument
+    """
+    Folds duplicated proxies into the oldest one and repoints their tags, so the unique constraint
+    can be created. It's a copy of `merge_opaque_key_proxies` that only uses the historical models.
+
+    The summaries are not refreshed since their table is created later, in 0010, and the cached tags
+    are kept: the repointed tags have the same opaque key, so their representations don't change.
+    """
+    proxy_model = apps.get_model('eox_tagging', 'OpaqueKeyProxyModel')
+    tag_model = apps.get_model('eox_tagging', 'Tag')
+    content_type_model = apps.get_model('contenttypes', 'ContentType')
+
+    proxy_ctype = content_type_model.objects.filter(app_label='eox_tagging', model='opaquekeyproxymodel').first()
+    duplicates = proxy_model.objects.values('opaque_key').annotate(
+        proxies=Count('id'),
+        kept_id=Min('id'),
+    ).filter(proxies__gt=1)
+
+    for duplicate in duplicates:
+        with transaction.atomic():
+            duplicated_proxies = proxy_model.objects.filter(
+                opaque_key=duplicate['opaque_key'],
+            ).exclude(id=duplicate['kept_id'])
+
+            if proxy_ctype:
+                tag_model.objects.filter(
+                    target_type=proxy_ctype,
+                    target_object_id__in=duplicated_proxies.values('id'),
+                ).update(target_object_id=duplicate['kept_id'])
+
+            duplicated_proxies.delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('eox_tagging', '0006_tag_natural_keys'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicated_proxies, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='opaquekeyproxymodel',
+            name='opaque_key',
+            field=opaque_keys.edx.django.models.CourseKeyField(max_length=255, unique=True),
+        ),
+    ]
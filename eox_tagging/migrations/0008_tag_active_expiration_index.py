@@ -0,0 +1,17 @@
+# Generated by Django 4.2.23 on 2026-10-18 16:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('eox_tagging', '0007_opaque_key_unique'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='tag',
+            index=models.Index(fields=['inactivated_at', 'expiration_date'], name='active_expiration_index'),
+        ),
+    ]
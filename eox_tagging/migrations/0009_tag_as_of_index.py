@@ -0,0 +1,17 @@
+# Generated by Django 4.2.23 on 2026-10-18 16:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('eox_tagging', '0008_tag_active_expiration_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='tag',
+            index=models.Index(fields=['created_at', 'inactivated_at'], name='as_of_index'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.23 on 2026-10-18 17:09
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('eox_tagging', '0009_tag_as_of_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TagSummary',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('target_object_id', models.PositiveIntegerField()),
+                ('tags', models.JSONField(default=list)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('target_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='contenttypes.contenttype')),
+            ],
+            options={
+                'verbose_name': 'tag summary',
+                'verbose_name_plural': 'tag summaries',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='tagsummary',
+            constraint=models.UniqueConstraint(fields=('target_type', 'target_object_id'), name='unique_tag_summary_target'),
+        ),
+    ]
@@ -4,14 +4,16 @@ Model to store tags in the database.
 import logging
 import re
 import uuid
+from collections import Counter
 from datetime import datetime
 
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
-from django.core.cache import cache
-from django.core.exceptions import ObjectDoesNotExist
-from django.db import models
+from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from django.db import IntegrityError, models, router, transaction
+from django.db.models import Count, Min, Q
 from django.db.models.query import QuerySet
 from django.utils import timezone
 from opaque_keys.edx.django.models import CourseKeyField
@@ -19,7 +21,10 @@ from opaque_keys.edx.keys import CourseKey
 from six import python_2_unicode_compatible
 
 from eox_tagging.constants import AccessLevel, Status
-from eox_tagging.validators import TagValidators
+from eox_tagging.content_types import get_content_type
+from eox_tagging.generations import bump_generations
+from eox_tagging.tag_cache import invalidate_tags
+from eox_tagging.validators import TagValidators, get_integrity_cache, prefetch_integrity
 
 log = logging.getLogger(__name__)
 
@@ -29,7 +34,111 @@ OPAQUE_KEY_PROXY_MODEL_TARGETS = [
 
 PROXY_MODEL_NAME = "opaquekeyproxymodel"
 
-CACHE_CONTENT_TYPE_TIMEOUT = 24 * 60 * 60
+NATURAL_KEY_SEPARATOR = ":"
+
+SUMMARY_REFRESH_BATCH_SIZE = 500
+
+SUMMARY_TAG_FIELDS = [
+    "key",
+    "tag_type",
+    "tag_value",
+    "access",
+    "activation_date",
+    "expiration_date",
+    "created_at",
+    "owner_type_id",
+    "owner_object_id",
+    "target_type_id",
+    "target_object_id",
+]
+
+WRITTEN_TAG_FIELDS = [
+    "key",
+    "target_type_id",
+    "target_object_id",
+    "owner_type_id",
+    "owner_object_id",
+]
+
+COUNT_GROUP_BY_FIELDS = {
+    "tag_type": "tag_type",
+    "tag_value": "tag_value",
+    "access": "access",
+    "target_type": "target_type__model",
+    "owner_type": "owner_type__model",
+}
+
+NATURAL_KEY_GETTERS = {
+    "user": lambda instance: instance.username,
+    "site": lambda instance: instance.domain,
+    PROXY_MODEL_NAME: lambda instance: str(instance.opaque_key),
+    "courseenrollment": lambda instance: f"{instance.username}{NATURAL_KEY_SEPARATOR}{instance.course_id}",
+    "generatedcertificate": lambda instance: str(instance.verify_uuid) if instance.verify_uuid else None,
+}
+
+
+def get_natural_key(instance):
+    """
+    Returns the natural key used to identify instance in the tag table.
+
+    The natural keys match the identifiers used by the API filters: username for users,
+    the course key for courses, `username:course_id` for enrollments and the verify_uuid
+    for certificates.
+    """
+    if instance is None:
+        return None
+
+    natural_key_getter = NATURAL_KEY_GETTERS.get(instance.__class__.__name__.lower())
+    if not natural_key_getter:
+        return None
+
+    try:
+        return natural_key_getter(instance)
+    except (AttributeError, ObjectDoesNotExist):
+        log.warning("EOX_TAGGING | Could not get the natural key of '%s'", instance.__class__.__name__)
+        return None
+
+
+def get_effective_condition(at):
+    """
+    Returns the condition matched by the tags in force at the given time.
+
+    NULL sorts first in the indexes, so `activation_date IS NULL OR activation_date <= at` is a
+    single range of the activation date index. The expiration window of the active tags is read
+    from the `(inactivated_at, expiration_date)` index.
+    """
+    return (
+        Q(inactivated_at=None)
+        & (Q(activation_date=None) | Q(activation_date__lte=at))
+        & (Q(expiration_date=None) | Q(expiration_date__gt=at))
+    )
+
+
+def get_targets_condition(targets):
+    """Returns the condition matched by the rows of the given (target_type_id, target_object_id) pairs."""
+    object_ids = {}
+    for ctype_id, object_id in targets:
+        object_ids.setdefault(ctype_id, []).append(object_id)
+
+    condition = Q()
+    for ctype_id, ids in object_ids.items():
+        condition |= Q(target_type_id=ctype_id, target_object_id__in=ids)
+    return condition
+
+
+def get_summary_entry(tag):
+    """Returns the compact representation of a tag, read with values(*SUMMARY_TAG_FIELDS), stored in summaries."""
+    return {
+        "key": str(tag["key"]),
+        "tag_type": tag["tag_type"],
+        "tag_value": tag["tag_value"],
+        "access": AccessLevel.get_choice(tag["access"]),
+        "activation_date": tag["activation_date"].isoformat() if tag["activation_date"] else None,
+        "expiration_date": tag["expiration_date"].isoformat() if tag["expiration_date"] else None,
+        "created_at": tag["created_at"].isoformat(),
+        "owner_type": ContentType.objects.get_for_id(tag["owner_type_id"]).model,
+        "owner_id": tag["owner_object_id"],
+    }
 
 
 class TagQuerySet(QuerySet):
@@ -39,11 +148,68 @@ class TagQuerySet(QuerySet):
         """Method used to create tags."""
         target = kwargs.pop("target_object", None)
         if target and target.__class__.__name__.lower() in OPAQUE_KEY_PROXY_MODEL_TARGETS:
-            kwargs["target_object"], _ = OpaqueKeyProxyModel.objects.get_or_create(opaque_key=target.id)
+            kwargs["target_object"], _ = OpaqueKeyProxyModel.objects.get_or_create_by_key(target.id)
         else:
             kwargs["target_object"] = target
-        instance = self.create(**kwargs)
-        return instance
+
+        return self.create(**kwargs)
+
+    def bulk_create_tags(self, tags, batch_size=None):
+        """
+        Method used to validate and create many tags at once.
+
+        The configuration of every tag_type is validated once, the course targets are converted to
+        proxies in one batch, the existence of users, courses, enrollments, sites and certificates is
+        checked with one query per model and the valid tags are inserted with chunked INSERTs inside a
+        transaction, together with the update of the summaries of their targets. Every related object
+        is checked once. Invalid tags don't abort the batch.
+
+        Arguments:
+            - tags: list of unsaved tags.
+            - batch_size: number of tags inserted per query.
+
+        Returns:
+            A tuple with the list of created tags and a dictionary mapping the position of every
+            invalid tag to its error message.
+        """
+        errors = {}
+        valid_tags = []
+
+        self.__set_proxy_targets(tags)
+
+        integrity_cache = get_integrity_cache()
+        if not getattr(settings, "EOX_TAGGING_SKIP_VALIDATIONS", False):
+            prefetch_integrity(tags, integrity_cache)
+
+        for index, tag in enumerate(tags):
+            try:
+                tag.full_clean(integrity_cache=integrity_cache)
+            except ValidationError as validation_error:
+                errors[index] = " ".join(validation_error.messages)
+                continue
+
+            tag.set_natural_keys()
+            valid_tags.append(tag)
+
+        with transaction.atomic(using=self.db):
+            created = self.bulk_create(valid_tags, batch_size=batch_size)
+            TagSummary.objects.db_manager(self.db).add(tag.key for tag in created)
+            bump_generations({(tag.owner_type_id, tag.owner_object_id) for tag in created}, using=self.db)
+
+        return created, errors
+
+    def __set_proxy_targets(self, tags):
+        """Replaces course targets with their opaque key proxies, creating the missing ones in one batch."""
+        course_tags = [
+            tag for tag in tags
+            if tag.target_object and tag.target_object.__class__.__name__.lower() in OPAQUE_KEY_PROXY_MODEL_TARGETS
+        ]
+        if not course_tags:
+            return
+
+        proxies = OpaqueKeyProxyModel.objects.get_or_create_by_keys({tag.target_object.id for tag in course_tags})
+        for tag in course_tags:
+            tag.target_object = proxies[str(tag.target_object.id)]
 
     def active(self):
         """Returns all active tags."""
@@ -53,25 +219,138 @@ class TagQuerySet(QuerySet):
         """Returns all inactive tags."""
         return self.exclude(inactivated_at=None)
 
+    def effective(self, at=None):
+        """
+        Returns the tags in force at the given time, now by default.
+
+        A tag is in force when it's active, its activation date is empty or reached and its
+        expiration date is empty or not reached yet.
+        """
+        return self.filter(get_effective_condition(at or timezone.now()))
+
+    def not_effective(self, at=None):
+        """Returns the tags that are not in force at the given time, now by default."""
+        return self.exclude(get_effective_condition(at or timezone.now()))
+
+    def as_of(self, timestamp):
+        """
+        Returns the tags that were active at the given time.
+
+        Tags are immutable and soft deletes keep the inactivation date, so a tag was active at
+        timestamp when it was created before it and inactivated after it, if ever.
+        """
+        return self.filter(
+            Q(created_at__lte=timestamp),
+            Q(inactivated_at=None) | Q(inactivated_at__gt=timestamp),
+        )
+
+    def expired(self, at=None):
+        """Returns the active tags whose expiration date is reached at the given time, now by default."""
+        return self.active().filter(expiration_date__lte=at or timezone.now())
+
     def delete(self):
-        """Used to delete a set of tags."""
-        return super().update(inactivated_at=timezone.now(), status=Status.INACTIVE)
+        """
+        Used to delete a set of tags, their entries are removed from the summaries in the same transaction,
+        their cached representations are dropped and the generations of their owners bumped.
+        """
+        now = timezone.now()
+        return sum(self.__write_in_batches(
+            lambda tags: tags.update(inactivated_at=now, status=Status.INACTIVE),
+        ))
+
+    def iter_batches(self, batch_size, fields=None):
+        """
+        Yields the tags in batches of batch_size ordered by id, or the rows of their id and fields when
+        fields is given.
+
+        Every batch is a separate query starting from the last id of the previous one, so the tags of a
+        batch can be updated without skipping or repeating the rest, the lookups of prefetch_related run
+        once per batch and memory doesn't grow with the size of the queryset.
+        """
+        queryset = self.order_by("id")
+        if fields is not None:
+            queryset = queryset.values_list("id", *fields)
+
+        last_id = 0
+        while True:
+            batch = list(queryset.filter(id__gt=last_id)[:batch_size])
+            if not batch:
+                return
+
+            yield batch
+            last_id = batch[-1][0] if fields is not None else batch[-1].id
+
+    def count_by(self, fields):
+        """
+        Returns the number of tags of every combination of values of fields, counted by the database.
+
+        Arguments:
+            - fields: list of names of COUNT_GROUP_BY_FIELDS. Target and owner types are grouped by
+            the model of their content type.
+
+        Returns:
+            A list of dictionaries with the value of every field and the count, the largest groups first.
+        """
+        lookups = [COUNT_GROUP_BY_FIELDS[field] for field in fields]
+        rows = self.order_by().values(*lookups).annotate(count=Count("id")).order_by("-count", *lookups)
+
+        counts = []
+        for row in rows:
+            group = {field: row[lookup] for field, lookup in zip(fields, lookups)}
+            if "access" in group:
+                group["access"] = AccessLevel.get_choice(group["access"])
+            group["count"] = row["count"]
+            counts.append(group)
+
+        return counts
 
     def find_by_owner(self, owner_type, owner_id):
         """Returns all tags owned by owner_id."""
+        tags = self._find_by_natural_key("owner", owner_type, owner_id)
+        if tags is not None:
+            return tags
+
         try:
             owner, ctype = self._get_object_for_this_type(owner_type, owner_id)
         except ObjectDoesNotExist:
             return self.none()
 
-        owner_ids = list(owner.values_list("id", flat=True))
+        return self.filter(owner_type=ctype, owner_object_id__in=owner.values("id"))
 
-        return self.filter(owner_type=ctype, owner_object_id__in=owner_ids)
+    async def afind_by_owner(self, owner_type, owner_id):
+        """
+        Async counterpart of `find_by_owner`. Only the owner lookup is awaited, the returned
+        queryset is lazy and is evaluated with the async ORM API, e.g. `acount` or `async for`.
+        """
+        return await sync_to_async(self.find_by_owner)(owner_type, owner_id)
+
+    def owned_by(self, *owners):
+        """
+        Returns all tags owned by any of the given model instances.
+
+        The owners are already resolved, so the scoping is a single
+        `(owner_type_id, owner_object_id)` predicate without subqueries.
+        """
+        condition = Q()
+        for owner in owners:
+            if owner is None or owner.pk is None:
+                continue
+            ctype = ContentType.objects.get_for_model(owner)
+            condition |= Q(owner_type=ctype, owner_object_id=owner.pk)
+
+        if not condition:
+            return self.none()
+
+        return self.filter(condition)
 
     def find_all_tags_for(self, target_type, target_id):
         """Returns all tags defined on an object."""
         target_type = PROXY_MODEL_NAME if target_type.lower() in OPAQUE_KEY_PROXY_MODEL_TARGETS else target_type
 
+        tags = self._find_by_natural_key("target", target_type, target_id)
+        if tags is not None:
+            return tags
+
         try:
             target, ctype = self._get_object_for_this_type(target_type, target_id)
         except ObjectDoesNotExist:
@@ -82,24 +361,114 @@ class TagQuerySet(QuerySet):
             target_object_id__in=target.only("id").values_list("id", flat=True)
         )
 
+    async def afind_all_tags_for(self, target_type, target_id):
+        """Async counterpart of `find_all_tags_for`, see `afind_by_owner`."""
+        return await sync_to_async(self.find_all_tags_for)(target_type, target_id)
+
     def find_all_tags_by_type(self, object_type):
         """Returns all tags with target_type equals to object_type."""
         return self.filter(target_type__model__exact=object_type)
 
     def hard_delete(self):
-        """ Method for deleting Tag objects"""
-        return super().delete()
+        """
+        Method for deleting Tag objects, their entries are removed from the summaries in the same transaction,
+        their cached representations are dropped and the generations of their owners bumped.
+        """
+        deleted, rows_count = 0, Counter()
+        for batch_deleted, batch_rows_count in self.__write_in_batches(
+            lambda tags: super(TagQuerySet, tags).delete(),
+        ):
+            deleted += batch_deleted
+            rows_count.update(batch_rows_count)
+
+        return deleted, dict(rows_count)
+
+    def __write_in_batches(self, write):
+        """
+        Applies write to the tags of the queryset in batches inside one transaction, updating the summaries,
+        dropping the cached tags and bumping the generations of the owners of every batch.
+
+        Only the fields needed for that are read, one batch at a time, so the memory used doesn't grow with
+        the size of the queryset.
+
+        Returns:
+            The list of results of write for every batch.
+        """
+        results = []
+        with transaction.atomic(using=self.db):
+            for batch in self.iter_batches(SUMMARY_REFRESH_BATCH_SIZE, fields=WRITTEN_TAG_FIELDS):
+                ids, keys, summary_entries, owners = [], [], [], set()
+                for tag_id, key, target_type_id, target_id, owner_type_id, owner_id in batch:
+                    ids.append(tag_id)
+                    keys.append(key)
+                    summary_entries.append((target_type_id, target_id, key))
+                    owners.add((owner_type_id, owner_id))
+
+                results.append(write(self.filter(id__in=ids)))
+                TagSummary.objects.db_manager(self.db).remove(summary_entries)
+                invalidate_tags(keys, using=self.db)
+                bump_generations(owners, using=self.db)
+
+        return results
+
+    def _get_content_type(self, object_type):
+        """Function that returns the content type of the given object type."""
+        return get_content_type(object_type)
+
+    def _find_by_natural_key(self, relation, object_type, object_id):
+        """
+        Function that filters the tags using the denormalized natural key of the relation, either
+        `target` or `owner`. Returns None if the identifiers can't be answered from the tag table.
+        """
+        if not getattr(settings, "EOX_TAGGING_FILTER_BY_TARGET_KEY", False):
+            return None
+
+        lookup = self.__get_natural_key_lookup(object_type.lower(), object_id)
+        if lookup is None:
+            return None
+
+        try:
+            ctype = self._get_content_type(object_type)
+        except ObjectDoesNotExist:
+            return self.none()
+
+        lookup_type, natural_key = lookup
+        return self.filter(**{
+            f"{relation}_type": ctype,
+            f"{relation}_key{lookup_type}": natural_key,
+        })
+
+    def __get_natural_key_lookup(self, object_type, object_id):
+        """Function that returns the lookup type and value that matches the object identifiers."""
+        if object_type == "user" and object_id.get("username"):
+            return "", object_id["username"]
+
+        if object_type == PROXY_MODEL_NAME and object_id.get("course_id"):
+            return "", str(CourseKey.from_string(object_id["course_id"]))
+
+        if object_type == "courseenrollment":
+            username = object_id.get("username")
+            course_id = object_id.get("course_id")
+            course_id = str(CourseKey.from_string(course_id)) if course_id else None
+
+            if username and course_id:
+                return "", f"{username}{NATURAL_KEY_SEPARATOR}{course_id}"
+            if username:
+                return "__startswith", f"{username}{NATURAL_KEY_SEPARATOR}"
+            # A suffix match can't use the index of the natural key, the enrollments of a course
+            # are filtered with the subquery over the enrollment table instead
+
+        if object_type == "generatedcertificate" and object_id.get("verify_uuid"):
+            return "", object_id["verify_uuid"]
+
+        return None
 
     def _get_object_for_this_type(self, object_type, object_id):
         """
         Function that given an object type returns the correct content type and a list of objects
         associated.
         """
-        ctype = cache.get_or_set(
-            f"content_type_{object_type}",
-            lambda: ContentType.objects.get(model=object_type),
-            timeout=CACHE_CONTENT_TYPE_TIMEOUT,
-        )
+        ctype = self._get_content_type(object_type)
         object_type = object_type.lower()
 
         if object_type == PROXY_MODEL_NAME:
@@ -126,11 +495,90 @@ class TagQuerySet(QuerySet):
         return object_instances, ctype
 
 
+class OpaqueKeyProxyQuerySet(QuerySet):
+    """OpaqueKeyProxyModel queryset used as manager."""
+
+    def get_or_create_by_key(self, opaque_key):
+        """
+        Returns the proxy of opaque_key, creating it if needed.
+
+        The unique constraint on opaque_key arbitrates concurrent writers: the losing insert
+        fails and the row committed by the winner is read with a locking read, which sees the
+        latest committed version even under repeatable read isolation.
+        """
+        try:
+            return self.get(opaque_key=opaque_key), False
+        except self.model.DoesNotExist:
+            pass
+
+        try:
+            with transaction.atomic(using=self.db):
+                return self.create(opaque_key=opaque_key), True
+        except IntegrityError:
+            with transaction.atomic(using=self.db):
+                return self.select_for_update().get(opaque_key=opaque_key), False
+
+    def get_or_create_by_keys(self, opaque_keys):
+        """
+        Returns a dictionary mapping the string of every opaque key to its proxy, creating the
+        missing proxies in one INSERT. Rows inserted by concurrent writers are ignored by the
+        INSERT and read afterwards.
+        """
+        proxies = {str(proxy.opaque_key): proxy for proxy in self.filter(opaque_key__in=opaque_keys)}
+        missing_keys = [opaque_key for opaque_key in opaque_keys if str(opaque_key) not in proxies]
+
+        if missing_keys:
+            self.bulk_create([self.model(opaque_key=opaque_key) for opaque_key in missing_keys], ignore_conflicts=True)
+            proxies.update({str(proxy.opaque_key): proxy for proxy in self.filter(opaque_key__in=missing_keys)})
+
+        return proxies
+
+
+def merge_opaque_key_proxies(proxy_model, tag_model, content_type_model):
+    """
+    Folds duplicated opaque key proxies into the oldest one and repoints their tags.
+
+    The summaries of the kept and removed proxies are refreshed, the cached representations of the
+    repointed tags dropped and the generations of their owners bumped in the same transaction.
+
+    Returns:
+        The number of proxies removed.
+    """
+    proxy_ctype = content_type_model.objects.filter(app_label="eox_tagging", model=PROXY_MODEL_NAME).first()
+    duplicates = proxy_model.objects.values("opaque_key").annotate(
+        proxies=Count("id"),
+        kept_id=Min("id"),
+    ).filter(proxies__gt=1)
+    removed = 0
+
+    for duplicate in duplicates:
+        with transaction.atomic():
+            duplicated_ids = list(proxy_model.objects.filter(
+                opaque_key=duplicate["opaque_key"],
+            ).exclude(id=duplicate["kept_id"]).values_list("id", flat=True))
+
+            if proxy_ctype:
+                repointed_tags = tag_model.objects.filter(target_type=proxy_ctype, target_object_id__in=duplicated_ids)
+                repointed = list(repointed_tags.values_list("key", "owner_type_id", "owner_object_id"))
+                repointed_tags.update(target_object_id=duplicate["kept_id"])
+
+                TagSummary.objects.refresh(
+                    (proxy_ctype.id, proxy_id) for proxy_id in [duplicate["kept_id"], *duplicated_ids]
+                )
+                invalidate_tags([key for key, _, _ in repointed])
+                bump_generations({(owner_type_id, owner_id) for _, owner_type_id, owner_id in repointed})
+
+            removed += len(duplicated_ids)
+            proxy_model.objects.filter(id__in=duplicated_ids).delete()
+
+    return removed
+
+
 @python_2_unicode_compatible
 class OpaqueKeyProxyModel(models.Model):
     """Model used to tag objects with opaque keys."""
-    opaque_key = CourseKeyField(max_length=255)
-    objects = models.Manager()
+    opaque_key = CourseKeyField(max_length=255, unique=True)
+    objects = OpaqueKeyProxyQuerySet().as_manager()
 
     def __str__(self):
         """Method that returns the opaque_key string representation."""
@@ -155,6 +603,8 @@ class Tag(models.Model):
         belongs_to: object to which the tag belongs
         status: status of the tag, valid or invalid
         invalidated_at: date when the tag is soft deleted
+        target_key: natural key of the target object, used to filter without resolving it
+        owner_key: natural key of the owner object
     """
     key = models.UUIDField(
         unique=True,
@@ -191,6 +641,7 @@ class Tag(models.Model):
         blank=True,
     )
     target_object = GenericForeignKey("target_type", "target_object_id")
+    target_key = models.CharField(max_length=512, null=True, blank=True, editable=False)
 
     # Generic foreign key for `tag belonging to` USER or SITE
     owner_type = models.ForeignKey(
@@ -205,6 +656,7 @@ class Tag(models.Model):
         blank=True,
     )
     owner_object = GenericForeignKey("owner_type", "owner_object_id")
+    owner_key = models.CharField(max_length=512, null=True, blank=True, editable=False)
 
     objects = TagQuerySet().as_manager()
 
@@ -216,6 +668,15 @@ class Tag(models.Model):
 
         indexes = [
             models.Index(fields=["target_type", "target_object_id"], name="target_index"),
+            models.Index(fields=["target_type", "target_key"], name="target_key_index"),
+            models.Index(fields=["owner_type", "owner_key"], name="owner_key_index"),
+            models.Index(fields=["owner_type", "owner_object_id", "inactivated_at"], name="owner_active_index"),
+            models.Index(fields=["tag_type", "tag_value"], name="tag_type_value_index"),
+            models.Index(fields=["created_at"], name="created_at_index"),
+            models.Index(fields=["created_at", "inactivated_at"], name="as_of_index"),
+            models.Index(fields=["activation_date"], name="activation_date_index"),
+            models.Index(fields=["inactivated_at", "expiration_date"], name="active_expiration_index"),
+            models.Index(fields=["expiration_date"], name="expiration_date_index"),
         ]
 
     def __str__(self):
@@ -224,12 +685,32 @@ class Tag(models.Model):
     @property
     def target_object_type(self):
         """Obtain the name of the object target by the `Tag`."""
-        return self.target_object.__class__.__name__ if self.target_object else None
+        return self.__get_object_type_name("target")
 
     @property
     def owner_object_type(self):
         """Obtain the name of the object which the tag belongs to."""
-        return self.owner_object.__class__.__name__ if self.owner_object else None
+        return self.__get_object_type_name("owner")
+
+    def __get_object_type_name(self, relation):
+        """
+        Function that gets the class name of the target or owner object from its content type,
+        so the related object is not loaded. Falls back to the object itself if the model of the
+        content type is not installed.
+
+        Arguments:
+            - relation: target or owner
+        """
+        ctype_id = getattr(self, f"{relation}_type_id")
+        if ctype_id is None:
+            return None
+
+        model_class = ContentType.objects.get_for_id(ctype_id).model_class()
+        if model_class:
+            return model_class.__name__
+
+        related_object = getattr(self, f"{relation}_object")
+        return related_object.__class__.__name__ if related_object else None
 
     def set_attribute(self, attr, value):
         """Function that takes a value and sets it to the instance attribute."""
@@ -309,24 +790,269 @@ class Tag(models.Model):
             return
         self.validator.validate_fields_integrity()
 
-    def full_clean(self, exclude=None, validate_unique=False):  # pylint: disable=arguments-differ
+    def full_clean(self, exclude=None, validate_unique=False, validate_constraints=False, integrity_cache=None):
         """
         Call clean_fields(), clean(), and validate_unique() -not implemented- on the model.
         Raise a ValidationError for any errors that occur.
+
+        Arguments:
+            - integrity_cache: results of integrity checks shared between tags, the cache of the
+            current request by default.
         """
-        self.validator = TagValidators(self)  # pylint: disable=attribute-defined-outside-init
+        self.validator = TagValidators(self, integrity_cache)  # pylint: disable=attribute-defined-outside-init
         self.clean()
         self.clean_fields()
 
+    def set_natural_keys(self):
+        """Stores the natural keys of the target and owner objects in the tag row."""
+        self.target_key = get_natural_key(self.target_object)
+        self.owner_key = get_natural_key(self.owner_object)
+
     def save(self, *args, **kwargs):
+        """
+        Validates and saves the tag. A new tag is added to the summary of its target in the same transaction
+        and the generation of its owner is bumped, also when it's created through the admin.
+        """
         self.full_clean()
-        super().save(*args, **kwargs)
+        self.set_natural_keys()
+        if not self._state.adding:
+            super().save(*args, **kwargs)
+            return
+
+        using = kwargs.get("using") or router.db_for_write(Tag, instance=self)
+        with transaction.atomic(using=using):
+            super().save(*args, **kwargs)
+            TagSummary.objects.db_manager(using).add([self.key])
+            bump_generations([(self.owner_type_id, self.owner_object_id)], using=using)  # pylint: disable=no-member
 
     def delete(self):  # pylint: disable=arguments-differ
         self.inactivated_at = timezone.now()
         self.status = Status.INACTIVE
-        super().save()
+        using = router.db_for_write(Tag, instance=self)
+        with transaction.atomic(using=using):
+            super().save(using=using)
+            TagSummary.objects.db_manager(using).remove(
+                [(self.target_type_id, self.target_object_id, self.key)],  # pylint: disable=no-member
+            )
+            invalidate_tags([self.key], using=using)
+            bump_generations([(self.owner_type_id, self.owner_object_id)], using=using)  # pylint: disable=no-member
 
     def hard_delete(self):
         """Deletes object from database."""
-        super().delete()
+        using = router.db_for_write(Tag, instance=self)
+        with transaction.atomic(using=using):
+            super().delete(using=using)
+            TagSummary.objects.db_manager(using).remove(
+                [(self.target_type_id, self.target_object_id, self.key)],  # pylint: disable=no-member
+            )
+            invalidate_tags([self.key], using=using)
+            bump_generations([(self.owner_type_id, self.owner_object_id)], using=using)  # pylint: disable=no-member
+
+
+class TagSummaryQuerySet(QuerySet):
+    """TagSummary queryset used as manager."""
+
+    def refresh(self, targets):
+        """
+        Recomputes the summaries of the given targets from their active tags, used to rebuild them.
+
+        The missing summary rows are created and every row is locked before reading the tags, so
+        concurrent refreshes of the same target are serialized. Targets without active tags lose
+        their row.
+
+        Arguments:
+            - targets: iterable of (target_type_id, target_object_id) pairs.
+        """
+        targets = sorted({target for target in targets if None not in target})
+
+        for index in range(0, len(targets), SUMMARY_REFRESH_BATCH_SIZE):
+            self.__refresh_batch(targets[index:index + SUMMARY_REFRESH_BATCH_SIZE])
+
+    def add(self, keys):
+        """
+        Appends the entries of the new active tags with the given keys to the summaries of their targets.
+
+        Only the new tags are read. The summaries of their targets are created when missing and locked
+        while the entries are appended, the other tags of the targets are not read again.
+        """
+        keys = list(keys)
+
+        for index in range(0, len(keys), SUMMARY_REFRESH_BATCH_SIZE):
+            entries = {}
+            tags = Tag.objects.using(self.db).active().filter(
+                key__in=keys[index:index + SUMMARY_REFRESH_BATCH_SIZE],
+            ).order_by("id").values(*SUMMARY_TAG_FIELDS)
+            for tag in tags:
+                entries.setdefault((tag["target_type_id"], tag["target_object_id"]), []).append(get_summary_entry(tag))
+
+            self.__update(entries, lambda summary_tags, new_entries: summary_tags + new_entries, create=True)
+
+    def remove(self, tags):
+        """
+        Drops the entries of the given tags from the summaries of their targets. The summaries left without
+        entries are deleted.
+
+        Arguments:
+            - tags: iterable of (target_type_id, target_object_id, key) tuples.
+        """
+        keys = {}
+        for target_type_id, target_object_id, key in tags:
+            keys.setdefault((target_type_id, target_object_id), set()).add(str(key))
+
+        self.__update(
+            keys,
+            lambda summary_tags, removed_keys: [entry for entry in summary_tags if entry["key"] not in removed_keys],
+        )
+
+    def for_target(self, target_object, owners=None):
+        """
+        Returns the summary entries of the active tags of target_object with a single query.
+
+        Courses are tagged through their OpaqueKeyProxyModel, which is the object expected here.
+
+        Arguments:
+            - target_object: tagged model instance.
+            - owners: if given, only the tags owned by one of these model instances are returned.
+        """
+        ctype = ContentType.objects.get_for_model(target_object)
+        return self.__get_tags(self.filter(target_type=ctype, target_object_id=target_object.pk), owners)
+
+    def find_for(self, target_type, target_id, owners=None):
+        """
+        Returns the summary entries of the active tags of the targets identified like in
+        `TagQuerySet.find_all_tags_for`, resolving the targets in a subquery.
+        """
+        target_type = PROXY_MODEL_NAME if target_type.lower() in OPAQUE_KEY_PROXY_MODEL_TARGETS else target_type
+
+        try:
+            targets, ctype = Tag.objects.all()._get_object_for_this_type(  # pylint: disable=protected-access
+                target_type,
+                target_id,
+            )
+        except ObjectDoesNotExist:
+            return []
+
+        summaries = self.filter(target_type=ctype, target_object_id__in=targets.values("id"))
+        return self.__get_tags(summaries, owners)
+
+    def __refresh_batch(self, targets):
+        """Recomputes the summaries of a batch of targets in one transaction."""
+        if not targets:
+            return
+
+        condition = get_targets_condition(targets)
+
+        with transaction.atomic(using=self.db):
+            self.bulk_create(
+                [self.model(target_type_id=ctype_id, target_object_id=object_id) for ctype_id, object_id in targets],
+                ignore_conflicts=True,
+            )
+            summaries = {
+                (summary.target_type_id, summary.target_object_id): summary
+                for summary in self.select_for_update().filter(condition).order_by("id")
+            }
+
+            tags = {}
+            for tag in Tag.objects.active().filter(condition).order_by("id").values(*SUMMARY_TAG_FIELDS):
+                tags.setdefault((tag["target_type_id"], tag["target_object_id"]), []).append(get_summary_entry(tag))
+
+            now = timezone.now()
+            updated = []
+            for target, summary in summaries.items():
+                if target in tags:
+                    summary.tags = tags[target]
+                    summary.updated_at = now
+                    updated.append(summary)
+
+            self.bulk_update(updated, ["tags", "updated_at"])
+            self.filter(id__in=[summary.id for target, summary in summaries.items() if target not in tags]).delete()
+
+    def __update(self, changes, apply, create=False):
+        """
+        Applies the changes of every target to the entries of its summary, in batches of locked rows.
+
+        Arguments:
+            - changes: dictionary mapping (target_type_id, target_object_id) pairs to their change.
+            - apply: function returning the new entries of a summary from its entries and its change.
+            - create: whether the missing summaries are created before applying the changes.
+        """
+        targets = sorted(target for target in changes if None not in target)
+
+        for index in range(0, len(targets), SUMMARY_REFRESH_BATCH_SIZE):
+            batch = targets[index:index + SUMMARY_REFRESH_BATCH_SIZE]
+
+            with transaction.atomic(using=self.db):
+                if create:
+                    self.bulk_create(
+                        [self.model(target_type_id=target[0], target_object_id=target[1]) for target in batch],
+                        ignore_conflicts=True,
+                    )
+
+                now = timezone.now()
+                updated, emptied = [], []
+                for summary in self.select_for_update().filter(get_targets_condition(batch)).order_by("id"):
+                    tags = apply(summary.tags, changes[(summary.target_type_id, summary.target_object_id)])
+                    if not tags:
+                        emptied.append(summary.id)
+                    elif tags != summary.tags:
+                        summary.tags = tags
+                        summary.updated_at = now
+                        updated.append(summary)
+
+                self.bulk_update(updated, ["tags", "updated_at"])
+                self.filter(id__in=emptied).delete()
+
+    @staticmethod
+    def __get_tags(summaries, owners):
+        """Returns the entries of the summaries, only the ones owned by owners if given."""
+        entries = [entry for tags in summaries.values_list("tags", flat=True) for entry in tags]
+        if owners is None:
+            return entries
+
+        owner_ids = {
+            (ContentType.objects.get_for_model(owner).model, owner.pk)
+            for owner in owners
+            if owner is not None and owner.pk is not None
+        }
+        return [entry for entry in entries if (entry["owner_type"], entry["owner_id"]) in owner_ids]
+
+
+class TagSummary(models.Model):
+    """
+    Active tags of a target, stored in a single row.
+
+    The entries of the new and deleted tags are added and removed in the same transaction as
+    `TagQuerySet.create_tag`, `TagQuerySet.bulk_create_tags`, `Tag.delete` and `TagQuerySet.delete`, so the tags
+    of a target can be read without querying the tag table or resolving the generic relations. Every write still
+    rewrites the JSON of the row of its target while holding its lock, so its cost grows with the number of active
+    tags of the target and the writes of the same target wait for each other. Use the `rebuild_tag_summaries`
+    command to fill them for existing tags.
+
+    Attributes:
+        target_type: content type of the tagged object.
+        target_object_id: id of the tagged object.
+        tags: list with the compact representation of every active tag of the target.
+        updated_at: date of the last refresh.
+    """
+
+    target_type = models.ForeignKey(
+        ContentType,
+        related_name="+",
+        on_delete=models.CASCADE,
+    )
+    target_object_id = models.PositiveIntegerField()
+    tags = models.JSONField(default=list)
+    updated_at = models.DateTimeField(auto_now=True)
+    objects = TagSummaryQuerySet().as_manager()
+
+    class Meta:
+        """Meta class. """
+        verbose_name = "tag summary"
+        verbose_name_plural = "tag summaries"
+        app_label = "eox_tagging"
+        constraints = [
+            models.UniqueConstraint(fields=["target_type", "target_object_id"], name="unique_tag_summary_target"),
+        ]
+
+    def __str__(self):
+        return f"{self.target_type_id}:{self.target_object_id}"  # pylint: disable=no-member
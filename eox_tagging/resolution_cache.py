@@ -0,0 +1,354 @@
+"""
+Short lived cache of the edx-platform objects resolved from the identifiers sent to the tags API.
+
+Entries are keyed by `(object_type, natural key, site)` and stored in the Django cache named by
+`EOX_TAGGING_RESOLUTION_CACHE`, so the backend can be a process-local or a shared cache. Only the
+`(content type id, pk)` reference of a found object is stored, the object itself is loaded by
+primary key on every lookup, so the cache never holds the fields of the platform objects and they
+are never stale. References are kept for `EOX_TAGGING_RESOLUTION_CACHE_TIMEOUT` seconds and
+targets that don't exist for `EOX_TAGGING_RESOLUTION_CACHE_NOT_FOUND_TIMEOUT` seconds. Setting the
+timeout to 0 disables the cache. Entries are dropped explicitly with `invalidate` or by the signal
+receivers connected with `connect_invalidation_hooks` when the resolved objects, or the site
+memberships of the users, are saved or deleted.
+
+The entries of users and enrollments are stored with the version of their object, so the entries
+of every site are dropped by replacing the version, without knowing the sites. Enrollments are
+versioned by course, so their receiver doesn't need to load the user of the enrollment.
+"""
+import hashlib
+import threading
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import caches
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import transaction
+from django.db.models import Model
+from django.db.models.signals import post_delete, post_save
+from rest_framework.exceptions import NotFound
+
+RESOLUTION_CACHE_KEY = "eox_tagging_resolution_{object_type}_{digest}"
+RESOLUTION_VERSION_KEY = "eox_tagging_resolution_version_{object_type}_{digest}"
+NOT_FOUND = "eox_tagging_not_found"
+NOT_FOUND_EXCEPTIONS = (ObjectDoesNotExist, NotFound)
+SITE_SCOPED_TYPES = ["user", "courseenrollment"]
+UNCACHED_TYPES = ["site"]
+
+
+class ResolutionCache:
+    """
+    Resolves edx-platform objects through the configured Django cache.
+
+    Attributes:
+        stats: counters of the hits, the hits of targets not found and the misses.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.stats = {}
+        self.reset_stats()
+
+    @property
+    def timeout(self):
+        """Seconds the found objects are kept, 0 disables the cache."""
+        return getattr(settings, "EOX_TAGGING_RESOLUTION_CACHE_TIMEOUT", 0)
+
+    @property
+    def not_found_timeout(self):
+        """Seconds the targets that don't exist are remembered."""
+        return getattr(settings, "EOX_TAGGING_RESOLUTION_CACHE_NOT_FOUND_TIMEOUT", 0)
+
+    @property
+    def backend(self):
+        """Django cache where the entries are stored."""
+        return caches[getattr(settings, "EOX_TAGGING_RESOLUTION_CACHE", "default")]
+
+    def enabled(self, object_type):
+        """Returns whether the objects of object_type are cached."""
+        return bool(self.timeout) and object_type.lower() not in UNCACHED_TYPES
+
+    def resolve(self, object_type, key, resolver, site=None):
+        """
+        Returns the object of object_type identified by key, calling resolver on a miss.
+
+        A cached reference is loaded by primary key, a reference to an object that no longer exists is
+        a miss. Only model instances are cached.
+
+        Arguments:
+            - object_type: type of the object, e.g. user or courseoverview.
+            - key: natural key of the object.
+            - resolver: function without arguments that loads the object from the platform.
+            - site: site where the object is resolved.
+
+        Raises:
+            ObjectDoesNotExist if the object is remembered as not found, or the exception of resolver.
+        """
+        if not self.enabled(object_type):
+            return resolver()
+
+        cache_key = self.get_cache_key(object_type, key, site)
+        version_key = self.get_version_key(object_type, key)
+        values = self.backend.get_many([cache_key, version_key] if version_key else [cache_key])
+        version = values.get(version_key)
+        reference = self.__unwrap(values.get(cache_key), version)
+
+        if reference == NOT_FOUND:
+            self.__count("not_found_hits")
+            raise ObjectDoesNotExist(f"EOX_TAGGING | {object_type} '{key}' not found")
+        if reference is not None:
+            value = self.__load([reference]).get(reference)
+            if value is not None:
+                self.__count("hits")
+                return value
+
+        self.__count("misses")
+        try:
+            value = resolver()
+        except NOT_FOUND_EXCEPTIONS:
+            if self.not_found_timeout:
+                self.backend.set(cache_key, (version, NOT_FOUND), timeout=self.not_found_timeout)
+            raise
+
+        reference = self.get_reference(value)
+        if reference is not None:
+            self.backend.set(cache_key, (version, reference), timeout=self.timeout)
+        return value
+
+    def get_many(self, object_type, keys, site=None):
+        """
+        Returns a dictionary mapping the keys found in the cache to their objects, loaded with one
+        query per content type.
+
+        The keys remembered as not found and the references to objects that no longer exist are left
+        out, so they are resolved again.
+        """
+        if not self.enabled(object_type) or not keys:
+            return {}
+
+        cache_keys = {self.get_cache_key(object_type, key, site): key for key in keys}
+        version_keys = {key: self.get_version_key(object_type, key) for key in keys}
+        values = self.backend.get_many([*cache_keys, *filter(None, version_keys.values())])
+        references = {}
+        for cache_key, key in cache_keys.items():
+            reference = self.__unwrap(values.get(cache_key), values.get(version_keys[key]))
+            if reference is not None and reference != NOT_FOUND:
+                references[key] = reference
+
+        instances = self.__load(references.values())
+        objects = {key: instances[reference] for key, reference in references.items() if reference in instances}
+
+        with self._lock:
+            self.stats["hits"] += len(objects)
+            self.stats["misses"] += len(keys) - len(objects)
+        return objects
+
+    def set_many(self, object_type, objects, site=None):
+        """
+        Stores the references of a dictionary mapping natural keys to the objects resolved for them,
+        with the current versions of the objects.
+        """
+        references = {key: self.get_reference(value) for key, value in objects.items()}
+        references = {key: reference for key, reference in references.items() if reference is not None}
+        if not self.enabled(object_type) or not references:
+            return
+
+        version_keys = {key: self.get_version_key(object_type, key) for key in references}
+        versions = self.backend.get_many(list(filter(None, version_keys.values())))
+        self.backend.set_many(
+            {
+                self.get_cache_key(object_type, key, site): (versions.get(version_keys[key]), reference)
+                for key, reference in references.items()
+            },
+            timeout=self.timeout,
+        )
+
+    def invalidate(self, object_type, key, site=None):
+        """
+        Drops the entry of the object of object_type identified by key.
+
+        If site is not given, the entry is dropped for every site by replacing the version of the object.
+        """
+        if not self.enabled(object_type):
+            return
+
+        version_key = self.get_version_key(object_type, key)
+        if site is not None or version_key is None:
+            self.backend.delete(self.get_cache_key(object_type, key, site))
+            return
+
+        # The version outlives the entries stored with the previous one
+        self.backend.set(version_key, time.time_ns(), timeout=max(self.timeout, self.not_found_timeout))
+
+    def reset_stats(self):
+        """Sets every counter to zero."""
+        self.stats = {
+            "hits": 0,
+            "not_found_hits": 0,
+            "misses": 0,
+        }
+
+    def hit_rate(self):
+        """Returns the fraction of lookups answered by the cache."""
+        lookups = sum(self.stats.values())
+        return (self.stats["hits"] + self.stats["not_found_hits"]) / lookups if lookups else 0
+
+    @staticmethod
+    def get_cache_key(object_type, key, site=None):
+        """
+        Returns the cache key of the object.
+
+        The natural key is hashed so usernames and course keys are valid in any cache backend.
+        Only users and enrollments are scoped by site, the other objects are the same for every site.
+        """
+        object_type = object_type.lower()
+        site_id = getattr(site, "id", site) if object_type in SITE_SCOPED_TYPES else None
+        digest = hashlib.sha1(f"{key!r}:{site_id}".encode("utf-8")).hexdigest()
+        return RESOLUTION_CACHE_KEY.format(object_type=object_type, digest=digest)
+
+    @staticmethod
+    def get_version_key(object_type, key):
+        """
+        Returns the cache key of the version of the entries of the object in every site, None for the
+        objects that are not scoped by site.
+
+        Enrollments are versioned by the course of their (username, course_id) key.
+        """
+        object_type = object_type.lower()
+        if object_type not in SITE_SCOPED_TYPES:
+            return None
+
+        scope = key[1] if object_type == "courseenrollment" else key
+        digest = hashlib.sha1(repr(scope).encode("utf-8")).hexdigest()
+        return RESOLUTION_VERSION_KEY.format(object_type=object_type, digest=digest)
+
+    @staticmethod
+    def get_reference(value):
+        """Returns the (content type id, pk) reference of a model instance, None for other values."""
+        if not isinstance(value, Model) or value.pk is None:
+            return None
+        return ContentType.objects.get_for_model(value).id, value.pk
+
+    @staticmethod
+    def __load(references):
+        """
+        Returns a dictionary mapping the (content type id, pk) references to their objects, loaded with
+        one query per content type. The objects that no longer exist are left out.
+        """
+        pks_by_type = defaultdict(set)
+        for ctype_id, pk in references:
+            pks_by_type[ctype_id].add(pk)
+
+        objects = {}
+        for ctype_id, pks in pks_by_type.items():
+            for instance in ContentType.objects.get_for_id(ctype_id).get_all_objects_for_this_type(pk__in=pks):
+                objects[(ctype_id, instance.pk)] = instance
+        return objects
+
+    @staticmethod
+    def __unwrap(entry, version):
+        """Returns the value of a cached (version, value) entry, None if missing or of an older version."""
+        if entry is None or entry[0] != version:
+            return None
+        return entry[1]
+
+    def __count(self, counter):
+        """Increments a stats counter."""
+        with self._lock:
+            self.stats[counter] += 1
+
+
+resolution_cache = ResolutionCache()
+
+
+def invalidate_on_commit(object_type, *keys, using=None):
+    """
+    Drops the entries of keys when the current transaction commits, so a concurrent lookup can't
+    store the object as not found again before it's visible.
+    """
+    if not resolution_cache.enabled(object_type):
+        return
+
+    def on_commit():
+        for key in keys:
+            resolution_cache.invalidate(object_type, key)
+
+    transaction.on_commit(on_commit, using=using)
+
+
+def invalidate_user(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """Drops the cached user when it's saved or deleted."""
+    invalidate_on_commit("user", instance.username, using=kwargs.get("using"))
+
+
+def invalidate_signup_source(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """Drops the cached user when one of its signup sources, checked for its site membership, changes."""
+    invalidate_user_by_id(instance.user_id, using=kwargs.get("using"))
+
+
+def invalidate_user_attribute(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """Drops the cached user when its created_on_site attribute, checked for its site membership, changes."""
+    if instance.name == "created_on_site":
+        invalidate_user_by_id(instance.user_id, using=kwargs.get("using"))
+
+
+def invalidate_user_by_id(user_id, using=None):
+    """Drops the cached user with the given id, loading only its username."""
+    if not resolution_cache.enabled("user"):
+        return
+
+    username = User.objects.filter(id=user_id).values_list("username", flat=True).first()
+    if username is not None:
+        invalidate_on_commit("user", username, using=using)
+
+
+def invalidate_course_overview(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """Drops the cached course when its overview is saved or deleted."""
+    invalidate_on_commit("courseoverview", str(instance.id), using=kwargs.get("using"))
+
+
+def invalidate_course_enrollment(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """Drops the cached enrollments of the course of the enrollment when it's saved or deleted."""
+    # Only the course of the key is used to version the enrollments of every site
+    invalidate_on_commit("courseenrollment", (None, str(instance.course_id)), using=kwargs.get("using"))
+
+
+def invalidate_certificate(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """Drops the cached certificate, by verify_uuid and by user and course, when it's saved or deleted."""
+    invalidate_on_commit(
+        "generatedcertificate",
+        instance.verify_uuid,
+        (instance.user.username, str(instance.course_id)),
+        using=kwargs.get("using"),
+    )
+
+
+def connect_invalidation_hooks():
+    """
+    Connects the invalidation receivers to the models resolved from the platform.
+
+    Every save and deletion is tracked, including the ones of the sources of the site membership of
+    the users. The wrappers that don't return a model are skipped.
+    """
+    # pylint: disable=import-outside-toplevel
+    from eox_core.edxapp_wrapper.certificates import get_generated_certificate
+    from eox_core.edxapp_wrapper.users import get_user_attribute, get_user_signup_source
+
+    from eox_tagging.edxapp_wrappers.course_overview import CourseOverview
+    from eox_tagging.edxapp_wrappers.enrollments import CourseEnrollment
+
+    hooks = {
+        User: invalidate_user,
+        CourseOverview: invalidate_course_overview,
+        CourseEnrollment: invalidate_course_enrollment,
+        get_generated_certificate(): invalidate_certificate,
+        get_user_signup_source(): invalidate_signup_source,
+        get_user_attribute(): invalidate_user_attribute,
+    }
+    for model, receiver in hooks.items():
+        if not (isinstance(model, type) and issubclass(model, Model)):
+            continue
+        post_save.connect(receiver, sender=model, dispatch_uid=f"eox_tagging_{receiver.__name__}_save")
+        post_delete.connect(receiver, sender=model, dispatch_uid=f"eox_tagging_{receiver.__name__}_delete")
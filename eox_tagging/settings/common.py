@@ -57,8 +57,24 @@ def plugin_settings(settings):
     settings.EOX_TAGGING_GET_COURSE_OVERVIEW = "eox_tagging.edxapp_wrappers.backends.course_overview_i_v1"
     settings.EOX_TAGGING_DEFINITIONS = []
     settings.EOX_TAGGING_LOAD_PERMISSIONS = True
+    settings.EOX_TAGGING_FILTER_BY_TARGET_KEY = False
     settings.DATA_API_DEF_PAGE_SIZE = 1000
     settings.DATA_API_MAX_PAGE_SIZE = 5000
+    settings.EOX_TAGGING_BULK_MAX_SIZE = 5000
+    settings.EOX_TAGGING_BULK_BATCH_SIZE = 500
+    settings.EOX_TAGGING_EXPORT_CHUNK_SIZE = 2000
+    settings.EOX_TAGGING_FAST_LIST_SERIALIZER = True
+    settings.EOX_TAGGING_COUNTS_CACHE_TIMEOUT = 60
+    settings.EOX_TAGGING_RETRIEVE_CACHE = "default"
+    settings.EOX_TAGGING_RETRIEVE_CACHE_TIMEOUT = 300
+    settings.EOX_TAGGING_GENERATION_CACHE = "default"
+    settings.EOX_TAGGING_DATABASE_ROUTING = False
+    settings.EOX_TAGGING_DATABASE = "default"
+    settings.EOX_TAGGING_READ_DATABASE = None
+    settings.EOX_TAGGING_READ_YOUR_WRITES_TIMEOUT = 5
+    settings.EOX_TAGGING_RESOLUTION_CACHE = "default"
+    settings.EOX_TAGGING_RESOLUTION_CACHE_TIMEOUT = 60
+    settings.EOX_TAGGING_RESOLUTION_CACHE_NOT_FOUND_TIMEOUT = 15
     settings.EOX_TAGGING_BEARER_AUTHENTICATION = 'eox_tagging.edxapp_wrappers.backends.bearer_authentication_i_v1'
     if hasattr(settings, 'INSTALLED_APPS'):
         if find_spec('eox_audit_model') and EOX_AUDIT_MODEL_APP not in settings.INSTALLED_APPS:
@@ -3,9 +3,15 @@ Production Django settings for eox_tagging project.
 """
 from __future__ import unicode_literals
 
+DATABASE_ROUTER = "eox_tagging.db_router.TaggingRouter"
 
-def plugin_settings(settings):  # pylint: disable=unused-argument
+
+def plugin_settings(settings):
     """
     Set of plugin settings used by the Open Edx platform.
     More info: https://github.com/openedx/edx-platform/blob/master/openedx/core/djangoapps/plugins/README.rst
     """
+    if getattr(settings, "EOX_TAGGING_DATABASE_ROUTING", False):
+        routers = list(getattr(settings, "DATABASE_ROUTERS", []))
+        if DATABASE_ROUTER not in routers:
+            settings.DATABASE_ROUTERS = routers + [DATABASE_ROUTER]
@@ -33,6 +33,14 @@ DATABASES = {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': 'db.sqlite3',
     },
+    # Stands in for a read replica in the tests of the database router, mirrored from default
+    'replica': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': 'db.sqlite3',
+        'TEST': {
+            'MIRROR': 'default',
+        },
+    },
 }
 
 
@@ -43,6 +51,7 @@ def plugin_settings(settings):  # pylint: disable=function-redefined
     """
     settings.EOX_TAGGING_SKIP_VALIDATIONS = True
     settings.EOX_TAGGING_LOAD_PERMISSIONS = False
+    settings.EOX_TAGGING_RESOLUTION_CACHE_TIMEOUT = 0
     settings.EOX_TAGGING_BEARER_AUTHENTICATION = 'eox_tagging.edxapp_wrappers.backends.bearer_authentication_i_v1_test'
     settings.DATA_API_DEF_PAGE_SIZE = 1000
     settings.DATA_API_MAX_PAGE_SIZE = 5000
@@ -0,0 +1,87 @@
+"""
+Read-through cache of the serialized tags returned when retrieving a tag by key.
+
+Tags are immutable except for the soft deletion, so an entry stays valid until the tag is deleted.
+Entries keep the owner of the tag next to its representation, so the access of the requester can
+be checked without querying the tag. They are stored in the Django cache named by
+`EOX_TAGGING_RETRIEVE_CACHE` for `EOX_TAGGING_RETRIEVE_CACHE_TIMEOUT` seconds, 0 disables the cache,
+and dropped with `invalidate_tags` by the deletions of `Tag` and `TagQuerySet`.
+"""
+import uuid
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import caches
+from django.db import transaction
+
+TAG_CACHE_KEY = "eox_tagging_tag_{key}"
+
+
+def get_tag_cache():
+    """Returns the Django cache where the tags are stored."""
+    return caches[getattr(settings, "EOX_TAGGING_RETRIEVE_CACHE", "default")]
+
+
+def get_tag_cache_timeout():
+    """Returns the seconds the tags are kept, 0 disables the cache."""
+    return getattr(settings, "EOX_TAGGING_RETRIEVE_CACHE_TIMEOUT", 0)
+
+
+def get_tag_cache_key(key):
+    """
+    Returns the cache key of the tag, the same for every spelling of the UUID.
+
+    Raises:
+        ValueError if key is not a UUID.
+    """
+    return TAG_CACHE_KEY.format(key=uuid.UUID(str(key)).hex)
+
+
+def get_cached_tag(key):
+    """Returns the cached entry of the tag with {"owner": (owner_type_id, owner_object_id), "data": ...} or None."""
+    if not get_tag_cache_timeout():
+        return None
+    return get_tag_cache().get(get_tag_cache_key(key))
+
+
+def cache_tag(tag, data):
+    """Stores the serialized data of tag along with its owner."""
+    timeout = get_tag_cache_timeout()
+    if not timeout:
+        return
+
+    get_tag_cache().set(
+        get_tag_cache_key(tag.key),
+        {
+            "owner": (tag.owner_type_id, tag.owner_object_id),
+            "data": data,
+        },
+        timeout=timeout,
+    )
+
+
+def is_owned_by(entry, owners):
+    """Returns whether the tag of the cached entry is owned by any of the given model instances."""
+    return any(
+        entry["owner"] == (ContentType.objects.get_for_model(owner).id, owner.pk)
+        for owner in owners
+        if owner is not None and owner.pk is not None
+    )
+
+
+def invalidate_tags(keys, using=None):
+    """
+    Drops the cached tags with the given keys.
+
+    The entries are dropped right away and again when the current transaction commits, so a
+    request that reads a tag between both moments can't keep its old version in the cache.
+    """
+    if not get_tag_cache_timeout():
+        return
+
+    cache_keys = [get_tag_cache_key(key) for key in keys]
+    if not cache_keys:
+        return
+
+    get_tag_cache().delete_many(cache_keys)
+    transaction.on_commit(lambda: get_tag_cache().delete_many(cache_keys), using=using)
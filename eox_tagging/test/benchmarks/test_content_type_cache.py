@@ -0,0 +1,33 @@
+"""
+Microbenchmark of the content type resolution done on every filter and owner lookup.
+"""
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.test import TestCase
+
+from eox_tagging.content_types import ContentTypeCache
+from eox_tagging.test.benchmarks.utils import measure, report, skip_unless_benchmark
+
+REPETITIONS = 10000
+LOOKUPS_PER_REQUEST = 4
+
+
+@skip_unless_benchmark
+class TestContentTypeCacheBenchmark(TestCase):
+    """Compares the shared cache only lookup with the two-tier cache."""
+
+    def test_lookup_overhead(self):
+        """Reports the content type overhead of a request doing several lookups."""
+        content_type_cache = ContentTypeCache()
+
+        def shared_cache_only():
+            for _ in range(LOOKUPS_PER_REQUEST):
+                cache.get_or_set("content_type_user", lambda: ContentType.objects.get(model="user"))
+
+        def two_tier_cache():
+            for _ in range(LOOKUPS_PER_REQUEST):
+                content_type_cache.get("user")
+
+        report("Shared cache content type lookups per request", measure(shared_cache_only, REPETITIONS))
+        report("Two-tier cache content type lookups per request", measure(two_tier_cache, REPETITIONS))
+        print(f"Two-tier cache stats: {content_type_cache.stats}")
@@ -0,0 +1,57 @@
+"""
+Stress test for the concurrent creation of opaque key proxies.
+"""
+import threading
+import time
+
+from django.db import OperationalError, close_old_connections, connection
+from django.test import TransactionTestCase
+from opaque_keys.edx.keys import CourseKey
+
+from eox_tagging.models import OpaqueKeyProxyModel
+from eox_tagging.test.benchmarks.utils import skip_unless_benchmark
+
+THREADS = 8
+KEYS = 50
+
+
+@skip_unless_benchmark
+class TestOpaqueKeyProxyStress(TransactionTestCase):
+    """Creates the same course proxies from several threads at the same time."""
+
+    def worker(self, barrier, errors):
+        """Upserts every course key, all the threads start at the same time."""
+        barrier.wait()
+        try:
+            for index in range(KEYS):
+                course_key = CourseKey.from_string(f"course-v1:edX+Stress+{index}")
+                while True:
+                    try:
+                        OpaqueKeyProxyModel.objects.get_or_create_by_key(course_key)
+                        break
+                    except OperationalError:  # SQLite only allows one writer at a time
+                        if connection.vendor != "sqlite":
+                            raise
+                        time.sleep(0.001)
+        except Exception as error:  # pylint: disable=broad-except
+            errors.append(error)
+        finally:
+            close_old_connections()
+            connection.close()
+
+    def test_concurrent_upserts(self):
+        """Used to test that concurrent writers don't create duplicated proxies."""
+        barrier = threading.Barrier(THREADS)
+        errors = []
+        threads = [threading.Thread(target=self.worker, args=(barrier, errors)) for _ in range(THREADS)]
+
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        print(f"\nOpaque key upserts: {THREADS * KEYS / elapsed:.1f} upserts/s with {THREADS} threads")
+        self.assertFalse(errors)
+        self.assertEqual(OpaqueKeyProxyModel.objects.count(), KEYS)
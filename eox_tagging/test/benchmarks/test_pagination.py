@@ -0,0 +1,86 @@
+"""
+Benchmark of the page-number and cursor pagination of the tags list on a large dataset.
+"""
+import datetime
+import itertools
+import os
+import time
+
+from django.contrib.auth.models import User
+from django.contrib.sites.models import Site
+from django.core.paginator import Paginator
+from django.test import TestCase
+from mock import patch
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from eox_tagging.api.v1.pagination import TagApiPagination, TagCursorPagination
+from eox_tagging.models import Tag
+from eox_tagging.test.benchmarks.utils import skip_unless_benchmark
+
+ROWS = int(os.environ.get("BENCHMARK_TAG_ROWS", 1000000))
+PAGE_SIZE = 1000
+INSERT_BATCH_SIZE = 10000
+
+
+@skip_unless_benchmark
+class TestPaginationBenchmark(TestCase):
+    """Compares the latency of page N with page numbers and with cursors."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Generates ROWS tags owned by the same site with increasing creation dates."""
+        cls.site = Site.objects.create(domain="pagination.example.com", name="pagination")
+        target = User.objects.create(username="pagination_user")
+        start = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+        clock = (start + datetime.timedelta(seconds=second) for second in itertools.count())
+
+        with patch("django.utils.timezone.now", lambda: next(clock)):
+            for offset in range(0, ROWS, INSERT_BATCH_SIZE):
+                Tag.objects.bulk_create([
+                    Tag(
+                        tag_value="premium",
+                        tag_type="subscription_level",
+                        target_object=target,
+                        owner_object=cls.site,
+                    )
+                    for _ in range(min(INSERT_BATCH_SIZE, ROWS - offset))
+                ])
+
+    def get_request(self, **query_params):
+        """Returns a request of the tags list with query_params."""
+        return Request(APIRequestFactory().get("/eox-tagging/api/v1/tags/", {"page_size": PAGE_SIZE, **query_params}))
+
+    def get_queryset(self):
+        """Returns the owner scoped queryset used by the tags list."""
+        return Tag.objects.active().owned_by(self.site)
+
+    def test_page_latency(self):
+        """Reports the latency of the same pages with page numbers and with cursors."""
+        last_page = Paginator(self.get_queryset().order_by("id"), PAGE_SIZE).num_pages
+        sampled_pages = sorted(
+            {page for page in [1, 10, last_page // 4, last_page // 2, last_page] if 1 <= page <= last_page}
+        )
+
+        print(f"\nPage latency with {ROWS} tags and {PAGE_SIZE} tags per page")
+
+        for page in sampled_pages:
+            request = self.get_request(page=page)
+            start = time.perf_counter()
+            TagApiPagination().paginate_queryset(self.get_queryset(), request)
+            print(f"Page number pagination, page {page}: {(time.perf_counter() - start) * 1000:.3f}ms")
+
+        request = self.get_request(pagination="cursor")
+        for page in range(1, last_page + 1):
+            paginator = TagCursorPagination()
+            start = time.perf_counter()
+            paginator.paginate_queryset(self.get_queryset(), request)
+            duration = time.perf_counter() - start
+
+            if page in sampled_pages:
+                print(f"Cursor pagination, page {page}: {duration * 1000:.3f}ms")
+
+            next_link = paginator.get_next_link()
+            if not next_link:
+                break
+            request = Request(APIRequestFactory().get(next_link))
@@ -0,0 +1,55 @@
+"""
+Benchmark of retrieving a tag by key with and without the retrieve cache.
+"""
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from mock import patch
+from rest_framework.test import APIClient
+
+from eox_tagging.models import Tag
+from eox_tagging.tag_cache import get_tag_cache
+from eox_tagging.test.benchmarks.utils import measure, report, skip_unless_benchmark
+
+REPETITIONS = 2000
+
+
+@skip_unless_benchmark
+@override_settings(
+    EOX_TAGGING_DEFINITIONS=[
+        {
+            "tag_type": "subscription_level",
+            "validate_owner_object": "User",
+            "validate_target_object": "User",
+        },
+    ])
+@patch("eox_tagging.api.v1.permissions.EoxTaggingAPIPermission.has_permission", return_value=True)
+class TestRetrieveCacheBenchmark(TestCase):
+    """Compares the latency of retrieving a tag from the database and from a warm cache."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Creates a tag owned by the requester."""
+        cls.user = User.objects.create(username="retrieve_user")
+        cls.tag = Tag.objects.create(
+            tag_value="premium",
+            tag_type="subscription_level",
+            target_object=User.objects.create(username="retrieve_target"),
+            owner_object=cls.user,
+        )
+
+    def setUp(self):
+        """setUp class."""
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.url = reverse("tag-detail", args=[self.tag.key])
+
+    def test_retrieve_latency(self, _):
+        """Reports the p50/p99 of retrieve without cache and with a warm cache."""
+        with override_settings(EOX_TAGGING_RETRIEVE_CACHE_TIMEOUT=0):
+            report("Retrieve without cache", measure(lambda: self.client.get(self.url), REPETITIONS))
+
+        with override_settings(EOX_TAGGING_RETRIEVE_CACHE_TIMEOUT=300):
+            get_tag_cache().clear()
+            self.client.get(self.url)
+            report("Retrieve with a warm cache", measure(lambda: self.client.get(self.url), REPETITIONS))
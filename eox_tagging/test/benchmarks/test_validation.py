@@ -0,0 +1,62 @@
+"""
+Microbenchmark of the validations run on every tag saved.
+"""
+import datetime
+import time
+
+from django.contrib.auth.models import User
+from django.contrib.sites.models import Site
+from django.test import TestCase, override_settings
+
+from eox_tagging.models import Tag
+from eox_tagging.test.benchmarks.utils import skip_unless_benchmark
+from eox_tagging.validators import validation_plans
+
+REPETITIONS = 20000
+
+DEFINITIONS = [
+    {
+        "tag_type": f"unused_tag_{index}",
+        "validate_tag_value": {"in": ["free", "premium"]},
+        "validate_target_object": "User",
+    }
+    for index in range(20)
+] + [
+    {
+        "tag_type": "subscription_level",
+        "force_access": "private",
+        "validate_tag_value": {"in": ["Free", "Basic", "Premium"], "regex": r"^[a-z]+$"},
+        "validate_target_object": "User",
+        "validate_owner_object": "Site",
+        "validate_expiration_date": {"exist": True, "between": ["2020-01-01 00:00:00", "2030-01-01 00:00:00"]},
+        "validate_activation_date": "2020-06-16 10:20:30",
+    },
+]
+
+
+@skip_unless_benchmark
+@override_settings(EOX_TAGGING_DEFINITIONS=DEFINITIONS)
+class TestValidationBenchmark(TestCase):
+    """Reports the validations per second with and without the compiled plans."""
+
+    def test_validations_per_second(self):
+        """Validates the same unsaved tag with cold and warm validation plans."""
+        tag = Tag(
+            tag_value="premium",
+            tag_type="subscription_level",
+            target_object=User.objects.create(username="validation_user"),
+            owner_object=Site.objects.create(domain="validation.example.com", name="validation"),
+            expiration_date=datetime.datetime(2025, 1, 1),
+            activation_date=datetime.datetime(2020, 6, 16, 10, 20, 30),
+        )
+
+        def validate(clear):
+            start = time.perf_counter()
+            for _ in range(REPETITIONS):
+                if clear:
+                    validation_plans.clear()
+                tag.full_clean()
+            return REPETITIONS / (time.perf_counter() - start)
+
+        print(f"\nValidations per second compiling the definition every time: {validate(clear=True):.0f}")
+        print(f"Validations per second with the compiled plan: {validate(clear=False):.0f}")
@@ -0,0 +1,63 @@
+"""
+Benchmark of serializing a page of the tags list with `TagSerializer` and with `TagValuesSerializer`.
+"""
+from django.contrib.auth.models import User
+from django.contrib.sites.models import Site
+from django.test import TestCase
+
+from eox_tagging.api.v1.serializers import TagSerializer, TagValuesSerializer
+from eox_tagging.models import Tag
+from eox_tagging.test.benchmarks.utils import measure, report, skip_unless_benchmark
+
+PAGE_SIZE = 5000
+REPETITIONS = 20
+SPARSE_FIELDS = ["key", "tag_type", "tag_value", "expiration_date"]
+
+
+@skip_unless_benchmark
+class TestValuesSerializerBenchmark(TestCase):
+    """Compares the latency of reading and serializing a full page with both serializers."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Creates a page of tags owned by a user and a site."""
+        site = Site.objects.create(domain="benchmark.example.com", name="benchmark")
+        user = User.objects.create(username="benchmark_owner")
+        targets = User.objects.bulk_create([User(username=f"benchmark_target_{index}") for index in range(100)])
+        Tag.objects.bulk_create([
+            Tag(
+                tag_value="premium",
+                tag_type="subscription_level",
+                target_object=targets[index % len(targets)],
+                owner_object=user if index % 2 else site,
+            )
+            for index in range(PAGE_SIZE)
+        ])
+
+    def test_serialize_page(self):
+        """Reports the p50/p99 of a whole page and of a sparse page with both serializers."""
+        for title, fields in [("whole", None), ("sparse", SPARSE_FIELDS)]:
+            report(
+                f"TagSerializer {title} page of {PAGE_SIZE} tags",
+                measure(lambda: self.__serialize_instances(fields), REPETITIONS),  # pylint: disable=cell-var-from-loop
+            )
+            report(
+                f"TagValuesSerializer {title} page of {PAGE_SIZE} tags",
+                measure(lambda: self.__serialize_values(fields), REPETITIONS),  # pylint: disable=cell-var-from-loop
+            )
+
+    @staticmethod
+    def __serialize_instances(fields):
+        """Reads and serializes the page with TagSerializer, like the list of previous versions."""
+        queryset = Tag.objects.all()
+        if fields is None:
+            queryset = queryset.prefetch_related("target_object", "owner_object")
+        else:
+            queryset = queryset.only("id", "created_at", *fields)
+        return TagSerializer(list(queryset), many=True, fields=fields).data
+
+    @staticmethod
+    def __serialize_values(fields):
+        """Reads and serializes the page with TagValuesSerializer."""
+        values_serializer = TagValuesSerializer(fields=fields)
+        return values_serializer.serialize(list(values_serializer.get_rows(Tag.objects.all())))
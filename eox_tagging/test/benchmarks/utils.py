@@ -0,0 +1,37 @@
+"""
+Helpers shared by the benchmarks.
+"""
+import os
+import time
+import unittest
+
+skip_unless_benchmark = unittest.skipUnless(os.environ.get("TEST_BENCHMARK"), "Set TEST_BENCHMARK to run benchmarks.")
+
+
+def measure(function, repetitions):
+    """
+    Calls function repetitions times.
+
+    Returns:
+        A sorted list with the duration in seconds of every call.
+    """
+    durations = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+    return sorted(durations)
+
+
+def percentile(durations, value):
+    """Returns the percentile value of a sorted list of durations."""
+    index = min(len(durations) - 1, int(len(durations) * value / 100))
+    return durations[index]
+
+
+def report(title, durations):
+    """Prints the p50/p99 of the sorted durations in milliseconds."""
+    print(
+        f"\n{title}: p50={percentile(durations, 50) * 1000:.3f}ms "
+        f"p99={percentile(durations, 99) * 1000:.3f}ms runs={len(durations)}"
+    )
@@ -0,0 +1,61 @@
+"""
+Test classes for the system checks.
+"""
+from django.core.checks import run_checks
+from django.test import TestCase, override_settings
+
+
+class TestTagDefinitionsCheck(TestCase):
+    """Test class for the EOX_TAGGING_DEFINITIONS system check."""
+
+    def get_error_ids(self):
+        """Returns the ids of the eox_tagging errors reported by the system checks."""
+        return [error.id for error in run_checks() if error.id.startswith("eox_tagging")]
+
+    @override_settings(
+        EOX_TAGGING_DEFINITIONS=[
+            {
+                "tag_type": "subscription_level",
+                "force_access": "private",
+                "validate_tag_value": {"in": ["free", "premium"], "regex": r"^\w+$"},
+                "validate_target_object": "User",
+                "validate_expiration_date": {"between": ["2020-10-19 10:20:30", "2020-12-04 10:20:30"]},
+            },
+        ])
+    def test_valid_definitions(self):
+        """Used to test that valid definitions don't report errors."""
+        self.assertEqual(self.get_error_ids(), [])
+
+    @override_settings(
+        EOX_TAGGING_DEFINITIONS=[
+            {
+                "tag_type": "missing_target",
+                "validate_tag_value": {"in": ["free"]},
+            },
+            {
+                "tag_type": "unknown_validation",
+                "validate_target_object": "User",
+                "validate_tag_value": {"belongs": ["free"]},
+            },
+            {
+                "tag_type": "unknown_field",
+                "validate_target_object": "User",
+                "validate_tag_name": "free",
+            },
+            {
+                "tag_type": "wrong_regex",
+                "validate_target_object": "User",
+                "validate_tag_value": {"regex": "[free"},
+            },
+            {
+                "tag_type": "wrong_date",
+                "validate_target_object": "User",
+                "validate_expiration_date": {"between": ["2020-10-19", "2020-12-04 10:20:30"]},
+            },
+            {
+                "validate_target_object": "User",
+            },
+        ])
+    def test_wrong_definitions(self):
+        """Used to test that every wrongly configured definition is reported."""
+        self.assertEqual(self.get_error_ids(), ["eox_tagging.E002"] * 5 + ["eox_tagging.E001"])
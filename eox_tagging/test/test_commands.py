@@ -0,0 +1,309 @@
+"""
+Test classes for the management commands.
+"""
+import datetime
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+from mock import Mock, patch
+from opaque_keys.edx.keys import CourseKey
+
+from eox_tagging.constants import Status
+from eox_tagging.expiration import SWEEP_LOCK_KEY, deactivate_expired_tags
+from eox_tagging.generations import get_generations
+from eox_tagging.models import OpaqueKeyProxyModel, Tag, TagQuerySet, TagSummary, merge_opaque_key_proxies
+
+
+@override_settings(
+    EOX_TAGGING_DEFINITIONS=[
+        {
+            "tag_type": "example_tag_1",
+            "validate_owner_object": "Site",
+            "validate_target_object": "User",
+        },
+    ])
+class TestBackfillTagNaturalKeys(TestCase):
+    """Test class for the backfill_tag_natural_keys command."""
+
+    def setUp(self):
+        """setUp class."""
+        self.site = Site.objects.create(domain="backfill.example.com", name="backfill")
+        self.tags = [
+            Tag.objects.create_tag(
+                tag_value="example_tag_value",
+                tag_type="example_tag_1",
+                target_object=User.objects.create(username=f"user_{index}"),
+                owner_object=self.site,
+            )
+            for index in range(5)
+        ]
+        Tag.objects.update(target_key=None, owner_key=None)
+
+    def test_backfill(self):
+        """Used to test that the natural keys are stored in chunks."""
+        out = StringIO()
+
+        call_command("backfill_tag_natural_keys", chunk_size=2, stdout=out)
+
+        self.assertIn("5 tags", out.getvalue())
+        for index, tag in enumerate(self.tags):
+            tag.refresh_from_db()
+            self.assertEqual(tag.target_key, f"user_{index}")
+            self.assertEqual(tag.owner_key, "backfill.example.com")
+
+    def test_backfill_is_idempotent(self):
+        """Used to test that tags already backfilled are skipped."""
+        call_command("backfill_tag_natural_keys", stdout=StringIO())
+        out = StringIO()
+
+        call_command("backfill_tag_natural_keys", stdout=out)
+
+        self.assertIn("0 tags", out.getvalue())
+
+
+class TestMergeOpaqueKeyProxies(TransactionTestCase):
+    """Test class for merging duplicated opaque key proxies."""
+
+    migrate_from = [("eox_tagging", "0006_tag_natural_keys")]
+    migrate_to = [("eox_tagging", "0007_opaque_key_unique")]
+
+    def setUp(self):
+        """Creates duplicated proxies in the schema without the unique constraint."""
+        executor = MigrationExecutor(connection)
+        executor.migrate(self.migrate_from)
+        apps = executor.loader.project_state(self.migrate_from).apps
+        proxy_model = apps.get_model("eox_tagging", "OpaqueKeyProxyModel")
+        tag_model = apps.get_model("eox_tagging", "Tag")
+        proxy_ctype = ContentType.objects.get_for_model(OpaqueKeyProxyModel)
+        course_key = CourseKey.from_string("course-v1:edX+DemoX+Demo_Course")
+
+        self.proxies = [proxy_model.objects.create(opaque_key=course_key) for _ in range(3)]
+        for proxy in self.proxies:
+            tag_model.objects.create(
+                tag_value="example_tag_value",
+                tag_type="example_tag_1",
+                target_type_id=proxy_ctype.id,
+                target_object_id=proxy.id,
+            )
+
+    def tearDown(self):
+        """Leaves the schema in its latest state."""
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(executor.loader.graph.leaf_nodes())
+
+    def test_migration_merges_duplicates(self):
+        """Used to test that the duplicated proxies are merged before the constraint is created."""
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+
+        executor.migrate(self.migrate_to)
+
+        kept_proxy = self.proxies[0]
+        self.assertEqual(list(OpaqueKeyProxyModel.objects.values_list("id", flat=True)), [kept_proxy.id])
+        self.assertEqual(
+            set(Tag.objects.values_list("target_object_id", flat=True)),
+            {kept_proxy.id},
+        )
+
+    def test_command_without_duplicates(self):
+        """Used to test the merge command once the proxies are unique."""
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(self.migrate_to)
+        out = StringIO()
+
+        call_command("merge_opaque_key_proxies", stdout=out)
+
+        self.assertIn("Removed 0", out.getvalue())
+
+
+@override_settings(
+    EOX_TAGGING_DEFINITIONS=[
+        {
+            "tag_type": "course_tag",
+            "validate_owner_object": "Site",
+            "validate_target_object": "OpaqueKeyProxyModel",
+        },
+    ])
+class TestMergeOpaqueKeyProxiesSummaries(TestCase):
+    """Test class for the summaries, cached tags and generations of the merged proxies."""
+
+    def setUp(self):
+        """Creates two proxies with tags, the second one is handled as a duplicate of the first one."""
+        self.site = Site.objects.create(domain="merge.example.com", name="merge")
+        self.kept_proxy, self.duplicated_proxy = [
+            OpaqueKeyProxyModel.objects.create(opaque_key=CourseKey.from_string(course_id))
+            for course_id in ["course-v1:edX+DemoX+Demo_Course", "course-v1:edX+DemoX+Duplicated"]
+        ]
+        self.tags = [
+            Tag.objects.create_tag(
+                tag_value="example_tag_value",
+                tag_type="course_tag",
+                target_object=proxy,
+                owner_object=self.site,
+            )
+            for proxy in [self.kept_proxy, self.duplicated_proxy]
+        ]
+
+        self.proxy_model = Mock()
+        self.proxy_model.objects.values.return_value.annotate.return_value.filter.return_value = [
+            {"opaque_key": self.kept_proxy.opaque_key, "kept_id": self.kept_proxy.id},
+        ]
+        self.proxy_model.objects.filter.side_effect = lambda **kwargs: OpaqueKeyProxyModel.objects.filter(
+            **({"id": self.duplicated_proxy.id} if "opaque_key" in kwargs else kwargs)
+        )
+
+    @patch("eox_tagging.models.invalidate_tags")
+    def test_merge_refreshes_summaries(self, invalidate_tags_mock):
+        """Used to test that the repointed tags move to the summary of the kept proxy and their caches are dropped."""
+        generation = get_generations([self.site])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            removed = merge_opaque_key_proxies(self.proxy_model, Tag, ContentType)
+
+        self.assertEqual(removed, 1)
+        self.assertFalse(OpaqueKeyProxyModel.objects.filter(id=self.duplicated_proxy.id).exists())
+        self.assertEqual(
+            [entry["key"] for entry in TagSummary.objects.for_target(self.kept_proxy)],
+            [str(tag.key) for tag in self.tags],
+        )
+        self.assertEqual(TagSummary.objects.count(), 1)
+        invalidate_tags_mock.assert_called_once_with([self.tags[1].key])
+        self.assertGreater(get_generations([self.site]), generation)
+
+
+@override_settings(
+    EOX_TAGGING_DEFINITIONS=[
+        {
+            "tag_type": "example_tag_1",
+            "validate_owner_object": "Site",
+            "validate_target_object": "User",
+        },
+    ])
+class TestDeactivateExpiredTags(TestCase):
+    """Test class for the deactivate_expired_tags command."""
+
+    def setUp(self):
+        """setUp class."""
+        self.site = Site.objects.create(domain="expiration.example.com", name="expiration")
+        self.now = timezone.now()
+        self.expired_tags = [self.create_tag(self.now - datetime.timedelta(days=index)) for index in range(5)]
+        self.tags = [
+            self.create_tag(self.now + datetime.timedelta(days=1)),
+            self.create_tag(None),
+        ]
+
+    def create_tag(self, expiration_date):
+        """Creates a tag that expires at expiration_date."""
+        return Tag.objects.create_tag(
+            tag_value="example_tag_value",
+            tag_type="example_tag_1",
+            target_object=User.objects.create(username=f"user_{Tag.objects.count()}"),
+            owner_object=self.site,
+            expiration_date=expiration_date,
+        )
+
+    def test_deactivate_expired_tags(self):
+        """Used to test that only the expired tags are deactivated, in batches."""
+        out = StringIO()
+
+        call_command("deactivate_expired_tags", batch_size=2, stdout=out)
+
+        self.assertIn("Deactivated 5 expired tags in 3 batches", out.getvalue())
+        self.assertCountEqual(
+            Tag.objects.inactive().values_list("id", flat=True),
+            [tag.id for tag in self.expired_tags],
+        )
+        self.assertFalse(Tag.objects.inactive().exclude(status=Status.INACTIVE).exists())
+
+    def test_deactivate_keeps_inactivation_date(self):
+        """Used to test that tags already inactive are not deactivated again."""
+        self.expired_tags[0].delete()
+        inactivated_at = Tag.objects.get(id=self.expired_tags[0].id).inactivated_at
+
+        stats = deactivate_expired_tags(now=self.now)
+
+        self.assertEqual(stats["deactivated"], 4)
+        self.assertEqual(Tag.objects.get(id=self.expired_tags[0].id).inactivated_at, inactivated_at)
+
+    def test_lock_taken_by_another_sweep(self):
+        """Used to test that a sweep whose lock expired stops and keeps the lock of the sweep that took it."""
+        original_delete = TagQuerySet.delete
+
+        def delete(queryset):
+            cache.set(SWEEP_LOCK_KEY, "other_sweep")  # The lock expired and another node took it
+            return original_delete(queryset)
+
+        with patch.object(TagQuerySet, "delete", delete):
+            stats = deactivate_expired_tags(batch_size=2, now=self.now)
+
+        self.assertEqual((stats["deactivated"], stats["batches"]), (2, 1))
+        self.assertEqual(cache.get(SWEEP_LOCK_KEY), "other_sweep")
+        cache.delete(SWEEP_LOCK_KEY)
+
+    def test_deactivate_while_another_sweep_runs(self):
+        """Used to test that only one sweep runs at a time."""
+        cache.add(SWEEP_LOCK_KEY, True)
+        out = StringIO()
+
+        try:
+            call_command("deactivate_expired_tags", stdout=out)
+        finally:
+            cache.delete(SWEEP_LOCK_KEY)
+
+        self.assertIn("Another expiration sweep is running", out.getvalue())
+        self.assertFalse(Tag.objects.inactive().exists())
+        self.assertEqual(deactivate_expired_tags(now=self.now)["deactivated"], 5)
+
+
+@override_settings(
+    EOX_TAGGING_DEFINITIONS=[
+        {
+            "tag_type": "example_tag_1",
+            "validate_owner_object": "Site",
+            "validate_target_object": "User",
+        },
+    ])
+class TestRebuildTagSummaries(TestCase):
+    """Test class for the rebuild_tag_summaries command."""
+
+    def setUp(self):
+        """setUp class."""
+        self.site = Site.objects.create(domain="summaries.example.com", name="summaries")
+        self.users = [User.objects.create(username=f"user_{index}") for index in range(5)]
+        self.tags = [
+            Tag.objects.create(
+                tag_value="example_tag_value",
+                tag_type="example_tag_1",
+                target_object=user,
+                owner_object=self.site,
+            )
+            for user in self.users
+        ]
+        TagSummary.objects.all().delete()  # Summaries missing, e.g. tags created before the table existed
+
+    def test_rebuild(self):
+        """Used to test that the missing summaries are created and the stale ones dropped, in batches."""
+        stale_user = User.objects.create(username="stale")
+        TagSummary.objects.create(
+            target_type=ContentType.objects.get_for_model(User),
+            target_object_id=stale_user.id,
+            tags=[{"key": "stale"}],
+        )
+        out = StringIO()
+
+        call_command("rebuild_tag_summaries", batch_size=2, stdout=out)
+
+        self.assertIn("Refreshed the summaries of 6 targets, 5 stored", out.getvalue())
+        for user, tag in zip(self.users, self.tags):
+            self.assertEqual([entry["key"] for entry in TagSummary.objects.for_target(user)], [str(tag.key)])
+        self.assertEqual(TagSummary.objects.for_target(stale_user), [])
@@ -0,0 +1,100 @@
+"""
+Test classes for the content type cache.
+"""
+import threading
+import time
+
+from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.core.exceptions import ObjectDoesNotExist
+from django.test import TestCase
+from mock import patch
+
+from eox_tagging.content_types import CACHE_CONTENT_TYPE_KEY, ContentTypeCache
+
+
+class TestContentTypeCache(TestCase):
+    """Test class for the two-tier content type cache."""
+
+    def setUp(self):
+        """setUp class."""
+        cache.clear()
+        self.content_type_cache = ContentTypeCache(max_size=2)
+        self.user_ctype = ContentType.objects.get_for_model(User)
+
+    def test_tiers(self):
+        """Used to test that lookups are served by the database, the shared cache and the local tier."""
+        self.assertEqual(self.content_type_cache.get("User"), self.user_ctype)
+        self.assertEqual(self.content_type_cache.get("user"), self.user_ctype)
+        ContentTypeCache().get("user")
+        other_process = ContentTypeCache()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(other_process.get("user"), self.user_ctype)
+
+        self.assertEqual(self.content_type_cache.stats, {"local_hits": 1, "shared_hits": 0, "misses": 1})
+        self.assertEqual(other_process.stats, {"local_hits": 0, "shared_hits": 1, "misses": 0})
+
+    def test_app_label(self):
+        """Used to test lookups using the natural key of the content type."""
+        self.assertEqual(self.content_type_cache.get("user", app_label="auth"), self.user_ctype)
+
+    def test_missing_content_type(self):
+        """Used to test that unknown models raise DoesNotExist."""
+        with self.assertRaises(ObjectDoesNotExist):
+            self.content_type_cache.get("unknownmodel")
+
+    def test_lru_eviction(self):
+        """Used to test that the local tier keeps only the most recently used content types."""
+        self.content_type_cache.get("user")
+        self.content_type_cache.get("site")
+        self.content_type_cache.get("contenttype")
+        cache.clear()
+        self.content_type_cache.reset_stats()
+
+        self.content_type_cache.get("user")
+
+        self.assertEqual(self.content_type_cache.stats["misses"], 1)
+
+    def test_stale_content_type(self):
+        """Used to test that a content type removed from the database is loaded again."""
+        stale_ctype = ContentType.objects.create(app_label="stale", model="stalemodel")
+        self.content_type_cache.get("stalemodel")
+        stale_ctype.delete()
+        ContentType.objects.clear_cache()
+        new_ctype = ContentType.objects.create(app_label="stale", model="stalemodel")
+
+        self.assertEqual(self.content_type_cache.get("stalemodel"), new_ctype)
+
+    def test_single_flight(self):
+        """Used to test that concurrent lookups of a cold key query the database once."""
+        barrier = threading.Barrier(4)
+        original_query = ContentTypeCache._ContentTypeCache__query  # pylint: disable=protected-access
+
+        def slow_query(content_type_cache, key):
+            time.sleep(0.05)  # Keep the other threads waiting for the load
+            return original_query(content_type_cache, key)
+
+        def lookup():
+            barrier.wait()
+            self.content_type_cache.get("user")
+
+        with patch.object(ContentTypeCache, "_ContentTypeCache__query", autospec=True, side_effect=slow_query):
+            threads = [threading.Thread(target=lookup) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(self.content_type_cache.stats["misses"], 1)
+
+    @patch("eox_tagging.content_types.CACHE_CONTENT_TYPE_LOCK_WAIT", 0)
+    def test_lock_retries_exhausted(self):
+        """Used to test that a worker that never gets the lock loads the key and keeps the lock of its owner."""
+        lock_key = f"{CACHE_CONTENT_TYPE_KEY.format(app_label='', model='user')}_lock"
+        cache.add(lock_key, True)
+
+        self.assertEqual(self.content_type_cache.get("user"), self.user_ctype)
+        self.assertEqual(self.content_type_cache.stats["misses"], 1)
+        self.assertTrue(cache.get(lock_key))
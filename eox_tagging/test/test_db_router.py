@@ -0,0 +1,125 @@
+"""
+Test classes for the database router of the eox_tagging models.
+"""
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connections, router
+from django.test import TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from mock import patch
+from rest_framework.test import APIClient
+
+from eox_tagging.db_router import TaggingRouter, iter_from_replica, read_from_replica
+from eox_tagging.models import Tag
+
+
+@override_settings(
+    DATABASE_ROUTERS=["eox_tagging.db_router.TaggingRouter"],
+    EOX_TAGGING_READ_DATABASE="replica",
+    EOX_TAGGING_READ_YOUR_WRITES_TIMEOUT=5,
+    EOX_TAGGING_DEFINITIONS=[
+        {
+            "tag_type": "example_tag_1",
+            "validate_owner_object": "User",
+            "validate_target_object": "User",
+        },
+    ])
+@patch("eox_tagging.api.v1.permissions.EoxTaggingAPIPermission.has_permission", return_value=True)
+class TestTaggingRouter(TransactionTestCase):
+    """
+    Test class for the database router.
+
+    The replica alias mirrors the default database, the reads sent to it are told apart by the
+    queries run on its connection. The tags are committed so the replica connection sees them.
+    """
+
+    databases = {"default", "replica"}
+
+    def setUp(self):
+        """setUp class."""
+        self.user = User.objects.create(username="router_user")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.tag = Tag.objects.create(
+            tag_value="example_tag_value",
+            tag_type="example_tag_1",
+            target_object=User.objects.create(username="router_target"),
+            owner_object=self.user,
+        )
+        cache.clear()  # The read-your-writes window of the creation is over
+
+    def capture_replica_tag_queries(self):
+        """Returns a context capturing the queries run on the replica, see get_tag_queries."""
+        return CaptureQueriesContext(connections["replica"])
+
+    @staticmethod
+    def get_tag_queries(context):
+        """Returns the captured queries that read the tag table."""
+        return [query["sql"] for query in context.captured_queries if 'FROM "eox_tagging_tag"' in query["sql"]]
+
+    def test_routing(self, _):
+        """Used to test that writes and reads go to the primary outside the API read blocks."""
+        self.assertEqual(router.db_for_write(Tag), "default")
+        self.assertEqual(router.db_for_read(Tag), "default")
+        self.assertEqual(router.db_for_read(User), "default")
+
+        with read_from_replica(), self.capture_replica_tag_queries() as replica_queries:
+            self.assertEqual(router.db_for_read(Tag), "replica")
+            self.assertEqual(router.db_for_read(User), "default")
+            self.assertTrue(Tag.objects.exists())
+            self.assertEqual(router.db_for_read(Tag, instance=self.tag), "default")
+
+        self.assertEqual(len(self.get_tag_queries(replica_queries)), 1)
+
+    def test_allow_migrate(self, _):
+        """Used to test that the plugin models are only migrated in the write database."""
+        tagging_router = TaggingRouter()
+
+        self.assertTrue(tagging_router.allow_migrate("default", "eox_tagging"))
+        self.assertFalse(tagging_router.allow_migrate("replica", "eox_tagging"))
+        self.assertFalse(tagging_router.allow_migrate("other", "eox_tagging"))
+        self.assertIsNone(tagging_router.allow_migrate("other", "auth"))
+
+    def test_iter_from_replica(self, _):
+        """Used to test that every item of a lazy iterator is read from the replica."""
+        with self.capture_replica_tag_queries() as replica_queries:
+            chunks = list(iter_from_replica(Tag.objects.all().iter_batches(10)))
+
+        self.assertEqual(chunks, [[self.tag]])
+        self.assertEqual(len(self.get_tag_queries(replica_queries)), 2)
+
+    def test_list_from_replica(self, _):
+        """Used to test that the list is read from the replica."""
+        with self.capture_replica_tag_queries() as replica_queries:
+            response = self.client.get(reverse("tag-list"))
+
+        self.assertEqual(response.data["count"], 1)
+        self.assertTrue(self.get_tag_queries(replica_queries))
+
+    def test_read_your_writes(self, _):
+        """Used to test that the tags of an owner are read from the primary right after a write."""
+        Tag.objects.filter(id=self.tag.id).delete()
+
+        with self.capture_replica_tag_queries() as replica_queries:
+            response = self.client.get(reverse("tag-list"), {"include_inactive": "true"})
+
+        self.assertEqual(response.data["count"], 1)
+        self.assertFalse(self.get_tag_queries(replica_queries))
+
+    @override_settings(EOX_TAGGING_RETRIEVE_CACHE_TIMEOUT=0)
+    def test_retrieve_from_replica(self, _):
+        """Used to test that a tag is read from the replica when the retrieve cache is disabled."""
+        with self.capture_replica_tag_queries() as replica_queries:
+            response = self.client.get(reverse("tag-detail", args=[self.tag.key]))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(self.get_tag_queries(replica_queries))
+
+    def test_retrieve_cache_filled_from_primary(self, _):
+        """Used to test that the retrieve cache is filled from the primary."""
+        with self.capture_replica_tag_queries() as replica_queries:
+            response = self.client.get(reverse("tag-detail", args=[self.tag.key]))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(self.get_tag_queries(replica_queries))
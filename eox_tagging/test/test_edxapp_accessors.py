@@ -0,0 +1,303 @@
+"""
+Test classes for the resolvers of edx-platform objects.
+"""
+import sys
+from importlib import import_module
+
+from django.contrib.auth.models import User
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import connection, models
+from django.db.models import OuterRef, Q
+from django.test import TestCase, override_settings
+from mock import Mock, patch
+from opaque_keys.edx.keys import CourseKey
+
+from eox_tagging.edxapp_accessors import (
+    get_certificates,
+    get_course_enrollment,
+    get_course_enrollments,
+    get_courses,
+    get_site_membership_filter,
+    get_users,
+)
+
+EOX_CORE_USERS_BACKEND = "eox_core.edxapp_wrapper.backends.users_q_v1"
+EOX_CORE_USER_ORIGIN_SITE_SOURCES = [
+    "fetch_from_unfiltered_table",
+    "fetch_from_user_signup_source",
+    "fetch_from_created_on_site_prop",
+]
+PLATFORM_MODULES = [
+    "common.djangoapps.student.helpers",
+    "common.djangoapps.student.models",
+    "openedx.core.djangoapps.lang_pref",
+    "openedx.core.djangoapps.site_configuration",
+    "openedx.core.djangoapps.user_api.accounts",
+    "openedx.core.djangoapps.user_api.accounts.serializers",
+    "openedx.core.djangoapps.user_api.accounts.views",
+    "openedx.core.djangoapps.user_api.models",
+    "openedx.core.djangoapps.user_api.preferences",
+    "openedx.core.djangoapps.user_authn.views.register",
+    "openedx.core.djangoapps.user_authn.views.registration_form",
+    "openedx.core.djangolib.oauth2_retirement_utils",
+    "social_django.models",
+]
+
+
+class UserSignupSource(models.Model):
+    """Stands in for the UserSignupSource model of the platform."""
+
+    user = models.ForeignKey(User, on_delete=models.DO_NOTHING, db_constraint=False)
+    site = models.CharField(max_length=255)
+
+    objects = models.Manager()
+
+    class Meta:
+        """Meta class. """
+        app_label = "eox_tagging"
+
+
+class UserAttribute(models.Model):
+    """Stands in for the UserAttribute model of the platform."""
+
+    user = models.ForeignKey(User, on_delete=models.DO_NOTHING, db_constraint=False)
+    name = models.CharField(max_length=255)
+    value = models.CharField(max_length=255)
+
+    objects = models.Manager()
+
+    class Meta:
+        """Meta class. """
+        app_label = "eox_tagging"
+
+    @classmethod
+    def get_user_attribute(cls, user, name):
+        """Returns the value of the attribute name of user, like the platform does."""
+        try:
+            return cls.objects.get(user=user, name=name).value
+        except cls.DoesNotExist:  # pylint: disable=no-member
+            return None
+
+
+def import_eox_core_users_backend():
+    """Imports the users backend of eox-core with the platform modules it needs replaced."""
+    platform_modules = {name: Mock() for name in PLATFORM_MODULES}
+    platform_modules["common.djangoapps.student.models"] = Mock(
+        UserSignupSource=UserSignupSource,
+        UserAttribute=UserAttribute,
+    )
+    with patch.dict(sys.modules, platform_modules):
+        sys.modules.pop(EOX_CORE_USERS_BACKEND, None)
+        return import_module(EOX_CORE_USERS_BACKEND)
+
+
+@override_settings(EOX_TAGGING_SKIP_VALIDATIONS=False)
+class TestEdxappAccessors(TestCase):
+    """Test class for the enrollment and certificate resolvers."""
+
+    def setUp(self):
+        """setUp class."""
+        self.site = Mock(domain="tenant.example.com")
+        self.course_key = CourseKey.from_string("course-v1:edX+Demo+2025")
+        self.request_patch = patch(
+            "eox_tagging.edxapp_accessors.crum.get_current_request",
+            return_value=Mock(site=self.site),
+        )
+        self.request_patch.start()
+        self.addCleanup(self.request_patch.stop)
+
+    def get_user_course_object(self, username):
+        """Returns an enrollment or certificate like object of username in the test course."""
+        return Mock(user=Mock(username=username), course_id=self.course_key)
+
+    @patch("eox_tagging.edxapp_accessors.get_configuration_helper")
+    def test_unfiltered_site_membership(self, configuration_helper_mock):
+        """Used to test that no condition is added when users are not filtered by site."""
+        configuration_helper_mock.return_value.get_value.return_value = ["fetch_from_unfiltered_table"]
+
+        self.assertEqual(get_site_membership_filter(self.site), Q())
+
+    @patch("eox_tagging.edxapp_accessors.get_user_attribute")
+    @patch("eox_tagging.edxapp_accessors.get_user_signup_source")
+    @patch("eox_tagging.edxapp_accessors.get_configuration_helper")
+    def test_site_membership_subqueries(self, configuration_helper_mock, signup_source_mock, user_attribute_mock):
+        """Used to test that the enabled site sources are checked with subqueries on the user of the row."""
+        configuration_helper_mock.return_value.get_value.return_value = [
+            "fetch_from_user_signup_source",
+            "fetch_from_created_on_site_prop",
+        ]
+
+        with patch("eox_tagging.edxapp_accessors.Exists"):
+            get_site_membership_filter(self.site)
+
+        signup_source_mock.return_value.objects.filter.assert_called_once_with(
+            user_id=OuterRef("user_id"),
+            site="tenant.example.com",
+        )
+        user_attribute_mock.return_value.objects.filter.assert_called_once_with(
+            user_id=OuterRef("user_id"),
+            name="created_on_site",
+            value="tenant.example.com",
+        )
+
+    @patch("eox_tagging.edxapp_accessors.get_user_signup_source")
+    @patch("eox_tagging.edxapp_accessors.get_configuration_helper")
+    def test_user_site_membership(self, configuration_helper_mock, signup_source_mock):
+        """Used to test that the site membership of the users is checked on the user id."""
+        configuration_helper_mock.return_value.get_value.return_value = ["fetch_from_user_signup_source"]
+
+        with patch("eox_tagging.edxapp_accessors.Exists"):
+            get_site_membership_filter(self.site, user_field=None)
+
+        signup_source_mock.return_value.objects.filter.assert_called_once_with(
+            user_id=OuterRef("pk"),
+            site="tenant.example.com",
+        )
+
+    @patch("eox_tagging.edxapp_accessors.get_edxapp_user")
+    @patch("eox_tagging.edxapp_accessors.get_site_membership_filter", return_value=Q(username__startswith="j"))
+    def test_get_users(self, membership_filter_mock, get_edxapp_user_mock):
+        """Used to test that many users are resolved with one query checking their site membership."""
+        john, jane = User.objects.create(username="john"), User.objects.create(username="jane")
+        User.objects.create(username="mike")
+
+        with self.assertNumQueries(1):
+            users = get_users([{"target_id": "john"}, {"target_id": "jane"}, {"target_id": "mike"}])
+
+        self.assertEqual(users, {"john": john, "jane": jane})
+        membership_filter_mock.assert_called_once_with(self.site, user_field=None)
+        get_edxapp_user_mock.assert_not_called()
+
+    @patch("eox_tagging.edxapp_accessors.CourseOverview")
+    def test_get_courses(self, course_overview_mock):
+        """Used to test that the courses without overview are loaded like a single course, creating the overview."""
+        created_key = CourseKey.from_string("course-v1:edX+Created+2025")
+        missing_key = CourseKey.from_string("course-v1:edX+Missing+2025")
+        course, created_course = Mock(id=self.course_key), Mock(id=created_key)
+        course_overview_mock.objects.filter.return_value = [course]
+
+        def get_from_id(course_key):
+            if course_key != created_key:
+                raise ObjectDoesNotExist
+            return created_course
+
+        course_overview_mock.get_from_id.side_effect = get_from_id
+
+        courses = get_courses([{"target_id": str(key)} for key in [self.course_key, created_key, missing_key]])
+
+        self.assertEqual(courses, {str(self.course_key): course, str(created_key): created_course})
+        self.assertEqual(course_overview_mock.get_from_id.call_count, 2)
+
+    @patch("eox_tagging.edxapp_accessors.get_edxapp_user")
+    @patch("eox_tagging.edxapp_accessors.get_site_membership_filter", return_value=Q())
+    @patch("eox_tagging.edxapp_accessors.CourseEnrollment")
+    def test_get_course_enrollment(self, enrollment_mock, _, get_edxapp_user_mock):
+        """Used to test that an enrollment is resolved with one query joining the user."""
+        queryset = enrollment_mock.objects.select_related.return_value.filter.return_value
+
+        enrollment = get_course_enrollment(username="john", course_id=str(self.course_key))
+
+        self.assertEqual(enrollment, queryset.get.return_value)
+        enrollment_mock.objects.select_related.assert_called_once_with("user")
+        queryset.get.assert_called_once_with(user__username="john", course_id=self.course_key)
+        get_edxapp_user_mock.assert_not_called()
+
+    @patch("eox_tagging.edxapp_accessors.get_site_membership_filter", return_value=Q())
+    @patch("eox_tagging.edxapp_accessors.CourseEnrollment")
+    def test_get_course_enrollments(self, enrollment_mock, _):
+        """Used to test that many enrollments are resolved with one query."""
+        queryset = enrollment_mock.objects.select_related.return_value.filter.return_value
+        john, jane = self.get_user_course_object("john"), self.get_user_course_object("jane")
+        queryset.filter.return_value = [john, jane]
+
+        enrollments = get_course_enrollments([
+            {"username": "john", "course_id": str(self.course_key)},
+            {"username": "jane", "course_id": str(self.course_key)},
+            {"username": "mike", "course_id": str(self.course_key)},
+            {"username": "john", "course_id": "invalid course"},
+        ])
+
+        self.assertEqual(
+            enrollments,
+            {("john", str(self.course_key)): john, ("jane", str(self.course_key)): jane},
+        )
+        queryset.filter.assert_called_once_with(
+            user__username__in={"john", "jane", "mike"},
+            course_id__in={self.course_key},
+        )
+
+    @patch("eox_tagging.edxapp_accessors.GeneratedCertificate")
+    def test_get_certificates(self, certificate_mock):
+        """Used to test that the certificates of many users and courses are resolved with one query."""
+        john = self.get_user_course_object("john")
+        certificate_mock.objects.select_related.return_value.filter.return_value = [john]
+
+        certificates = get_certificates([
+            {"username": "john", "course_id": str(self.course_key)},
+            {"username": "jane", "course_id": str(self.course_key)},
+        ])
+
+        self.assertEqual(certificates, {("john", str(self.course_key)): john})
+        certificate_mock.objects.select_related.return_value.filter.assert_called_once()
+
+
+class TestSiteMembershipParity(TestCase):
+    """Test class comparing the site membership filter with the site sources of eox-core."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Creates the tables of the platform models before the test transaction starts."""
+        with connection.schema_editor() as schema_editor:
+            schema_editor.create_model(UserSignupSource)
+            schema_editor.create_model(UserAttribute)
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Drops the tables of the platform models."""
+        super().tearDownClass()
+        with connection.schema_editor() as schema_editor:
+            schema_editor.delete_model(UserAttribute)
+            schema_editor.delete_model(UserSignupSource)
+
+    def setUp(self):
+        """setUp class."""
+        self.site = Mock(domain="tenant.example.com")
+        self.fetch_user_site_sources = import_eox_core_users_backend().FetchUserSiteSources
+
+        signup_user = User.objects.create(username="signup")
+        UserSignupSource.objects.create(user=signup_user, site="tenant.example.com")
+        attribute_user = User.objects.create(username="attribute")
+        UserAttribute.objects.create(user=attribute_user, name="created_on_site", value="tenant.example.com")
+        other_site_user = User.objects.create(username="other_site")
+        UserSignupSource.objects.create(user=other_site_user, site="other.example.com")
+        UserAttribute.objects.create(user=other_site_user, name="created_on_site", value="other.example.com")
+        other_attribute_user = User.objects.create(username="other_attribute")
+        UserAttribute.objects.create(user=other_attribute_user, name="language", value="tenant.example.com")
+        User.objects.create(username="no_site")
+
+    def get_eox_core_members(self, sources, site):
+        """Returns the usernames that get_edxapp_user of eox-core finds in site."""
+        methods = [getattr(self.fetch_user_site_sources, source) for source in sources]
+        domain = getattr(site, "domain", None)
+        return {user.username for user in User.objects.all() if any(method(user, domain) for method in methods)}
+
+    @patch("eox_tagging.edxapp_accessors.get_user_attribute", return_value=UserAttribute)
+    @patch("eox_tagging.edxapp_accessors.get_user_signup_source", return_value=UserSignupSource)
+    @patch("eox_tagging.edxapp_accessors.get_configuration_helper")
+    def test_site_sources_parity(self, configuration_helper_mock, *_):
+        """Used to test that the filter keeps the users found by eox-core for every site source."""
+        for sources in [[source] for source in EOX_CORE_USER_ORIGIN_SITE_SOURCES] + [
+            EOX_CORE_USER_ORIGIN_SITE_SOURCES[1:],
+            EOX_CORE_USER_ORIGIN_SITE_SOURCES,
+        ]:
+            for site in [self.site, None]:
+                with self.subTest(sources=sources, site=site):
+                    configuration_helper_mock.return_value.get_value.return_value = sources
+
+                    members = User.objects.filter(get_site_membership_filter(site, user_field=None))
+
+                    self.assertEqual(
+                        {user.username for user in members},
+                        self.get_eox_core_members(sources, site),
+                    )
@@ -7,13 +7,18 @@ from django.contrib.auth.models import User
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.sites.models import Site
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
-from django.test import TestCase, override_settings
+from django.db import IntegrityError, connection
+from django.db.models import Q
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from mock import Mock, patch
 from opaque_keys.edx.keys import CourseKey
 
 from eox_tagging.constants import AccessLevel
-from eox_tagging.models import OpaqueKeyProxyModel, Tag, TagQuerySet
+from eox_tagging.generations import get_generations
+from eox_tagging.models import OpaqueKeyProxyModel, OpaqueKeyProxyQuerySet, Tag, TagQuerySet, TagSummary
+from eox_tagging.validators import compile_validation_plan, validation_plans
 
 
 @override_settings(
@@ -229,6 +234,154 @@ class TestTag(TestCase):
                 access=AccessLevel.PRIVATE,
             )
 
+    @override_settings(
+        EOX_TAGGING_DEFINITIONS=[
+            {
+                "tag_type": "subscription_tier",
+                "force_access": "private",
+                "validate_tag_value": {"in": ["free", "private"]},
+                "validate_owner_object": "User",
+                "validate_target_object": "User",
+            },
+        ])
+    def test_bulk_create_tags(self):
+        """
+        Used to test that the configuration validated for the first tag of a type is reused,
+        including the forced values, and that invalid tags are reported by position.
+        """
+        tags = [
+            Tag(tag_value=tag_value, tag_type="subscription_tier", target_object=self.target_object,
+                owner_object=self.owner_object)
+            for tag_value in ["free", "premium", "private"]
+        ]
+
+        with patch("eox_tagging.validators.compile_validation_plan",
+                   side_effect=compile_validation_plan) as compile_plan:
+            created, errors = Tag.objects.bulk_create_tags(tags)
+
+        self.assertEqual(compile_plan.call_count, 1)
+        self.assertEqual([tag.tag_value for tag in created], ["free", "private"])
+        self.assertEqual([tag.access.name for tag in created], ["PRIVATE", "PRIVATE"])
+        self.assertEqual(list(errors), [1])
+        self.assertEqual(Tag.objects.filter(tag_type="subscription_tier").count(), 2)
+
+    def test_validation_plan_follows_settings(self):
+        """Used to test that the compiled definitions are dropped when the setting changes."""
+        definition = {
+            "tag_type": "subscription_tier",
+            "validate_tag_value": {"in": ["Free"]},
+            "validate_owner_object": "User",
+            "validate_target_object": "User",
+        }
+        tag_data = {
+            "tag_value": "free",
+            "tag_type": "subscription_tier",
+            "target_object": self.target_object,
+            "owner_object": self.owner_object,
+        }
+
+        with override_settings(EOX_TAGGING_DEFINITIONS=[definition]):
+            self.assertIsNotNone(Tag.objects.create_tag(**tag_data).id)
+
+        with override_settings(EOX_TAGGING_DEFINITIONS=[{**definition, "validate_tag_value": {"in": ["premium"]}}]):
+            with self.assertRaises(ValidationError):
+                Tag.objects.create_tag(**tag_data)
+
+    def test_unknown_tag_types_not_cached(self):
+        """Used to test that the tag types sent by clients that are not configured don't grow the plans cache."""
+        for index in range(3):
+            with self.assertRaisesMessage(ValidationError, f"Tag_type 'unknown_{index}' not configured"):
+                Tag.objects.create_tag(
+                    tag_value="example_tag_value",
+                    tag_type=f"unknown_{index}",
+                    target_object=self.target_object,
+                    owner_object=self.owner_object,
+                )
+
+        plans = validation_plans._plans  # pylint: disable=protected-access
+        self.assertFalse([tag_type for tag_type in plans if tag_type.startswith("unknown_")])
+
+    def test_iter_batches_while_deleting(self):
+        """Used to test that deactivating the tags of each chunk doesn't skip the following ones."""
+        queryset = Tag.objects.active()
+        expected_ids = list(queryset.order_by("id").values_list("id", flat=True))
+
+        batches = []
+        for batch in queryset.iter_batches(2, fields=["key"]):
+            ids = [tag_id for tag_id, _ in batch]
+            Tag.objects.filter(id__in=ids).delete()
+            batches.append(ids)
+
+        self.assertTrue(all(len(batch) <= 2 for batch in batches))
+        self.assertEqual(sum(batches, []), expected_ids)
+        self.assertFalse(Tag.objects.active().exists())
+
+    def test_effective_boundaries(self):
+        """Used to test the activation and expiration window of the tags in force."""
+        now = timezone.now()
+        hour = datetime.timedelta(hours=1)
+        windows = {
+            "open": (None, None),
+            "activated_now": (now, None),
+            "activated_before": (now - hour, now + hour),
+            "activated_later": (now + hour, None),
+            "expires_now": (None, now),
+            "expires_later": (None, now + hour),
+            "expired": (now - hour, now - hour),
+        }
+        Tag.objects.bulk_create([
+            Tag(
+                tag_value=name,
+                tag_type="effective_tag",
+                target_object=self.target_object,
+                owner_object=self.owner_object,
+                activation_date=activation_date,
+                expiration_date=expiration_date,
+            )
+            for name, (activation_date, expiration_date) in windows.items()
+        ])
+        Tag.objects.filter(tag_value="activated_before").update(tag_type="inactive_tag")
+        Tag.objects.filter(tag_type="inactive_tag").delete()
+        tags = Tag.objects.filter(tag_type="effective_tag")
+
+        effective = set(tags.effective(at=now).values_list("tag_value", flat=True))
+        not_effective = set(tags.not_effective(at=now).values_list("tag_value", flat=True))
+
+        self.assertEqual(effective, {"open", "activated_now", "expires_later"})
+        self.assertEqual(not_effective, {"activated_later", "expires_now", "expired"})
+        self.assertFalse(Tag.objects.filter(tag_type="inactive_tag").effective(at=now).exists())
+
+    def test_as_of(self):
+        """Used to test the tags active at a point in time, including the ones inactivated later."""
+        now = timezone.now()
+        day = datetime.timedelta(days=1)
+        history = {
+            "created_before": (now - day, None),
+            "created_at_time": (now, None),
+            "created_after": (now + day, None),
+            "inactivated_after": (now - day, now + day),
+            "inactivated_at_time": (now - day, now),
+            "inactivated_before": (now - 2 * day, now - day),
+        }
+        Tag.objects.bulk_create([
+            Tag(
+                tag_value=tag_value,
+                tag_type="history_tag",
+                target_object=self.target_object,
+                owner_object=self.owner_object,
+            )
+            for tag_value in history
+        ])
+        for tag_value, (created_at, inactivated_at) in history.items():
+            Tag.objects.filter(tag_value=tag_value).update(created_at=created_at, inactivated_at=inactivated_at)
+
+        tags = Tag.objects.filter(tag_type="history_tag").as_of(now)
+
+        self.assertCountEqual(
+            tags.values_list("tag_value", flat=True),
+            ["created_before", "created_at_time", "inactivated_after"],
+        )
+
     def test_valid_tag(self):
         """ Used to confirm that the tags created are valid."""
         tag_status = getattr(self.test_tag, "status")
@@ -332,12 +485,84 @@ class TestTag(TestCase):
 
         self.assertEqual(tags_owned.first().owner_object_id, self.owner_object.id)
 
+    async def test_afind_by_owner(self):
+        """Used to confirm that tags can be found by owner from async code."""
+        tags_owned = await Tag.objects.afind_by_owner(owner_type="user", owner_id={"username": "User"})
+
+        self.assertEqual((await tags_owned.afirst()).owner_object_id, self.owner_object.id)
+
+    def test_owned_by(self):
+        """Used to confirm that tags can be scoped by already resolved owners in one query."""
+        with self.assertNumQueries(1):
+            tags_owned = list(Tag.objects.owned_by(self.owner_object, self.fake_owner_object))
+
+        self.assertEqual(tags_owned, [self.test_tag])
+
+    def test_owned_by_without_owners(self):
+        """Used to confirm that scoping by no owners returns no tags."""
+        self.assertFalse(Tag.objects.owned_by().exists())
+
     def test_find_all_tags_for(self):
         """Used to confirm that can retrieve tags by target object."""
         tags = Tag.objects.find_all_tags_for(target_type="user", target_id={"username": "Tag"})
 
         self.assertEqual(tags.first().target_object_id, self.target_object.id)
 
+    async def test_afind_all_tags_for(self):
+        """Used to confirm that tags can be found by target object from async code."""
+        tags = await Tag.objects.afind_all_tags_for(target_type="user", target_id={"username": "Tag"})
+
+        self.assertEqual([tag.target_object_id async for tag in tags.active()], [self.target_object.id])
+
+    def test_object_types_without_loading_objects(self):
+        """Used to confirm that the target and owner types are taken from their content types."""
+        tag = Tag.objects.get(id=self.test_tag.id)
+        ContentType.objects.get_for_model(User)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(tag.target_object_type, "User")
+            self.assertEqual(tag.owner_object_type, "User")
+
+    def test_natural_keys_stored(self):
+        """Used to confirm that the natural keys of the target and owner are stored on creation."""
+        self.assertEqual(self.test_tag.target_key, "Tag")
+        self.assertEqual(self.test_tag.owner_key, "User")
+
+    @override_settings(EOX_TAGGING_FILTER_BY_TARGET_KEY=True)
+    def test_find_all_tags_for_by_target_key(self):
+        """Used to confirm that tags can be retrieved by target without querying the target table."""
+        ContentType.objects.get_for_model(User)
+        with self.assertNumQueries(1):
+            tags = list(Tag.objects.find_all_tags_for(target_type="user", target_id={"username": "Tag"}))
+
+        self.assertEqual(tags, [self.test_tag])
+
+    @override_settings(EOX_TAGGING_FILTER_BY_TARGET_KEY=True)
+    def test_find_by_owner_by_owner_key(self):
+        """Used to confirm that tags can be retrieved by owner using the stored natural key."""
+        tags_owned = Tag.objects.find_by_owner(owner_type="user", owner_id={"username": "User"})
+
+        self.assertEqual(list(tags_owned), [self.test_tag])
+
+    @override_settings(EOX_TAGGING_FILTER_BY_TARGET_KEY=True)
+    def test_natural_key_lookups(self):
+        """Used to confirm the natural key lookups built for each target type."""
+        ContentType.objects.get_or_create(app_label="student", model="courseenrollment")
+        queryset = Tag.objects.all()
+        course_id = "course-v1:edX+FUN101x+3T2017"
+
+        self.assertIn(
+            f"Tag:{course_id}",
+            str(queryset.find_all_tags_for("courseenrollment", {"username": "Tag", "course_id": course_id}).query),
+        )
+        self.assertIn(
+            "LIKE Tag:%",
+            str(queryset.find_all_tags_for("courseenrollment", {"username": "Tag"}).query),
+        )
+        self.assertIsNone(queryset._find_by_natural_key(  # pylint: disable=protected-access
+            "target", "courseenrollment", {"course_id": course_id},
+        ))
+
     def test_tag_soft_delete(self):
         """
         Used to confirm that the tags can be invalidated soft deleting them.
@@ -507,6 +732,331 @@ class TestTag(TestCase):
 
         self.assertFalse(Tag.objects.active())
 
+    def test_summary_refreshed_on_writes(self):
+        """Used to test that the summary of a target follows the creation and deletion of its tags."""
+        other_tag = Tag.objects.create_tag(
+            tag_value="example_tag_value",
+            tag_type="example_tag_4",
+            target_object=self.target_object,
+            owner_object=self.fake_owner_object,
+        )
+
+        summary = TagSummary.objects.for_target(self.target_object)
+        self.assertEqual([entry["key"] for entry in summary], [str(self.test_tag.key), str(other_tag.key)])
+        self.assertEqual(summary[0]["access"], "PRIVATE")
+        self.assertEqual((summary[0]["owner_type"], summary[0]["owner_id"]), ("user", self.owner_object.id))
+
+        self.test_tag.delete()
+        self.assertEqual(
+            [entry["key"] for entry in TagSummary.objects.for_target(self.target_object)],
+            [str(other_tag.key)],
+        )
+
+        Tag.objects.filter(id=other_tag.id).delete()
+        self.assertFalse(TagSummary.objects.exists())
+
+    def test_summary_refreshed_on_save_and_hard_delete(self):
+        """Used to test that tags saved directly, e.g. by the admin, and hard deleted are kept in the summary."""
+        tag = Tag(
+            tag_value="example_tag_value",
+            tag_type="example_tag_4",
+            target_object=self.target_object,
+            owner_object=self.fake_owner_object,
+        )
+        tag.save()
+        other_tag = Tag.objects.create(
+            tag_value="example_tag_value_2",
+            tag_type="example_tag_4",
+            target_object=self.target_object,
+            owner_object=self.fake_owner_object,
+        )
+
+        self.assertEqual(
+            [entry["key"] for entry in TagSummary.objects.for_target(self.target_object)],
+            [str(self.test_tag.key), str(tag.key), str(other_tag.key)],
+        )
+
+        tag.hard_delete()
+        self.assertEqual(
+            [entry["key"] for entry in TagSummary.objects.for_target(self.target_object)],
+            [str(self.test_tag.key), str(other_tag.key)],
+        )
+
+        Tag.objects.filter(target_object_id=self.target_object.id).hard_delete()
+        self.assertFalse(TagSummary.objects.exists())
+
+    def test_summary_updated_incrementally(self):
+        """Used to test that writing a tag only adds or removes its entry, the other entries are not rebuilt."""
+        TagSummary.objects.update(tags=[{"key": "kept"}])
+
+        tag = Tag.objects.create_tag(
+            tag_value="example_tag_value",
+            tag_type="example_tag_4",
+            target_object=self.target_object,
+            owner_object=self.fake_owner_object,
+        )
+        self.assertEqual(
+            [entry["key"] for entry in TagSummary.objects.for_target(self.target_object)],
+            ["kept", str(tag.key)],
+        )
+
+        tag.delete()
+        self.assertEqual([entry["key"] for entry in TagSummary.objects.for_target(self.target_object)], ["kept"])
+
+    @patch("eox_tagging.models.SUMMARY_REFRESH_BATCH_SIZE", 2)
+    def test_delete_in_batches(self):
+        """Used to test that deleting a queryset reads and writes its tags a batch at a time."""
+        tags = [self.test_tag] + [
+            Tag.objects.create_tag(
+                tag_value="example_tag_value",
+                tag_type="example_tag_4",
+                target_object=User.objects.create(username=f"target_{index}"),
+                owner_object=self.fake_owner_object,
+            )
+            for index in range(4)
+        ]
+
+        with CaptureQueriesContext(connection) as context:
+            deleted = Tag.objects.filter(id__in=[tag.id for tag in tags]).delete()
+
+        self.assertEqual(deleted, 5)
+        self.assertFalse(Tag.objects.active().filter(id__in=[tag.id for tag in tags]).exists())
+        self.assertFalse(TagSummary.objects.exists())
+        batch_reads = [
+            query["sql"] for query in context.captured_queries
+            if query["sql"].startswith("SELECT") and 'FROM "eox_tagging_tag" ' in query["sql"]
+            and query["sql"].endswith("LIMIT 2")
+        ]
+        self.assertEqual(len(batch_reads), 4)
+
+        self.assertEqual(Tag.objects.filter(id__in=[tag.id for tag in tags]).hard_delete()[0], 5)
+
+    def test_generations_bumped_on_commit(self):
+        """Used to test that creating and deleting tags bumps the generation of their owners when committed."""
+        generation = get_generations([self.owner_object])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            tag = Tag.objects.create_tag(
+                tag_value="example_tag_value",
+                tag_type="example_tag_1",
+                target_object=self.target_object,
+                owner_object=self.owner_object,
+                access=AccessLevel.PRIVATE,
+            )
+            self.assertEqual(get_generations([self.owner_object]), generation)
+
+        created_generation = get_generations([self.owner_object])
+        with self.captureOnCommitCallbacks(execute=True):
+            Tag.objects.filter(id=tag.id).delete()
+
+        self.assertGreater(created_generation, generation)
+        self.assertGreater(get_generations([self.owner_object]), created_generation)
+        self.assertEqual(len(get_generations([self.owner_object, self.fake_owner_object])), 2)
+
+    def test_summary_owner_scoping(self):
+        """Used to test reading the summary of a target identified by its natural key for some owners."""
+        Tag.objects.create_tag(
+            tag_value="example_tag_value",
+            tag_type="example_tag_4",
+            target_object=self.target_object,
+            owner_object=self.fake_owner_object,
+        )
+
+        self.assertEqual(TagSummary.objects.find_for("user", {"username": "missing"}), [])
+        with self.assertNumQueries(1):
+            summary = TagSummary.objects.find_for("user", {"username": "Tag"}, owners=[self.owner_object])
+
+        self.assertEqual([entry["key"] for entry in summary], [str(self.test_tag.key)])
+
+    @override_settings(EOX_TAGGING_SKIP_VALIDATIONS=False)
+    @patch("eox_tagging.validators.get_edxapp_user")
+    def test_integrity_validation(self, get_edxapp_user_mock):
+        """Used to test that a tag is not created when its target doesn't exist in the platform."""
+        get_edxapp_user_mock.side_effect = Exception("User not found")
+
+        request = RequestFactory().post("/")
+        request.site = self.fake_owner_object
+
+        with patch("eox_tagging.validators.crum.get_current_request", return_value=request):
+            with self.assertRaises(ValidationError):
+                Tag.objects.create_tag(
+                    tag_value="example_tag_value",
+                    tag_type="example_tag_4",
+                    target_object=self.target_object,
+                    owner_object=self.fake_owner_object,
+                )
+
+    @override_settings(
+        EOX_TAGGING_SKIP_VALIDATIONS=False,
+        EOX_TAGGING_DEFINITIONS=[
+            {
+                "tag_type": "example_tag_4",
+                "validate_tag_value": {"in": ["example_tag_value"]},
+                "validate_target_object": "User",
+            },
+            {
+                "tag_type": "course_tag",
+                "validate_tag_value": {"in": ["example_tag_value"]},
+                "validate_target_object": "OpaqueKeyProxyModel",
+            },
+        ])
+    @patch("eox_tagging.validators.CourseOverview")
+    @patch("eox_tagging.validators.get_site_membership_filter")
+    @patch("eox_tagging.validators.get_edxapp_user")
+    def test_bulk_create_integrity_of_users_and_courses(
+        self,
+        get_edxapp_user_mock,
+        membership_filter_mock,
+        course_overview_mock,
+    ):
+        """Used to test that the users and courses of many tags are checked with one query per model."""
+        users = [User.objects.create(username=f"bulk_target_{index}") for index in range(4)]
+        other_site_user = User.objects.create(username="other_site_target")
+        course_keys = [CourseKey.from_string(f"course-v1:edX+Bulk{index}+2025") for index in range(3)]
+        proxies = [OpaqueKeyProxyModel.objects.create(opaque_key=course_key) for course_key in course_keys]
+        membership_filter_mock.return_value = ~Q(id=other_site_user.id)
+        course_overview_mock.objects.filter.return_value.values_list.return_value = course_keys[:2]
+        course_overview_mock.get_from_id.side_effect = ObjectDoesNotExist
+        tags = [
+            Tag(tag_value="example_tag_value", tag_type=tag_type, target_object=target,
+                owner_object=self.fake_owner_object)
+            for tag_type, targets in [("example_tag_4", [*users, other_site_user]), ("course_tag", proxies)]
+            for target in targets
+        ]
+        get_edxapp_user_mock.side_effect = Exception("User not found")
+
+        request = RequestFactory().post("/")
+        request.site = self.fake_owner_object
+
+        with patch("eox_tagging.validators.crum.get_current_request", return_value=request):
+            with CaptureQueriesContext(connection) as queries:
+                created, errors = Tag.objects.bulk_create_tags(tags)
+
+        user_queries = [query for query in queries.captured_queries if 'FROM "auth_user"' in query["sql"]]
+        self.assertEqual(len(created), 6)
+        self.assertEqual(list(errors), [4, 7])
+        self.assertEqual(len(user_queries), 1)
+        get_edxapp_user_mock.assert_called_once_with(username="other_site_target", site=self.fake_owner_object)
+        course_overview_mock.objects.filter.assert_called_once_with(id__in=set(course_keys))
+        course_overview_mock.get_from_id.assert_called_once_with(course_keys[2])
+
+    @override_settings(EOX_TAGGING_SKIP_VALIDATIONS=False)
+    @patch("eox_tagging.validators.get_edxapp_user")
+    def test_integrity_without_request(self, get_edxapp_user_mock):
+        """Used to test that tags of users are validated outside of a request, e.g. in a worker."""
+        with patch("eox_tagging.validators.crum.get_current_request", return_value=None):
+            tag = Tag.objects.create_tag(
+                tag_value="example_tag_value",
+                tag_type="example_tag_4",
+                target_object=self.target_object,
+                owner_object=self.fake_owner_object,
+            )
+            self.assertTrue(Tag.objects.filter(id=tag.id).exists())
+
+            self.target_object.delete()
+            with self.assertRaises(ValidationError):
+                Tag.objects.create_tag(
+                    tag_value="example_tag_value_2",
+                    tag_type="example_tag_4",
+                    target_object=self.target_object,
+                    owner_object=self.fake_owner_object,
+                )
+
+        get_edxapp_user_mock.assert_not_called()
+
+    @override_settings(EOX_TAGGING_SKIP_VALIDATIONS=False)
+    @patch("eox_tagging.validators.get_edxapp_user")
+    def test_integrity_cache(self, get_edxapp_user_mock):
+        """Used to test that the objects shared by the tags of a request are checked once."""
+        request = RequestFactory().post("/")
+        request.site = self.fake_owner_object
+
+        with patch("eox_tagging.validators.crum.get_current_request", return_value=request):
+            for tag_value in ["example_tag_value", "example_tag_value_2", "example_tag_value"]:
+                Tag.objects.create_tag(
+                    tag_value=tag_value,
+                    tag_type="example_tag_4",
+                    target_object=self.target_object,
+                    owner_object=self.fake_owner_object,
+                )
+
+        get_edxapp_user_mock.assert_called_once_with(username=self.target_object.username, site=self.fake_owner_object)
+
+    @override_settings(EOX_TAGGING_SKIP_VALIDATIONS=False)
+    @patch("eox_tagging.validators.get_site_membership_filter", return_value=Q())
+    @patch("eox_tagging.validators.get_edxapp_user")
+    def test_bulk_create_integrity(self, *_):
+        """Used to test that the sites of many tags are checked with one query and missing ones are rejected."""
+        missing_site = Site(id=999, domain="missing.example.com")
+        tags = [
+            Tag(
+                tag_value="example_tag_value",
+                tag_type="example_tag_4",
+                target_object=self.target_object,
+                owner_object=self.fake_owner_object,
+            )
+            for _ in range(5)
+        ]
+        tags.append(
+            Tag(
+                tag_value="example_tag_value",
+                tag_type="example_tag_4",
+                target_object=self.target_object,
+                owner_object=missing_site,
+            )
+        )
+
+        request = RequestFactory().post("/")
+        request.site = self.fake_owner_object
+
+        with patch("eox_tagging.validators.crum.get_current_request", return_value=request):
+            with CaptureQueriesContext(connection) as queries:
+                created, errors = Tag.objects.bulk_create_tags(tags)
+
+        site_queries = [query for query in queries.captured_queries if "django_site" in query["sql"]]
+        self.assertEqual(len(created), 5)
+        self.assertEqual(list(errors), [5])
+        self.assertEqual(len(site_queries), 2)
+
+
+class TestOpaqueKeyProxyModel(TestCase):
+    """Test cases for the opaque key proxies."""
+
+    def setUp(self):
+        self.course_key = CourseKey.from_string("course-v1:edX+DemoX+Demo_Course")
+
+    def test_get_or_create_by_key(self):
+        """Test that the proxy is created once and then reused."""
+        proxy, created = OpaqueKeyProxyModel.objects.get_or_create_by_key(self.course_key)
+        same_proxy, created_again = OpaqueKeyProxyModel.objects.get_or_create_by_key(self.course_key)
+
+        self.assertTrue(created)
+        self.assertFalse(created_again)
+        self.assertEqual(proxy, same_proxy)
+
+    def test_get_or_create_by_key_lost_race(self):
+        """
+        Test that when a concurrent writer creates the proxy between the read and the insert,
+        the proxy committed by the other writer is returned.
+        """
+        proxy = OpaqueKeyProxyModel.objects.create(opaque_key=self.course_key)
+
+        does_not_exist = OpaqueKeyProxyModel.DoesNotExist  # pylint: disable=no-member
+
+        with patch.object(OpaqueKeyProxyQuerySet, "get", side_effect=[does_not_exist, proxy]):
+            same_proxy, created = OpaqueKeyProxyModel.objects.get_or_create_by_key(self.course_key)
+
+        self.assertFalse(created)
+        self.assertEqual(proxy, same_proxy)
+        self.assertEqual(OpaqueKeyProxyModel.objects.count(), 1)
+
+    def test_opaque_key_unique(self):
+        """Test that duplicated proxies can't be created."""
+        OpaqueKeyProxyModel.objects.create(opaque_key=self.course_key)
+
+        with self.assertRaises(IntegrityError):
+            OpaqueKeyProxyModel.objects.create(opaque_key=self.course_key)
+
 
 class TestTagQuerysetManager(TestCase):
     """
@@ -524,7 +1074,7 @@ class TestTagQuerysetManager(TestCase):
         self.tag_query_set.create = Mock()
         course_mock = Mock()
         opaque_mock = Mock()
-        opaque_objects_mock.get_or_create.return_value = opaque_mock, Mock()
+        opaque_objects_mock.get_or_create_by_key.return_value = opaque_mock, Mock()
         course_mock.__class__.__name__ = "CourseOverview"
         kwargs = {
             "target_object": course_mock,
@@ -532,6 +1082,7 @@ class TestTagQuerysetManager(TestCase):
 
         self.tag_query_set.create_tag(**kwargs)
 
+        opaque_objects_mock.get_or_create_by_key.assert_called_once_with(course_mock.id)
         self.tag_query_set.create.assert_called_once_with(target_object=opaque_mock)
 
     @patch.object(TagQuerySet, '_get_object_for_this_type')
@@ -554,15 +1105,11 @@ class TestTagQuerysetManager(TestCase):
             target_object_id__in=[1],
         )
 
-    @patch('eox_tagging.models.cache.get_or_set')
-    @patch.object(ContentType, 'objects')
-    def test_get_objects_for_type_user(self, content_type_mock, cache_get_or_set_mock):
+    @patch('eox_tagging.models.get_content_type')
+    def test_get_objects_for_type_user(self, get_content_type_mock):
         """Test getting courses associated with tags."""
         ctype_object = Mock()
-        content_type_mock.get.return_value = ctype_object
-        cache_get_or_set_mock.side_effect = (
-            lambda key, default, timeout=None: default()
-        )
+        get_content_type_mock.return_value = ctype_object
         object_type, object_id = "User", {
             "username": "username",
         }
@@ -572,20 +1119,16 @@ class TestTagQuerysetManager(TestCase):
             object_id,
         )
 
-        content_type_mock.get.assert_called_once_with(model=object_type)
+        get_content_type_mock.assert_called_once_with(object_type)
         ctype_object.get_all_objects_for_this_type.assert_called_once_with(
             username="username",
         )
 
-    @patch('eox_tagging.models.cache.get_or_set')
-    @patch.object(ContentType, 'objects')
-    def test_get_objects_for_type_course(self, content_type_mock, cache_get_or_set_mock):
+    @patch('eox_tagging.models.get_content_type')
+    def test_get_objects_for_type_course(self, get_content_type_mock):
         """Test getting courses associated with tags."""
         ctype_object = Mock()
-        content_type_mock.get.return_value = ctype_object
-        cache_get_or_set_mock.side_effect = (
-            lambda key, default, timeout=None: default()
-        )
+        get_content_type_mock.return_value = ctype_object
         object_type, object_id = "OpaqueKeyProxyModel", {
             "course_id": self.course_id,
         }
@@ -598,20 +1141,16 @@ class TestTagQuerysetManager(TestCase):
             object_id,
         )
 
-        content_type_mock.get.assert_called_once_with(model=object_type)
+        get_content_type_mock.assert_called_once_with(object_type)
         ctype_object.get_all_objects_for_this_type.assert_called_once_with(
             **object_id_modified
         )
 
-    @patch('eox_tagging.models.cache.get_or_set')
-    @patch.object(ContentType, 'objects')
-    def test_get_objects_for_type_enrollment(self, content_type_mock, cache_get_or_set_mock):
+    @patch('eox_tagging.models.get_content_type')
+    def test_get_objects_for_type_enrollment(self, get_content_type_mock):
         """Test getting enrollments associated with tags."""
         ctype_object = Mock()
-        content_type_mock.get.return_value = ctype_object
-        cache_get_or_set_mock.side_effect = (
-            lambda key, default, timeout=None: default()
-        )
+        get_content_type_mock.return_value = ctype_object
         object_type, object_id = "CourseEnrollment", {
             "course_id": self.course_id,
             "username": "username",
@@ -626,7 +1165,7 @@ class TestTagQuerysetManager(TestCase):
             object_id,
         )
 
-        content_type_mock.get.assert_called_once_with(model=object_type)
+        get_content_type_mock.assert_called_once_with(object_type)
         ctype_object.get_all_objects_for_this_type.assert_called_once_with(
             **object_id_modified
         )
@@ -0,0 +1,126 @@
+"""
+Query plan regression tests for the Tag table.
+
+Every access path used by `TagQuerySet` and `TagFilter` is explained against the
+database and the test fails if the plan falls back to a full scan of the tag table.
+"""
+import re
+
+from django.contrib.auth.models import User
+from django.contrib.sites.models import Site
+from django.db import connection
+from django.test import TestCase, override_settings
+from mock import Mock
+
+from eox_tagging.api.v1.filters import TagFilter
+from eox_tagging.models import Tag
+
+FULL_SCAN_PATTERN = re.compile(r"\bSCAN (TABLE )?eox_tagging_tag\b")
+
+FILTER_COMBINATIONS = [
+    {},
+    {"tag_type": "subscription_level"},
+    {"tag_type": "subscription_level", "tag_value": "premium"},
+    {"created_at_after": "2020-10-10 10:20:30"},
+    {"created_at_after": "2020-10-10 10:20:30", "created_at_before": "2021-10-10 10:20:30"},
+    {"activation_date_after": "2020-10-10 10:20:30"},
+    {"activation_date_before": "2020-10-10 10:20:30"},
+    {"expiration_date_after": "2020-10-10 10:20:30"},
+    {"expiration_date_before": "2020-10-10 10:20:30"},
+    {"access": "public"},
+    {"effective": "true"},
+    {"as_of": "2020-10-10 10:20:30"},
+    {"status": "1"},
+    {"tag_type": "subscription_level", "access": "private", "expiration_date_before": "2020-10-10 10:20:30"},
+]
+
+UNSCOPED_FILTER_COMBINATIONS = [
+    combination for combination in FILTER_COMBINATIONS
+    if set(combination) & {
+        "tag_type",
+        "created_at_after",
+        "activation_date_after",
+        "activation_date_before",
+        "expiration_date_after",
+        "expiration_date_before",
+        "as_of",
+    }
+]
+
+
+class TestTagQueryPlans(TestCase):
+    """Test class that checks the query plans of the tag access paths."""
+
+    def setUp(self):
+        """setUp class."""
+        self.user = User.objects.create(username="plan_user")
+        self.site = Site.objects.create(domain="plans.example.com", name="plans")
+
+    def assertNoFullScan(self, queryset, description):  # pylint: disable=invalid-name
+        """Fails if the query plan of queryset contains a full scan of the tag table."""
+        plan = queryset.explain()
+        self.assertIsNone(
+            FULL_SCAN_PATTERN.search(plan),
+            f"Full scan of the tag table for {description}:\n{plan}",
+        )
+
+    def filter_queryset(self, queryset, data):
+        """Applies the API filters to queryset."""
+        filterset = TagFilter(data, queryset=queryset, request=Mock(query_params=data))
+        return filterset.qs
+
+    def test_owner_scoped_filters(self):
+        """Used to test the plans of every filter combination used by the API."""
+        for owner_scope in [(self.site, self.user), (self.site,), (self.user,)]:
+            queryset = Tag.objects.active().owned_by(*owner_scope)
+
+            for data in FILTER_COMBINATIONS:
+                with self.subTest(owners=owner_scope, filters=data):
+                    self.assertNoFullScan(self.filter_queryset(queryset, data), data)
+
+    def test_owner_scoped_filters_including_inactive(self):
+        """Used to test the plans of the filters when inactive tags are included."""
+        queryset = Tag.objects.owned_by(self.site, self.user)
+
+        for data in FILTER_COMBINATIONS:
+            with self.subTest(filters=data):
+                self.assertNoFullScan(self.filter_queryset(queryset, data), data)
+
+    def test_unscoped_filters(self):
+        """Used to test the plans of the indexed filters when no owner scoping is applied."""
+        for data in UNSCOPED_FILTER_COMBINATIONS:
+            with self.subTest(filters=data):
+                self.assertNoFullScan(self.filter_queryset(Tag.objects.all(), data), data)
+
+    def test_find_all_tags_for(self):
+        """Used to test the plan of the target lookup."""
+        queryset = Tag.objects.find_all_tags_for(target_type="user", target_id={"username": "plan_user"})
+
+        self.assertNoFullScan(queryset, "find_all_tags_for")
+
+    @override_settings(EOX_TAGGING_FILTER_BY_TARGET_KEY=True)
+    def test_find_by_natural_keys(self):
+        """Used to test the plans of the target and owner lookups by natural key."""
+        queryset = Tag.objects.find_all_tags_for(target_type="user", target_id={"username": "plan_user"})
+        self.assertNoFullScan(queryset, "find_all_tags_for by target_key")
+
+        queryset = Tag.objects.find_by_owner(owner_type="user", owner_id={"username": "plan_user"})
+        self.assertNoFullScan(queryset, "find_by_owner by owner_key")
+
+    def test_effective(self):
+        """Used to test the plan of the tags in force without owner scoping."""
+        self.assertNoFullScan(Tag.objects.effective(), "effective")
+
+    def test_expired(self):
+        """Used to test the plan of the expiration sweep."""
+        queryset = Tag.objects.expired().order_by("expiration_date").values_list("id", flat=True)[:1000]
+
+        self.assertNoFullScan(queryset, "expired")
+
+    def test_harness_detects_full_scans(self):
+        """Used to test that an unindexed predicate is reported as a full scan."""
+        if connection.vendor != "sqlite":
+            self.skipTest("The full scan pattern matches SQLite plans.")
+
+        with self.assertRaises(AssertionError):
+            self.assertNoFullScan(Tag.objects.filter(tag_value="premium"), "tag_value")
@@ -0,0 +1,189 @@
+"""
+Test classes for the resolution cache of edx-platform objects.
+"""
+from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models.signals import post_delete, post_save
+from django.test import TestCase, override_settings
+from mock import Mock
+
+from eox_tagging.edxapp_accessors import get_object_from_edxapp, get_objects_from_edxapp
+from eox_tagging.resolution_cache import (
+    ResolutionCache,
+    invalidate_course_enrollment,
+    invalidate_user,
+    resolution_cache,
+)
+
+
+@override_settings(EOX_TAGGING_RESOLUTION_CACHE_TIMEOUT=60, EOX_TAGGING_RESOLUTION_CACHE_NOT_FOUND_TIMEOUT=15)
+class TestResolutionCache(TestCase):
+    """Test class for the resolution cache."""
+
+    def setUp(self):
+        """setUp class."""
+        cache.clear()
+        self.resolution_cache = ResolutionCache()
+        self.site = Site.objects.create(domain="tenant.example.com", name="tenant")
+        self.other_site = Site.objects.create(domain="other.example.com", name="other")
+        self.user = User.objects.create(username="user")
+        ContentType.objects.get_for_model(User)  # Warm Django's content type cache
+
+    def test_hits(self):
+        """Used to test that a resolved object is resolved once and loaded by primary key afterwards."""
+        resolver = Mock(return_value=self.user)
+
+        self.resolution_cache.resolve("courseoverview", "course-v1:edX+Demo+2025", resolver)
+        with self.assertNumQueries(1):
+            course = self.resolution_cache.resolve("courseoverview", "course-v1:edX+Demo+2025", resolver)
+
+        self.assertEqual(course, self.user)
+        resolver.assert_called_once_with()
+        self.assertEqual(self.resolution_cache.stats, {"hits": 1, "not_found_hits": 0, "misses": 1})
+        self.assertEqual(self.resolution_cache.hit_rate(), 0.5)
+
+    def test_only_references_cached(self):
+        """Used to test that only the reference of the object is cached, so its changes are never stale."""
+        self.resolution_cache.resolve("user", "user", Mock(return_value=self.user), site=self.site)
+        User.objects.filter(id=self.user.id).update(is_active=False)
+
+        user = self.resolution_cache.resolve("user", "user", Mock(), site=self.site)
+
+        self.assertFalse(user.is_active)
+        self.assertEqual(
+            cache.get(self.resolution_cache.get_cache_key("user", "user", self.site)),
+            (None, (ContentType.objects.get_for_model(User).id, self.user.id)),
+        )
+
+    def test_deleted_reference(self):
+        """Used to test that a reference to an object that no longer exists is resolved again."""
+        self.resolution_cache.resolve("user", "user", Mock(return_value=self.user), site=self.site)
+        User.objects.filter(id=self.user.id).delete()
+        resolver = Mock(side_effect=ObjectDoesNotExist)
+
+        with self.assertRaises(ObjectDoesNotExist):
+            self.resolution_cache.resolve("user", "user", resolver, site=self.site)
+
+        resolver.assert_called_once_with()
+
+    def test_not_found(self):
+        """Used to test that the targets that don't exist are remembered."""
+        resolver = Mock(side_effect=ObjectDoesNotExist)
+
+        for _ in range(2):
+            with self.assertRaises(ObjectDoesNotExist):
+                self.resolution_cache.resolve("user", "missing", resolver, site=self.site)
+
+        resolver.assert_called_once_with()
+        self.assertEqual(self.resolution_cache.stats["not_found_hits"], 1)
+
+    def test_errors_not_cached(self):
+        """Used to test that errors other than not found are not cached."""
+        resolver = Mock(side_effect=ConnectionError)
+
+        for _ in range(2):
+            with self.assertRaises(ConnectionError):
+                self.resolution_cache.resolve("user", "user", resolver, site=self.site)
+
+        self.assertEqual(resolver.call_count, 2)
+
+    def test_site_scope(self):
+        """Used to test that users are cached by site and courses are shared by every site."""
+        resolver = Mock(return_value=self.user)
+
+        for site in [self.site, self.other_site]:
+            self.resolution_cache.resolve("user", "user", resolver, site=site)
+            self.resolution_cache.resolve("courseoverview", "course-v1:edX+Demo+2025", resolver, site=site)
+
+        self.assertEqual(resolver.call_count, 3)
+
+    def test_invalidate(self):
+        """Used to test that invalidating a user without site drops it for every site."""
+        resolver = Mock(side_effect=ObjectDoesNotExist)
+        for site in [self.site, self.other_site]:
+            with self.assertRaises(ObjectDoesNotExist):
+                self.resolution_cache.resolve("user", "new_user", resolver, site=site)
+
+        self.resolution_cache.invalidate("user", "new_user")
+        resolver.side_effect = None
+        resolver.return_value = self.user
+
+        for site in [self.site, self.other_site]:
+            self.assertEqual(self.resolution_cache.resolve("user", "new_user", resolver, site=site), self.user)
+
+    def test_invalidation_hooks(self):
+        """Used to test that saving and deleting a user drops its entries of every site when committed."""
+        for signal in [post_save, post_delete]:
+            signal.connect(invalidate_user, sender=User, dispatch_uid="test_invalidate_user")
+            self.addCleanup(signal.disconnect, sender=User, dispatch_uid="test_invalidate_user")
+
+        for site in [self.site, self.other_site]:
+            with self.assertRaises(ObjectDoesNotExist):
+                resolution_cache.resolve("user", "new_user", Mock(side_effect=ObjectDoesNotExist), site=site)
+
+        with self.assertNumQueries(1), self.captureOnCommitCallbacks(execute=True):
+            user = User.objects.create(username="new_user")
+
+        for site in [self.site, self.other_site]:
+            self.assertEqual(resolution_cache.resolve("user", "new_user", Mock(return_value=user), site=site), user)
+
+        resolver = Mock(return_value=user)
+        with self.captureOnCommitCallbacks(execute=True):
+            user.is_active = False
+            user.save()
+        resolution_cache.resolve("user", "new_user", resolver, site=self.site)
+        resolver.assert_called_once_with()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            user.delete()
+
+        with self.assertRaises(ObjectDoesNotExist):
+            resolution_cache.resolve("user", "new_user", Mock(side_effect=ObjectDoesNotExist), site=self.site)
+
+    def test_enrollment_invalidation(self):
+        """Used to test that the enrollments of a course are dropped without loading the user of the enrollment."""
+        resolver = Mock(return_value=self.user)
+        key = ("user", "course-v1:edX+Demo+2025")
+        resolution_cache.resolve("courseenrollment", key, resolver, site=self.site)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate_course_enrollment(
+                sender=None,
+                instance=Mock(spec=["course_id"], course_id="course-v1:edX+Demo+2025"),
+            )
+        resolution_cache.resolve("courseenrollment", key, resolver, site=self.site)
+
+        self.assertEqual(resolver.call_count, 2)
+
+    @override_settings(EOX_TAGGING_RESOLUTION_CACHE_TIMEOUT=0)
+    def test_disabled(self):
+        """Used to test that a timeout of 0 disables the cache."""
+        resolver = Mock(return_value=self.user)
+
+        for _ in range(2):
+            self.resolution_cache.resolve("courseoverview", "course-v1:edX+Demo+2025", resolver)
+
+        self.assertEqual(resolver.call_count, 2)
+
+    def test_get_object_from_edxapp(self):
+        """Used to test that the targets of the tags API are resolved through the cache."""
+        get_object_from_edxapp("user", target_id="user")
+
+        with self.assertNumQueries(1):
+            self.assertEqual(get_object_from_edxapp("user", target_id="user"), self.user)
+
+    def test_get_objects_from_edxapp(self):
+        """Used to test that the batch resolution loads the cached objects with one query by primary key."""
+        users = [User.objects.create(username=f"target_{index}") for index in range(3)]
+        get_objects_from_edxapp("user", [{"target_id": "target_0"}, {"target_id": "target_1"}])
+
+        with self.assertNumQueries(2):
+            resolved = get_objects_from_edxapp(
+                "user",
+                [{"target_id": "target_0"}, {"target_id": "target_1"}, {"target_id": "target_2"}],
+            )
+
+        self.assertEqual(resolved, users)
@@ -8,31 +8,384 @@ import crum
 import opaque_keys.edx.keys as all_opaque_keys
 import six
 from django.conf import settings
+from django.contrib.auth.models import User
 from django.contrib.sites.models import Site
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from eox_core.edxapp_wrapper.certificates import get_generated_certificate
 from eox_core.edxapp_wrapper.enrollments import get_enrollment
 from eox_core.edxapp_wrapper.users import get_edxapp_user
 from opaque_keys import InvalidKeyError  # pylint: disable=ungrouped-imports, useless-suppression
 
+from eox_tagging.edxapp_accessors import get_site_membership_filter
 from eox_tagging.edxapp_wrappers.course_overview import CourseOverview
+from eox_tagging.edxapp_wrappers.enrollments import CourseEnrollment
 
 log = logging.getLogger(__name__)
 
 DATETIME_FORMAT_VALIDATION = "%Y-%m-%d %H:%M:%S"
+REQUIRED_TARGET_FIELDS = re.compile(r".*target_object|.*resource_locator")
+REQUIRED_OWNER_FIELDS = re.compile(r".*owner_object")
+CONFIGURATION_TYPES = {
+    "in": list,
+    "equals": six.string_types,
+    "regex": six.string_types,
+    "exist": bool,
+    "opaque_key": six.string_types,
+}
 GeneratedCertificate = get_generated_certificate()
+INTEGRITY_FIELDS = ["owner_object", "target_object"]
+INTEGRITY_CACHE_ATTRIBUTE = "_eox_tagging_integrity_cache"
+
+
+class ValidationPlan:
+    """
+    Definition of a tag_type compiled once to validate any number of tags.
+
+    Attributes:
+        tag_type: tag_type of the definition.
+        definitions: definition without the forced values and with the default owner validation.
+        forced_values: attributes set in every tag, already parsed.
+        checks: list of (field, validation, argument) with the arguments already parsed: lowercased
+        sets for `in`, compiled patterns for `regex`, datetimes for `between` and dates in `equals`.
+    """
+
+    def __init__(self, tag_type, definitions, forced_values, checks):
+        self.tag_type = tag_type
+        self.definitions = definitions
+        self.forced_values = forced_values
+        self.checks = checks
+
+
+def compile_validation_plan(definition, model):
+    """
+    Validates a tag definition of EOX_TAGGING_DEFINITIONS and compiles it into a ValidationPlan.
+
+    Arguments:
+        - definition: tag definition.
+        - model: tag model, used to check the configured fields and to parse the forced values.
+
+    Raises:
+        ValidationError if the definition is wrongly configured.
+    """
+    template = model(tag_type=definition.get("tag_type"))
+    definitions = dict(definition)
+    forced_values = _compile_forced_values(definitions, template)
+    _validate_configuration_types(definitions)
+    _validate_configuration(definitions, template)
+
+    checks = []
+    for key, value in definitions.items():
+        field = re.sub(r"^validate_", "", key)
+        if isinstance(value, six.string_types):
+            checks.append((field, "equals", _compile_argument(key, "equals", value)))
+            continue
+
+        for validation, argument in value.items():
+            checks.append((field, validation, _compile_argument(key, validation, argument)))
+
+    return ValidationPlan(template.tag_type, definitions, forced_values, checks)
+
+
+def _compile_forced_values(definitions, template):
+    """
+    Function that removes the `force_<FIELD>` keys from definitions and returns the values to set.
+
+    For example:
+    {
+        "force_access": "public"
+    }
+    Then the access level of the tag must be set tu public, no matter if it had a value before.
+    Also, using force the validations are skipped.
+    """
+    pattern = "force_"
+    forced_values = {}
+
+    for key, value in dict(definitions).items():
+        if key.startswith(pattern):
+            attr = key.replace(pattern, "")
+            try:
+                template.set_attribute(attr, value)
+            except Exception as exc:
+                raise ValidationError(
+                    f"EOX_TAGGING | The field {key} with value `{value}` is wrongly configured"
+                ) from exc
+            forced_values[attr] = getattr(template, attr)
+            del definitions[key]
+
+    return forced_values
+
+
+def _validate_configuration_types(definitions):
+    """Function that validate the correct type for pairs <key, value> in configuration."""
+    for key, value in definitions.items():
+
+        if key.startswith("validate_") and isinstance(value, dict):
+
+            for key_ in value:
+
+                value_type = CONFIGURATION_TYPES.get(key_)
+                field_value = value.get(key_)
+
+                if value_type and not isinstance(field_value, value_type):
+                    raise ValidationError(
+                        f"EOX_TAGGING | The validation '{key_}' for '{key}' is wrongly configured."
+                    )
+
+        elif not isinstance(value, six.string_types):
+            raise ValidationError(f"EOX_TAGGING | The field '{key}' is wrongly configured.")
+
+
+def _validate_configuration(definitions, template):
+    """
+    Function that validates EOX_TAGGING_DEFINITIONS. The validations consist in:
+        - Check required fields in configuration
+        - Validate available validations
+        - Validate field names
+    If any error occur a ValidationError will be raised.
+    """
+    if not any(REQUIRED_TARGET_FIELDS.match(key) for key in definitions):
+        raise ValidationError(f"The target object for `tag_type`: '{template.tag_type}' is not configured.")
+
+    if not any(REQUIRED_OWNER_FIELDS.match(key) for key in definitions):
+        definitions["validate_owner_object"] = "site"
+
+    for key, value in definitions.items():
+
+        # Validate value correctness if it has validations defined
+        if key.startswith("validate_") and not isinstance(value, six.string_types):
+            for _key in value:  # Validations must exist as a class method
+                if not hasattr(TagValidators, f"validate_{_key}"):
+                    raise ValidationError(
+                        f"EOX_TAGGING | The field {key} with value `{_key}` is wrongly configured."
+                    )
+        # Validate key existence
+        clean_key = re.sub(r"validate_", "", key)
+        try:
+            template.get_attribute(clean_key)
+        except AttributeError as exc:
+            raise ValidationError(
+                f"EOX_TAGGING | The field `{key}` is wrongly configured."
+            ) from exc
+
+
+def _compile_argument(key, validation, argument):
+    """Function that parses the argument of a validation so it's not parsed again for every tag."""
+    try:
+        if validation == "in":
+            return frozenset(item.lower() for item in argument)
+
+        if validation == "regex":
+            return re.compile(argument)
+
+        if validation == "opaque_key":
+            return getattr(all_opaque_keys, argument)
+
+        if validation == "equals":
+            return argument, _parse_datetime(argument)
+    except (AttributeError, TypeError, re.error) as exc:
+        raise ValidationError(
+            f"EOX_TAGGING | The validation '{validation}' for '{key}' is wrongly configured."
+        ) from exc
+
+    if validation == "between":
+        datetime_obj = []
+        for datetime_str in argument:
+            try:
+                datetime_obj.append(datetime.datetime.strptime(datetime_str, DATETIME_FORMAT_VALIDATION))
+            except (TypeError, ValueError) as exc:
+                raise ValidationError(
+                    f"EOX_TAGGING | The DateTime field '{datetime_str}' \
+                        must follow the format '{DATETIME_FORMAT_VALIDATION}'."
+                ) from exc
+        return datetime_obj[0], datetime_obj[-1]
+
+    return argument
+
+
+def _parse_datetime(value):
+    """Returns value as a datetime or None if it doesn't follow DATETIME_FORMAT_VALIDATION."""
+    try:
+        return datetime.datetime.strptime(value, DATETIME_FORMAT_VALIDATION)
+    except ValueError:
+        return None
+
+
+class ValidationPlanCache:
+    """
+    Validation plans of the tag types of EOX_TAGGING_DEFINITIONS.
+
+    Every tag_type is compiled the first time a tag of that type is validated, the errors of wrongly
+    configured definitions are cached as well. The tag types that are not configured are not stored,
+    they come from the clients, so only the configured tag types are ever cached. The plans are
+    dropped when the setting is replaced.
+    """
+
+    def __init__(self):
+        self._source = None
+        self._definitions = {}
+        self._plans = {}
+
+    def get(self, tag_type, model):
+        """
+        Returns the validation plan of tag_type.
+
+        Raises:
+            ValidationError if tag_type is not configured or its definition is wrongly configured.
+        """
+        definitions = getattr(settings, "EOX_TAGGING_DEFINITIONS", [])
+        if definitions is not self._source:
+            self.__load(definitions)
+
+        if tag_type not in self._definitions:
+            raise ValidationError(f"Tag_type '{tag_type}' not configured")
+
+        plan = self._plans.get(tag_type)
+        if plan is None:
+            plan = self.__compile(tag_type, model)
+            self._plans[tag_type] = plan
+
+        if isinstance(plan, ValidationError):
+            raise ValidationError(plan.message)
+
+        return plan
+
+    def clear(self):
+        """Drops every compiled plan."""
+        self._source = None
+        self._definitions = {}
+        self._plans = {}
+
+    def __load(self, definitions):
+        """Indexes the definitions by tag_type, the first definition of a tag_type is used."""
+        indexed_definitions = {}
+        for tag_def in definitions:
+            indexed_definitions.setdefault(tag_def.get("tag_type"), tag_def)
+
+        self._definitions = indexed_definitions
+        self._plans = {}
+        self._source = definitions
+
+    def __compile(self, tag_type, model):
+        """Compiles the definition of tag_type, returning the error if it's wrongly configured."""
+        try:
+            return compile_validation_plan(self._definitions[tag_type], model)
+        except ValidationError as validation_error:
+            return validation_error
+
+
+validation_plans = ValidationPlanCache()
+
+
+@receiver(setting_changed)
+def clear_validation_plans(setting, **kwargs):  # pylint: disable=unused-argument
+    """Drops the compiled plans when EOX_TAGGING_DEFINITIONS changes."""
+    if setting == "EOX_TAGGING_DEFINITIONS":
+        validation_plans.clear()
+
+
+def get_integrity_cache():
+    """
+    Returns the results of the integrity checks made during the current request.
+
+    The results are stored in the request, so they are dropped when the request finishes. Outside of
+    a request, e.g. in management commands, a new empty cache is returned every time.
+
+    Returns:
+        A dictionary mapping (model name, primary key) to None if the object was found, or to the
+        error message of the failed check.
+    """
+    request = crum.get_current_request()
+    if request is None:
+        return {}
+
+    if not hasattr(request, INTEGRITY_CACHE_ATTRIBUTE):
+        setattr(request, INTEGRITY_CACHE_ATTRIBUTE, {})
+    return getattr(request, INTEGRITY_CACHE_ATTRIBUTE)
+
+
+def prefetch_integrity(tags, integrity_cache):
+    """
+    Checks the existence of the related objects of many tags with one query per model.
+
+    The objects found are stored in the integrity cache, the missing ones are left out so their
+    validator reports them when the tag is validated.
+
+    Arguments:
+        - tags: list of tags about to be validated.
+        - integrity_cache: dictionary returned by get_integrity_cache.
+    """
+    for model_name, get_existing_ids in BATCHED_INTEGRITY_CHECKS.items():
+        objects = {
+            tag.get_attribute(field).pk: tag.get_attribute(field)
+            for tag in tags
+            for field in INTEGRITY_FIELDS
+            if getattr(tag, field) is not None and tag.get_attribute(field, name=True) == model_name
+        }
+        for name, pk in integrity_cache:
+            if name == model_name:
+                objects.pop(pk, None)
+        if not objects:
+            continue
+
+        for pk in get_existing_ids(objects):
+            integrity_cache[(model_name, pk)] = None
+
+
+def _get_existing_users(users):
+    """
+    Returns the ids of the users that exist, checking that they belong to the site of the current
+    request like get_edxapp_user.
+    """
+    queryset = User.objects.filter(id__in=users)
+    site = getattr(crum.get_current_request(), "site", None)
+    if site is not None:
+        queryset = queryset.filter(get_site_membership_filter(site, user_field=None))
+    return queryset.values_list("id", flat=True)
+
+
+def _get_existing_proxies(proxies):
+    """Returns the ids of the opaque key proxies whose course has an overview."""
+    course_ids = {
+        str(course_id)
+        for course_id in CourseOverview.objects.filter(
+            id__in={proxy.opaque_key for proxy in proxies.values()},
+        ).values_list("id", flat=True)
+    }
+    return [pk for pk, proxy in proxies.items() if str(proxy.opaque_key) in course_ids]
+
+
+def _get_existing_ids(model):
+    """Returns a function that returns the ids of the objects of model that exist."""
+    def get_existing_ids(objects):
+        return model.objects.filter(id__in=objects).values_list("id", flat=True)
+    return get_existing_ids
+
+
+BATCHED_INTEGRITY_CHECKS = {
+    "Site": _get_existing_ids(Site),
+    "GeneratedCertificate": _get_existing_ids(GeneratedCertificate),
+    "CourseEnrollment": _get_existing_ids(CourseEnrollment),
+    "User": _get_existing_users,
+    "OpaqueKeyProxyModel": _get_existing_proxies,
+}
 
 
 class TagValidators:
     """Defines all validator methods."""
 
-    def __init__(self, instance):
+    def __init__(self, instance, integrity_cache=None):
         """
         Attributes:
             instance: instance of the model to validate before saving
-            definitions: configuration matching fields to validate
+            integrity_cache: results of the integrity checks shared with other validations,
+            the cache of the current request by default
+            plan: compiled definition of the tag_type of the instance
+            current_tag_definitions: configuration matching fields to validate
         """
         self.instance = instance
+        self.integrity_cache = get_integrity_cache() if integrity_cache is None else integrity_cache
         self.model_validations = {
             "User": self.__validate_user_integrity,
             "OpaqueKeyProxyModel": self.__validate_proxy_model,
@@ -40,152 +393,63 @@ class TagValidators:
             "Site": self.__validate_site_integrity,
             "GeneratedCertificate": self.__validate_certificate_integrity,
         }
-        self.__configuration_types = {
-            "in": list,
-            "equals": six.string_types,
-            "regex": six.string_types,
-            "exist": bool,
-            "opaque_key": six.string_types,
-        }
+        self.plan = None
         self.current_tag_definitions = {}
         self.set_configuration()
 
     def set_configuration(self):
-        """Function that sets and validates configuration for model instance."""
+        """Function that sets the validation plan of the tag_type and the forced values of the instance."""
         self.validate_no_updating()  # Don't validate if trying to update
-        self.__select_configuration()
-        self.__force_configuration_values()
-        self.__validate_configuration_types()
-        self.__validate_configuration()
-
-    def __select_configuration(self):
-        """Function that selects the correct configuration for model instance."""
-        for tag_def in settings.EOX_TAGGING_DEFINITIONS:
-            tag_type = tag_def.get("tag_type")
-            if tag_type == self.instance.tag_type:
-                self.current_tag_definitions = tag_def
-                return
-        raise ValidationError(f"Tag_type '{self.instance.tag_type}' not configured")
-
-    def __force_configuration_values(self):
-        """
-        Function that sets tag values defined in the configuration.
-
-        For example:
-        {
-            "force_access": "public"
-        }
-        Then the access level of the tag must be set tu public, no matter if it had a value before.
-        Also, using force the validations are skipped.
-        """
-        pattern = "force_"
-        configurations_copy = dict(self.current_tag_definitions)
-
-        for key, value in configurations_copy.items():
-            if key.startswith(pattern):
-                try:
-                    self.instance.set_attribute(key.replace(pattern, ""), value)
-                except Exception as exc:
-                    raise ValidationError(
-                        f"EOX_TAGGING | The field {key} with value `{value}` is wrongly configured"
-                    ) from exc
-                del self.current_tag_definitions[key]
-
-    def __validate_required(self):
-        """Function that validates the configuration for the required fields target and owner."""
-        required_target_fields = r".*target_object|.*resource_locator"
-        required_owner_fields = r".*owner_object"
-
-        if not self.__find_attribute(required_target_fields):
-            raise ValidationError(f"The target object for `tag_type`: '{self.instance.tag_type}' is not configured.")
-
-        if not self.__find_attribute(required_owner_fields):
-            self.current_tag_definitions["validate_owner_object"] = "site"
-
-    def __find_attribute(self, attr_pattern):
-        """Function that fiends an attribute in the current tag definitions."""
-        for attr in self.current_tag_definitions:
-            if re.match(attr_pattern, attr):
-                return True
-        return False
-
-    # Config validations
-    def __validate_configuration(self):
-        """
-        Function that validates EOX_TAGGING_DEFINITIONS. The validations consist in:
-            - Validate available validations
-            - Validate field names
-            - Check required fields in configuration
-        If any error occur a ValidationError will be raised.
-        """
-        self.__validate_required()  # Validate that the require configs exists
-        regex = r"validate_"
-
-        for key, value in self.current_tag_definitions.items():
-
-            # Validate value correctness if it has validations defined
-            if re.match(regex, key) and not isinstance(value, six.string_types):
-                for _key in value:  # Validations must exist as a class method
-                    try:
-                        getattr(self, f"validate_{_key}")
-                    except AttributeError as exc:
-                        raise ValidationError(
-                            f"EOX_TAGGING | The field {key} with value `{_key}` is wrongly configured."
-                        ) from exc
-            # Validate key existence
-            clean_key = re.sub(regex, "", key)
-            try:
-                self.instance.get_attribute(clean_key)
-            except AttributeError as exc:
-                raise ValidationError(
-                    f"EOX_TAGGING | The field `{key}` is wrongly configured."
-                ) from exc
-
-    def __validate_configuration_types(self):
-        """Function that validate the correct type for pairs <key, value> in configuration."""
-
-        regex = r"validate_"
-
-        for key, value in self.current_tag_definitions.items():
-
-            if re.match(regex, key) and isinstance(value, dict):
+        self.plan = validation_plans.get(self.instance.tag_type, self.instance.__class__)
+        self.current_tag_definitions = self.plan.definitions
 
-                for key_ in value:
-
-                    value_type = self.__configuration_types.get(key_)
-                    field_value = value.get(key_)
-
-                    if value_type and not isinstance(field_value, value_type):
-                        raise ValidationError(
-                            f"EOX_TAGGING | The validation '{key_}' for '{key}' is wrongly configured."
-                        )
-
-            elif not isinstance(value, six.string_types):
-                raise ValidationError(f"EOX_TAGGING | The field '{key}' is wrongly configured.")
+        for attr, value in self.plan.forced_values.items():
+            setattr(self.instance, attr, value)
 
     # GFK validations
 
     def validate_fields_integrity(self):
         """Helper function that calls for every object that needs integrity validation."""
-        fields_to_validate = ["owner_object", "target_object"]
-        map(self.__validate_model, fields_to_validate)
+        for field_name in INTEGRITY_FIELDS:
+            self.__validate_model(field_name)
 
     def __validate_model(self, field_name):
-        """Function that validates the instances in GFK fields calling the integrity validators."""
+        """
+        Function that validates the instances in GFK fields calling the integrity validators.
+
+        The result of every check is stored in the integrity cache, so an object shared by many tags
+        is only checked once.
+        """
         try:
             model_name = self.instance.get_attribute(field_name, name=True)
         except AttributeError as exc:
             raise ValidationError(
                 f"EOX_TAGGING | The field '{field_name}' is wrongly configured."
             ) from exc
+        if not model_name:
+            return
+
         try:
-            if model_name:
-                self.model_validations[model_name](field_name)
+            validator = self.model_validations[model_name]
         except KeyError as exc:
             raise ValidationError(
                 f"EOX_TAGGING | Could not find integrity validation for field '{field_name}'"
             ) from exc
 
+        cache_key = (model_name, self.instance.get_attribute(field_name).pk)
+        if cache_key in self.integrity_cache:
+            error = self.integrity_cache[cache_key]
+            if error:
+                raise ValidationError(error)
+            return
+
+        try:
+            validator(field_name)
+        except ValidationError as validation_error:
+            self.integrity_cache[cache_key] = " ".join(validation_error.messages)
+            raise
+        self.integrity_cache[cache_key] = None
+
     # Integrity validators
     def __validate_proxy_model(self, object_name):
         """
@@ -206,16 +470,19 @@ class TagValidators:
         """
         Function that validates existence of user.
 
+        Outside of a request, e.g. in a worker or a management command, there is no site to check the
+        user against, so only its existence is validated.
+
         Arguments:
             - object_name: name of the object to validate. It can be: target_object or owner_object
         """
-        request = crum.get_current_request()
-        data = {
-            "username": self.instance.get_attribute(object_name).username,  # User needs to have username
-            "site": request.site,
-        }
+        username = self.instance.get_attribute(object_name).username  # User needs to have username
+        site = getattr(crum.get_current_request(), "site", None)
         try:
-            get_edxapp_user(**data)
+            if site is None:
+                User.objects.get(username=username)
+            else:
+                get_edxapp_user(username=username, site=site)
 
         except Exception as exc:
             raise ValidationError(
@@ -289,19 +556,8 @@ class TagValidators:
 
     def validate_fields(self):
         """Function that validates all fields for the current definition."""
-
-        regex = r"^validate_"
-
-        for key, value in self.current_tag_definitions.items():
-
-            clean_key = re.sub(regex, "", key)
-            if isinstance(value, six.string_types):
-                validator_method = getattr(self, "validate_equals")
-                validator_method(clean_key, value)
-            else:
-                for _key, _value in value.items():
-                    validator_method = getattr(self, f"validate_{_key}")
-                    validator_method(clean_key, _value)
+        for field, validation, argument in self.plan.checks:
+            getattr(self, f"validate_{validation}")(field, argument)
 
     def validate_opaque_key(self, field, value):
         """
@@ -310,13 +566,12 @@ class TagValidators:
 
         Arguments:
             - field: field to validate
-            - value: validations defined for the field
+            - value: OpaqueKey class the field must be parsed with
         """
         field_value = self.instance.get_attribute(field)
         try:
-            opaque_key_to_validate = getattr(all_opaque_keys, value)
-            # Validation method for OpaqueKey: opaque_key_to_validate
-            getattr(opaque_key_to_validate, "from_string")(field_value)
+            # Validation method for OpaqueKey: value
+            value.from_string(field_value)
         except InvalidKeyError as exc:
             # We don't recognize this key
             raise ValidationError(
@@ -329,17 +584,14 @@ class TagValidators:
 
         Arguments:
             - field: field to validate
-            - value: validations defined for the field
+            - values: set of lowercased values allowed for the field
         """
         field_value = self.instance.get_attribute(field, name=True)
 
         if isinstance(field_value, datetime.datetime):
             field_value = str(field_value)
 
-        formatted_values = [item.lower() for item in values]
-        formatted_field_value = field_value.lower()
-
-        if formatted_field_value not in formatted_values:
+        if field_value.lower() not in values:
             # Values allowed is list of values (at least one)
 
             raise ValidationError(f"EOX_TAGGING | The field '{field}' is not in tag definitions.")
@@ -363,12 +615,14 @@ class TagValidators:
 
         Arguments:
             - field: field to validate
-            - value: validations defined for the field
+            - value: tuple with the value defined for the field and the same value parsed as datetime,
+            or None if it isn't a datetime
         """
+        value, datetime_value = value
         field_value = self.instance.get_attribute(field, name=True)
 
         if isinstance(field_value, datetime.datetime):
-            self.__compare_equal_dates(field_value, value)
+            self.__compare_equal_dates(field_value, value, datetime_value)
             return
 
         if not field_value:
@@ -382,42 +636,32 @@ class TagValidators:
 
         Arguments:
             - field: field to validate
-            - value: validations defined for the field
+            - value: tuple with the first and last datetimes allowed
         """
         field_value = self.instance.get_attribute(field)
-        datetime_obj = []
+        start, end = value
 
-        for datetime_str in value:
-            try:
-                datetime_obj.append(datetime.datetime.strptime(datetime_str, DATETIME_FORMAT_VALIDATION))
-            except TypeError as exc:
-                raise ValidationError(
-                    f"EOX_TAGGING | The DateTime field '{datetime_str}' \
-                        must follow the format '{DATETIME_FORMAT_VALIDATION}'."
-                ) from exc
-
-        if field_value < datetime_obj[0] or field_value > datetime_obj[-1]:
+        if field_value < start or field_value > end:
             raise ValidationError(
                 f"EOX_TAGGING | The DateTime field '{field_value}' \
-                    must be in between '{str(datetime_obj[0])}' and '{str(datetime_obj[-1])}."
+                    must be in between '{str(start)}' and '{str(end)}."
             )
 
-    def __compare_equal_dates(self, field_value, value):
+    def __compare_equal_dates(self, field_value, value, datetime_value):
         """
         Function that checks that a date must be equal to another date.
 
         Arguments:
             - field_value: datetime to validate.
-            - value: datetime strings to validate against.
+            - value: datetime string to validate against.
+            - datetime_value: value parsed as datetime.
         """
-        try:
-            datetime_str = datetime.datetime.strptime(value, DATETIME_FORMAT_VALIDATION)
-        except TypeError as exc:
+        if datetime_value is None:
             raise ValidationError(
                 f"EOX_TAGGING | The DateTime field '{value}' must follow the format '{DATETIME_FORMAT_VALIDATION}'."
-            ) from exc
+            )
 
-        if field_value != datetime_str:
+        if field_value != datetime_value:
             raise ValidationError(f"EOX_TAGGING | The DateTime field '{field_value}' must be equal to '{str(value)}'.")
 
     def validate_regex(self, field, value):
@@ -425,10 +669,10 @@ class TagValidators:
         Function that validates that the field matches value.
         Arguments:
             - field: field to validate
-            - value: validations defined for the field
+            - value: compiled pattern the field must match
         """
         field_value = self.instance.get_attribute(field, name=True)
 
-        if not re.search(value, field_value):
+        if not value.search(field_value):
             # Values allowed is regex pattern
             raise ValidationError(f"EOX_TAGGING | The field '{field}' is not in tag definitions.")